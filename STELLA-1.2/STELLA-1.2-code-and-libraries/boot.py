@@ -0,0 +1,10 @@
+# STELLA-1.2 boot: runs once at power up or reset, before code.py
+# NASA open source software license
+# Paul Mirel 2025
+
+# turn on the second usb serial channel, usb_cdc.data, for the data stream (usb_serial_out_enabled in presets.py).
+# The ESP32-S3 has few usb endpoints, MIDI is not used by the instrument so it is turned off to make room.
+import usb_cdc
+import usb_midi
+usb_midi.disable()
+usb_cdc.enable( console = True, data = True )
@@ -0,0 +1,3 @@
+# STELLA-1.2 firmware modules, imported by code.py
+# NASA open source software license
+# Paul Mirel 2025
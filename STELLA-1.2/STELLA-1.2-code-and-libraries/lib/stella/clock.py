@@ -0,0 +1,287 @@
+# STELLA-1.2 hardware clock: pcf8523 real time clock, or a stand in counting from time.monotonic_ns() without one
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+
+def initialize_hardware_clock( i2c_bus ):
+    hardware_clock = Null_Hardware_Clock()
+    try:
+        hardware_clock = pcf8523_Hardware_Clock( i2c_bus )
+        print( "hardware clock initialized" )
+    except NameError as err:
+        print( "library missing:", err )
+    except Exception:
+        pass
+    return hardware_clock
+
+class pcf8523_Hardware_Clock( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "hardware_clock", pn = "pcf8523", address = 0x68, swob = pcf8523.PCF8523( com_bus ))
+        self.null_time = time.struct_time(( 2020,   1,    1,    0,   0,   0,   0,   -1,    -1 ))
+        self.timenow = self.null_time
+        self.DAYS = { 0:"Sunday", 1:"Monday", 2:"Tuesday", 3:"Wednesday", 4:"Thursday", 5:"Friday", 6:"Saturday" }
+        self.sync_ns = None             # monotonic_ns the counted time starts from
+        self.sync_seconds = 0           # the clock's seconds at sync_ns
+        self.read_ns = None             # monotonic_ns of the last clock read
+        self.latest_seconds = None      # latest seconds handed out, the time never steps back past it
+        self.snapshot_seconds = None
+        self.datestamp = "20200101"
+        self.iso_time = "20200101T000000Z"
+        self.decimal_hour = 0.0
+    def battery_ok( self ):
+        try:
+            self.clock_battery_ok = not self.swob.battery_low
+        except:
+            self.clock_battery_ok = False
+        return self.clock_battery_ok
+    def read(self):
+        try:
+            self.timenow = self.swob.datetime
+        except:
+            self.timenow = self.null_time
+        if self.timenow.tm_wday not in range ( 0, 7 ):
+            self.timenow = self.null_time
+        # timenow now holds the clock's own reading, the next snapshot puts its interpolated time back
+        self.snapshot_seconds = None
+        return self.timenow
+    def snapshot( self ):
+        # the clock is read over i2c only every preset_clock_resync_interval_s, in between the seconds since that read
+        # are counted with monotonic_ns, which keeps whole nanoseconds however long the instrument has been running
+        # A read only says which second the clock is in, not how far into it: while the clock agrees with the counted
+        # second the count goes on from its first sync, keeping its phase; when they differ the count starts again from
+        # the reading, and holds at the latest second handed out rather than step back
+        now_ns = time.monotonic_ns()
+        if self.sync_ns is None or now_ns - self.read_ns > preset_clock_resync_interval_s * 1000000000:
+            first_read = self.sync_ns is None
+            if not first_read:
+                counted_seconds = self.sync_seconds + ( now_ns - self.sync_ns ) // 1000000000
+            self.read()
+            self.read_ns = now_ns
+            clock_seconds = time.mktime( self.timenow )
+            # a failed read keeps counting
+            if first_read or ( clock_seconds != counted_seconds and self.timenow is not self.null_time ):
+                self.sync_ns = now_ns
+                self.sync_seconds = clock_seconds
+        seconds = self.sync_seconds + ( now_ns - self.sync_ns ) // 1000000000
+        if self.latest_seconds is not None and seconds < self.latest_seconds:
+            seconds = self.latest_seconds
+        self.latest_seconds = seconds
+        if seconds != self.snapshot_seconds:
+            # the text is made once per second of clock time, however many times the time is asked for
+            self.snapshot_seconds = seconds
+            self.timenow = time.localtime( seconds )
+            self.datestamp = "{:04}{:02}{:02}".format( self.timenow.tm_year, self.timenow.tm_mon, self.timenow.tm_mday )
+            self.iso_time = "{}T{:02}{:02}{:02}Z".format( self.datestamp, self.timenow.tm_hour, self.timenow.tm_min, self.timenow.tm_sec )
+            self.decimal_hour = self.timenow.tm_hour + self.timenow.tm_min/60.0 + self.timenow.tm_sec/3600.0
+        return self.timenow
+    def resync( self ):
+        # the next snapshot reads the clock again and takes its time as it is, earlier or not
+        self.sync_ns = None
+        self.latest_seconds = None
+        self.snapshot_seconds = None
+    def get_iso_time_now( self ):
+        self.snapshot()
+        return self.iso_time
+    def get_decimal_hour_now( self ):
+        self.snapshot()
+        return self.decimal_hour
+    def get_datestamp_now( self ):
+        self.snapshot()
+        return self.datestamp
+    def get_day_now( self ):
+        return self.DAYS[self.timenow.tm_wday]
+    def sync_system_clock(self):
+        self.read()
+        try:
+            system_clock = rtc.RTC()
+            system_clock.datetime = self.swob.datetime
+            print( "system clock synchronized to hardware clock" )
+        except:
+            print( "failed to synchronize system clock to hardware clock" )
+    def header(self):
+        return "TBD"
+    def log(self):
+        return " "
+    def printlog(self):
+        print( self.log())
+    def set_time(self):
+        timenow = self.swob.datetime
+        print()
+        weekday = timenow.tm_wday
+        year = timenow.tm_year
+        month = timenow.tm_mon
+        day = timenow.tm_mday
+        hour = timenow.tm_hour
+        minute = timenow.tm_min
+        second = timenow.tm_sec
+        previous_weekday = weekday
+        previous_year = year
+        previous_month = month
+        previous_day = day
+        previous_hour = hour
+        previous_minute = minute
+        previous_second = second
+        try:
+            print( "The date is %s %d-%d-%d" % ( self.DAYS[ weekday ], year, month, day ))
+            print( "The time is %d:%02d:%02d" % ( hour, minute, second ))
+        except IndexError as err:
+            print( "The clock has not been set, and the values are out of range." )
+
+        print()
+        print( "Current year is {}. Enter a new year and press return, or press return to skip.".format(timenow.tm_year))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            input_integer = 2000
+        if input_integer in range (2010, 2100):
+            year = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+
+        print()
+        print( "Current month is {}. Enter a new month and press return, or press return to skip.".format(timenow.tm_mon))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            pass
+        if input_integer in range (1, 12):
+            month = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+        print()
+        print( "Current day is {}. Enter a new day and press return, or press return to skip.".format(timenow.tm_mday))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            pass
+        if input_integer in range (1, 32):
+            day = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+
+        print()
+        print( "Current hour is {} UTC. Enter a new hour and press return, or press return to skip.".format(timenow.tm_hour))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            pass
+        if input_integer in range (0, 23):
+            hour = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+
+        print()
+        print( "Current minute is {}. Enter a new minute and press return, or press return to skip.".format(timenow.tm_min))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            pass
+        if input_integer in range (0, 59):
+            minute = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+
+        print()
+        print( "Current second is {}. Enter a new second and press return, or press return to skip.".format(timenow.tm_sec))
+        print(">", end = ' ')
+        input_string = False
+        while input_string == False:
+            input_string = input().strip()
+        try:
+            input_integer = int( input_string )
+        except ValueError:
+            pass
+        if input_integer in range (0, 59):
+            second = input_integer
+            t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+            self.swob.datetime = t
+
+        print()
+        print( "Current weekday is {}. Enter a new weekday and press return, or press return to skip.".format(self.DAYS[timenow.tm_wday]))
+        print( "Enter: sun, mon, tue, wed, thu, fri, sat" )
+        print(">", end = ' ')
+        input_string = False
+
+        input_string = input().strip()
+        print(input_string)
+        if input_string == "mon":
+            weekday = 1
+        elif input_string == "tue":
+            weekday = 2
+        elif input_string == "wed":
+            weekday = 3
+        elif input_string == "thu":
+            weekday = 4
+        elif input_string == "fri":
+            weekday = 5
+        elif input_string == "sat":
+            weekday = 6
+        elif input_string == "sun":
+            weekday = 0
+        else:
+            pass
+        print("weekday = {}".format(weekday))
+        t = time.struct_time(( year,  month,   day,   hour,  minute,  second,   weekday,   -1,    -1 ))
+        self.swob.datetime = t
+        self.resync()
+        print( "returning to status page" )
+
+class Null_Hardware_Clock():
+    def __init__( self ):
+        self.swob = None
+        self.null_time = time.struct_time(( 2020,   1,    1,    0,   0,   0,   0,   -1,    -1 ))
+        self.timenow = self.null_time
+        self.datestamp = "20200101"
+        self.iso_time = "20200101T000000Z"
+        self.decimal_hour = 0.0
+    def read(self):
+        pass
+    def snapshot( self ):
+        # no clock: the date stays at the null time, the decimal hour counts up from power on
+        self.decimal_hour = time.monotonic()/ 3600
+        return self.timenow
+    def resync( self ):
+        pass
+    def get_iso_time_now( self ):
+        return self.iso_time
+    def get_decimal_hour_now( self ):
+        self.snapshot()
+        return self.decimal_hour
+    def get_datestamp_now( self ):
+        return self.datestamp
+    def battery_ok( self ):
+        pass
+    def get_day_now( self ):
+        pass
+    def get_time_now_iso_dec( self ):
+        self.read()
+        iso8601_utc_timestamp = "{:04}{:02}{:02}T{:02}{:02}{:02}Z".format(
+            self.timenow.tm_year, self.timenow.tm_mon, self.timenow.tm_mday,
+            self.timenow.tm_hour, self.timenow.tm_min, self.timenow.tm_sec )
+        decimal_hour = time.monotonic()/ 3600
+        return iso8601_utc_timestamp, decimal_hour
+    def sync_system_clock(self):
+        pass
+    def set_time(self):
+        pass
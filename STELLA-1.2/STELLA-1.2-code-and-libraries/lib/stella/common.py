@@ -0,0 +1,116 @@
+# STELLA-1.2 shared module: libraries, presets, indicator colors and the Device parent class, star imported by the other stella modules
+# NASA open source software license
+# Paul Mirel 2025
+
+import gc
+start_mem_free_kB = gc.mem_free()/1000   # memory_check reports against this, code.py prints the free memory before any import
+from presets import *
+# core functionality libraries
+import time
+import os
+try:
+    import asyncio  # the asyncio folder of the CircuitPython library bundle, it runs on adafruit_ticks
+except ImportError:
+    raise ImportError( "asyncio missing: copy the asyncio folder from the CircuitPython library bundle for this CircuitPython version into lib/" )
+import microcontroller
+import board
+import digitalio
+import storage
+import sdcardio
+import busio
+import rotaryio
+import keypad
+from fourwire import FourWire
+import displayio
+import terminalio
+from adafruit_display_text import label
+import vectorio
+import rtc
+import neopixel
+from analogio import AnalogIn
+# function support libraries
+import math
+import struct
+import array
+import json
+import binascii
+try:
+    from ulab import numpy as ulab_numpy # vector math for the reference spectra, the list math below does without it
+except ImportError:
+    ulab_numpy = None
+# main unit devices libraries
+import adafruit_ili9341
+import adafruit_focaltouch
+import adafruit_max1704x
+from adafruit_pcf8523 import pcf8523
+import adafruit_gps
+gc.collect()
+imports_end_time = time.monotonic_ns()
+mem_free_after_imports = gc.mem_free()
+
+## onboard neopixel colors
+BLUE = ( 0, 0, 255 )
+GREEN = ( 255, 0, 0 )
+YELLOW = ( 127, 255, 0 )
+RED = ( 0, 255, 0 )
+WHITE = ( 255, 255, 255 )
+OFF = ( 0, 0, 0 )
+
+class Device: #parent class
+    def __init__(self, name = None, pn = None, address = None, swob = None ):
+        self.name = name
+        self.swob = swob
+        self.pn = pn
+        self.address = address
+        self.cadence_s = None       # native update period, None means read with every sample
+        self.streams = False        # sends on its own at its cadence, read it that often so its input buffer doesn't fill
+        self.last_read_time = None
+    def startup(self):
+        # called once the device is found, devices with a power on routine override this
+        pass
+    def start_conversion(self):
+        # devices that convert in the background override this to start one and return True
+        return False
+    def conversion_ready(self):
+        return True
+    def data_ready(self):
+        # devices with a data ready flag override this, so a read that would only return the old value is skipped
+        return True
+    def refresh(self):
+        self.read()
+        self.last_read_time = time.monotonic()
+    def age_s(self):
+        if self.last_read_time is None:
+            return None
+        return round( time.monotonic() - self.last_read_time, 2 )
+    def report(self):
+        found = False
+        if self.swob is not None:
+            print("report:", hex(self.address), self.pn, "\t", self.name, "found" )
+            found = True
+        return found
+    def found(self):
+        if self.swob is not None:
+            return True
+        else:
+            return False
+
+def get_uid():
+    try:
+        UID = int.from_bytes(microcontroller.cpu.uid, "big") % 100000
+        print("unique identifier (UID) : {0}".format( UID ))
+    except:
+        UID = False
+        print("unique identifier (UID) not available")
+    return UID
+
+def memory_check( message ):
+    gc.collect()
+    mem_free_kB = gc.mem_free()/1000
+    print( "{} memory free: {} kB, {} %".format( message, int(mem_free_kB), int((100* (mem_free_kB)/start_mem_free_kB ))))
+
+def stall():
+    print("intentionally stalled, press return to continue")
+    input_string = False
+    while input_string == False:
+        input_string = input().strip()
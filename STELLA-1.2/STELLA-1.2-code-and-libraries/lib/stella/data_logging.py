@@ -0,0 +1,440 @@
+# STELLA-1.2 data logging: data file names and index, csv and binary loggers, SD card space
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+
+def update_batch( datestamp ):
+    try:
+        with open( "/sd/batch.txt", "r" ) as b:
+            try:
+                previous_batchfile_string = b.readline()
+                previous_datestamp = previous_batchfile_string[ 0:8 ]
+                previous_batch_number = int( previous_batchfile_string[ 8: ])
+            except ValueError:
+                previous_batch_number = 0
+            if datestamp == previous_datestamp:
+                # this is the same day, so increment the batch number
+                batch_number = previous_batch_number + 1
+            else:
+                # this is a different day, so start the batch number at 0
+                batch_number = 0
+    except OSError:
+            print( "batch.txt file not found" )
+            batch_number = 0
+    batch_string = ( "{:03}".format( batch_number ))
+    batch_file_string = datestamp + batch_string
+    try:
+        with open( "/sd/batch.txt", "w" ) as b:
+            b.write( batch_file_string )
+            b.write("\n")
+    except OSError as err:
+        print("Error: writing batch.txt {:}".format(err) )
+    return batch_number
+
+def update_filename( instrument ):
+    # device_type, hardware_clock, new_header, batch_number
+    timenow = instrument.hardware_clock.read()
+    if timenow is not None:
+        current_datestamp = "{:04}{:02}{:02}".format( timenow.tm_year, timenow.tm_mon, timenow.tm_mday)
+        filename_to_use = instrument.data_file_manager.choose_file( current_datestamp )
+    else:
+        filename_to_use = "{}_data_no_timestamp.{}".format(DEVICE_TYPE, instrument.file_extension)
+        # not in the data file index; the file logged before it is finished, so its rows aren't counted against it
+        instrument.data_file_manager.finish_file()
+        instrument.data_file_manager.save()
+        try:
+            with open( "/sd/{}".format(filename_to_use), "wb" if instrument.log_binary else "w" ) as fn:
+                fn.write( instrument.file_header )
+        except OSError as err:
+            print( err )
+
+    instrument.filename = filename_to_use
+
+def header_hash( file_header ):
+    if isinstance( file_header, str ):
+        file_header = file_header.encode()
+    return "{:08x}".format( binascii.crc32( file_header ))
+
+def iso_time_to_epoch( iso_time ):
+    # "20250621T160000Z" to seconds, on the same clock as time.time()
+    return time.mktime(( int( iso_time[0:4] ), int( iso_time[4:6] ), int( iso_time[6:8] ),
+                         int( iso_time[9:11] ), int( iso_time[11:13] ), int( iso_time[13:15] ), 0, -1, -1 ))
+
+def create_data_file_manager( instrument, vfs ):
+    data_file_manager = Data_File_Manager( instrument, vfs )
+    instrument.data_file_manager = data_file_manager
+    return data_file_manager
+
+class Data_File_Manager:
+    # picks the data file to append to and keeps the data file index: /sd/data_index.csv gets a line when a data file is
+    # finished, with its first and last timestamp, row count, size and a hash of the header. The file being logged has
+    # its line in /sd/data_index_current.csv, a fixed size record rewritten in place every preset_file_index_interval_s,
+    # so after a power loss it can be that far behind the data file. At power up that one record, not the index or the
+    # previous data file, says whether the file can be continued. A file is finished and the next part started past
+    # preset_file_max_bytes or preset_file_max_hours.
+    index_filename = "/sd/data_index.csv"
+    current_filename = "/sd/data_index_current.csv"
+    index_header = "filename, first_timestamp-!-iso8601utc, last_timestamp-!-iso8601utc, rows, bytes, header_hash\n"
+    current_record_bytes = 128
+    def __init__( self, instrument, vfs ):
+        self.instrument = instrument
+        self.vfs = vfs
+        self.current = None     # [ filename, first_timestamp, last_timestamp, rows, bytes, header_hash ]
+        self.first_time = None  # time.time() at the current file's first row
+        self.start_new_file = False
+        self.index_changed = False
+        self.last_save_time = time.monotonic()
+        self.load()
+    def load( self ):
+        if not self.vfs:
+            return
+        try:
+            with open( self.current_filename, "r" ) as current_file:
+                fields = current_file.read( self.current_record_bytes ).strip().split( ", " )
+            if len( fields ) == 6:
+                fields[3] = int( fields[3] )
+                fields[4] = int( fields[4] )
+                self.current = fields
+                print( "data file index: last file {}".format( self.current[0] ))
+                return
+        except OSError:
+            pass
+        except ValueError as err:
+            print( "data file index record unreadable: {}".format( err ))
+        print( "data file index: no file to continue" )
+    def index_line( self, entry ):
+        return "{}, {}, {}, {}, {}, {}\n".format( *entry )
+    def save( self ):
+        # the current file's record, the same size each time so it is rewritten in place
+        if not self.vfs:
+            return
+        record = ""
+        if self.current is not None:
+            record = self.index_line( self.current )
+        record = record + " " * ( self.current_record_bytes - len( record ))
+        try:
+            try:
+                current_file = open( self.current_filename, "r+" )
+            except OSError:
+                current_file = open( self.current_filename, "w" )
+            with current_file:
+                current_file.write( record )
+        except OSError as err:
+            print( "data file index not saved: {}".format( err ))
+        self.index_changed = False
+        self.last_save_time = time.monotonic()
+    def finish_file( self ):
+        # the current file is done: its line goes on the end of the index
+        if self.current is None:
+            return
+        if self.vfs:
+            try:
+                try:
+                    os.stat( self.index_filename )
+                    line = self.index_line( self.current )
+                except OSError:
+                    line = self.index_header + self.index_line( self.current )
+                with open( self.index_filename, "a" ) as index_file:
+                    index_file.write( line )
+            except OSError as err:
+                print( "data file index not saved: {}".format( err ))
+        self.current = None
+    def file_full( self, entry, first_time ):
+        if preset_file_max_bytes and entry[4] >= preset_file_max_bytes:
+            return True
+        if preset_file_max_hours and first_time is not None and time.time() - first_time >= preset_file_max_hours * 3600:
+            return True
+        return False
+    def can_continue( self, entry, datestamp, file_header_hash ):
+        # the last file, started today with the same header and not yet full
+        if self.start_new_file or entry[5] != file_header_hash:
+            return False
+        if entry[0].split( "_" )[-1].split( "-" )[0] != datestamp:
+            return False
+        try:
+            entry[4] = os.stat( "/sd/{}".format( entry[0] ))[6]
+        except OSError:
+            return False
+        first_time = None
+        if entry[1] != "-":
+            first_time = iso_time_to_epoch( entry[1] )
+        if self.file_full( entry, first_time ):
+            return False
+        self.first_time = first_time
+        return True
+    def new_filename( self, datestamp ):
+        # later parts of the same day and batch get -1, -2 ... after the batch number
+        instrument = self.instrument
+        base = "{}_data_{}-{}".format( instrument.device_type, datestamp, instrument.batch_number )
+        filename = "{}.{}".format( base, instrument.file_extension )
+        part = 0
+        while self.file_exists( filename ):
+            part += 1
+            filename = "{}-{}.{}".format( base, part, instrument.file_extension )
+        return filename
+    def file_exists( self, filename ):
+        if not self.vfs:
+            return False
+        try:
+            os.stat( "/sd/{}".format( filename ))
+            return True
+        except OSError:
+            return False
+    def choose_file( self, datestamp ):
+        instrument = self.instrument
+        file_header_hash = header_hash( instrument.file_header )
+        if self.current is not None and self.can_continue( self.current, datestamp, file_header_hash ):
+            return self.current[0]
+        self.finish_file()
+        self.start_new_file = False
+        filename = self.new_filename( datestamp )
+        if self.vfs:
+            try:
+                with open( "/sd/{}".format( filename ), "wb" if instrument.log_binary else "w" ) as fn:
+                    fn.write( instrument.file_header )
+            except OSError as err:
+                print( err )
+        self.current = [ filename, "-", "-", 0, len( instrument.file_header ), file_header_hash ]
+        self.first_time = None
+        self.save()
+        return filename
+    def rows_written( self, rows, byte_count, iso_time ):
+        entry = self.current
+        if entry is None:
+            return
+        if entry[1] == "-":
+            entry[1] = iso_time
+            self.first_time = time.time()
+        entry[2] = iso_time
+        entry[3] += rows
+        entry[4] += byte_count
+        self.index_changed = True
+    def rotation_due( self ):
+        return self.current is not None and self.current[3] > 0 and self.file_full( self.current, self.first_time )
+    def rotate( self ):
+        # called by the sample task between samples, once every queued record is written
+        self.start_new_file = True
+        self.instrument.last_binary_session_tag = None  # the new file needs its own session block
+        self.instrument.update_filename()
+    def check_save( self ):
+        # called by the housekeeping task, rewrites the current file's record
+        if self.index_changed and time.monotonic() > self.last_save_time + preset_file_index_interval_s:
+            self.save()
+
+def initialize_data_logger( instrument, vfs ):
+    data_logger = Null_Data_Logger()
+    if vfs:
+        try:
+            data_logger = Data_Logger( instrument )
+            print( "data logger initialized, flush every {} bytes or {} s".format( data_logger.flush_bytes, data_logger.flush_interval_s ))
+        except Exception as err:
+            print( "data logger failed: {}".format( err ))
+    instrument.data_logger = data_logger
+    return data_logger
+
+class Data_Logger:
+    # keeps the data file open and collects rows in a preallocated buffer,
+    # the card only sees whole 512 byte sectors until a sync is due
+    def __init__( self, instrument ):
+        self.instrument = instrument
+        self.sector_bytes = 512
+        self.flush_bytes = max( self.sector_bytes, ( preset_log_flush_bytes // self.sector_bytes ) * self.sector_bytes )
+        self.flush_interval_s = preset_log_flush_interval_s
+        self.low_battery_percent = preset_log_low_battery_percent
+        self.buffer = bytearray( self.flush_bytes + self.sector_bytes )
+        self.buffer_view = memoryview( self.buffer )
+        self.fill = 0
+        self.bytes_logged = 0
+        self.file = None
+        self.filename = None
+        self.last_sync_time = time.monotonic()
+        self.last_record = instrument.record
+        self.last_page_number = instrument.active_page_number
+    def open( self ):
+        self.filename = self.instrument.filename
+        self.file = open( "/sd/{}".format( self.filename ), "ab" )
+    def write( self, text ):
+        self.write_bytes( text.encode() )
+    def write_bytes( self, data ):
+        if self.filename != self.instrument.filename:
+            # new day or new configuration: finish the old file before appending to the new one
+            self.close()
+        if self.file is None:
+            self.open()
+        self.bytes_logged += len( data )
+        start = 0
+        while start < len( data ):
+            count = min( len( data ) - start, len( self.buffer ) - self.fill )
+            self.buffer_view[ self.fill:self.fill + count ] = data[ start:start + count ]
+            self.fill += count
+            start += count
+            if self.fill == len( self.buffer ):
+                self.write_sectors()
+    def write_sectors( self ):
+        # hand whole sectors to the file system, keep the partial tail in the buffer
+        whole_bytes = ( self.fill // self.sector_bytes ) * self.sector_bytes
+        if whole_bytes:
+            self.file.write( self.buffer_view[ 0:whole_bytes ] )
+            remainder = self.fill - whole_bytes
+            self.buffer_view[ 0:remainder ] = self.buffer_view[ whole_bytes:self.fill ]
+            self.fill = remainder
+    def sync( self ):
+        if self.file is not None:
+            if self.fill:
+                self.file.write( self.buffer_view[ 0:self.fill ] )
+                self.fill = 0
+            self.file.flush()
+            try:
+                os.sync()
+            except AttributeError:
+                pass
+        self.last_sync_time = time.monotonic()
+    def check_flush( self, battery_monitor ):
+        # called by the housekeeping task and after each sample is written
+        instrument = self.instrument
+        if self.last_record and not instrument.record:
+            self.sync()     # paused
+        self.last_record = instrument.record
+        if instrument.active_page_number != self.last_page_number:
+            self.last_page_number = instrument.active_page_number
+            self.sync()     # page change, the user may be about to pull the card
+        if self.fill >= self.flush_bytes:
+            self.write_sectors()
+        if self.fill and time.monotonic() > self.last_sync_time + self.flush_interval_s:
+            self.sync()
+        if self.fill and battery_monitor.pn and battery_monitor.percentage < self.low_battery_percent:
+            self.sync()     # low battery, keep every row on the card
+    def close( self ):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+class Null_Data_Logger:
+    def __init__( self ):
+        self.bytes_logged = 0
+    def write( self, text ):
+        pass
+    def write_bytes( self, data ):
+        pass
+    def sync( self ):
+        pass
+    def check_flush( self, battery_monitor ):
+        pass
+    def close( self ):
+        pass
+
+def read_sdcard_space():
+    # free and total bytes on the card
+    sdcard_status = os.statvfs( "/sd" )
+    fragment_size = sdcard_status[1]
+    return sdcard_status[4] * fragment_size, sdcard_status[2] * fragment_size
+
+def create_storage_manager( instrument, vfs ):
+    storage_manager = Storage_Manager( instrument, vfs )
+    instrument.storage_manager = storage_manager
+    return storage_manager
+
+class Storage_Manager:
+    # projects the hours of logging left on the card from the bytes the data logger actually wrote per sample, one a sample interval,
+    # at the current interval, burst count and sensor set. The card's free space is read every preset_storage_check_interval_s,
+    # between reads the bytes logged since are subtracted. Below the thresholds the next sample moves to a denser layout.
+    def __init__( self, instrument, vfs ):
+        self.instrument = instrument
+        self.vfs = vfs
+        self.free_bytes = None
+        self.total_bytes = None
+        self.free_percent = None
+        self.bytes_at_check = 0
+        self.last_check_time = None
+        self.measure_start_bytes = 0
+        self.samples = 0
+        self.measured_setting = None
+        self.bytes_per_hour = None
+        self.hours_remaining = None
+        self.pending_layout = None
+        self.sequence = 0   # counts updates, the status page redraws when it moves
+        self.restart_measurement()
+    def layout_name( self ):
+        if self.instrument.log_binary:
+            return "binary"
+        if self.instrument.burst_summary_only and preset_burst_statistics and self.instrument.burst_count > 1:
+            return "summary"
+        return "csv"
+    def restart_measurement( self ):
+        self.measure_start_bytes = self.instrument.data_logger.bytes_logged
+        self.samples = 0
+        self.measured_setting = ( self.instrument.sample_interval_s, self.instrument.burst_count, self.layout_name() )
+        self.bytes_per_hour = None
+        self.hours_remaining = None
+    def sample_logged( self ):
+        # called after every sample, on the recording interval or from the burst button, so the bytes of each are counted once
+        if self.measured_setting != ( self.instrument.sample_interval_s, self.instrument.burst_count, self.layout_name() ):
+            self.restart_measurement()
+            return
+        self.samples += 1
+    def check_free_space( self ):
+        try:
+            self.free_bytes, self.total_bytes = read_sdcard_space()
+            self.free_percent = 100 * self.free_bytes / self.total_bytes
+        except Exception as err:
+            print( "sd card space check failed: {}".format( err ))
+            self.vfs = False
+        self.bytes_at_check = self.instrument.data_logger.bytes_logged
+        self.last_check_time = time.monotonic()
+    def update( self ):
+        # called by the housekeeping task
+        if not self.vfs:
+            return
+        if self.last_check_time is None or time.monotonic() > self.last_check_time + preset_storage_check_interval_s:
+            self.check_free_space()
+            if not self.vfs:
+                return
+        self.sequence += 1
+        free_bytes = self.free_bytes - ( self.instrument.data_logger.bytes_logged - self.bytes_at_check )
+        if self.samples:
+            bytes_per_sample = ( self.instrument.data_logger.bytes_logged - self.measure_start_bytes ) / self.samples
+            self.bytes_per_hour = bytes_per_sample * 3600 / self.instrument.sample_interval_s
+            self.hours_remaining = max( 0, free_bytes ) / self.bytes_per_hour if self.bytes_per_hour else None
+        if self.hours_remaining is None or self.pending_layout:
+            return
+        layout = self.layout_name()
+        if ( layout == "csv" and self.hours_remaining < preset_storage_summary_only_below_h
+             and preset_burst_statistics and self.instrument.burst_count > 1 ):
+            self.pending_layout = "summary"
+        elif layout != "binary" and self.hours_remaining < preset_storage_binary_below_h:
+            self.pending_layout = "binary"
+        if self.pending_layout:
+            print( "sd card: {:.1f} h left at {:.0f} bytes per hour, switching to {} logging".format(
+                    self.hours_remaining, self.bytes_per_hour, self.pending_layout ))
+    def apply_pending_layout( self ):
+        # called by the sample task between samples, once every queued record is written
+        instrument = self.instrument
+        if self.pending_layout == "summary":
+            instrument.burst_summary_only = True
+        elif self.pending_layout == "binary":
+            instrument.log_binary = True
+            instrument.make_header()    # new header, new .bin data file
+        self.pending_layout = None
+        self.restart_measurement()
+    def status_text( self ):
+        # three lines for the status page
+        if not self.vfs:
+            return "sd card: none", "", ""
+        if self.free_bytes is None:
+            return "sd card: checking", "", ""
+        card_text = "sd: {:.0f} MB free, {:.0f}%".format( self.free_bytes / 1000000, self.free_percent )
+        if self.hours_remaining is None:
+            rate_text = "rate: measuring"
+            remaining_text = "log: {}".format( self.layout_name())
+        else:
+            if self.bytes_per_hour < 1000000:
+                rate_text = "rate: {:.1f} kB/h".format( self.bytes_per_hour / 1000 )
+            else:
+                rate_text = "rate: {:.1f} MB/h".format( self.bytes_per_hour / 1000000 )
+            if self.hours_remaining < 48:
+                remaining_text = "{}: {:.1f} h left".format( self.layout_name(), self.hours_remaining )
+            else:
+                remaining_text = "{}: {:.0f} days left".format( self.layout_name(), self.hours_remaining / 24 )
+        return card_text, rate_text, remaining_text
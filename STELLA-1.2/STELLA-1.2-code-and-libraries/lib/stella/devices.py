@@ -0,0 +1,1919 @@
+# STELLA-1.2 devices: the sensor registry and sensor classes, display, touch screen, encoder, indicators, buses and SD card
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+
+## supported i2c sensors
+# One row per sensor: name, address, driver imports, device class, null class, spectral, priority.
+# A driver import is ( module, attribute or None, the name the device class uses ), the same as
+# "from module import attribute as name" or "import module as name" (with a dotted module, "from package import module as name"). A sensor's drivers are imported only when its
+# address answers the bus scan. Sensors are built in priority order, which is also the order of their data columns.
+SENSOR_REGISTRY = (
+    ( "ads1015_12_bit_adc", 0x48, (( "adafruit_ads1x15.ads1015", None, "ADS1015" ), ( "adafruit_ads1x15.analog_in", "AnalogIn", "ADS1x15_AnalogIn" )),
+        "ads1015_12_Bit_ADC", "Null_ads1015_12_Bit_ADC", False, 10 ),
+    ( "ads1115_16_bit_adc", 0x4a, (( "adafruit_ads1x15.ads1115", None, "ADS1115" ), ( "adafruit_ads1x15.analog_in", "AnalogIn", "ADS1x15_AnalogIn" )), ### connect ADDR to SDA to set address
+        "ads1115_16_Bit_ADC", "Null_ads1115_16_Bit_ADC", False, 20 ),
+    ( "as7265x_spectrometer", 0x49, (( "AS7265X_sparkfun", None, "AS7265X_sparkfun" ), ( "AS7265X_sparkfun", "AS7265X", "AS7265X" )),
+        "as7265x_Spectrometer", "Null_as7265x_Spectrometer", True, 30 ),
+    ( "as7331_spectrometer", 0x74, (( "iorodeo_as7331", None, "as7331" ), ),
+        "as7331_Spectrometer", "Null_as7331_Spectrometer", True, 40 ),
+    ( "as7341_spectrometer", 0x39, (( "adafruit_as7341", "AS7341", "AS7341" ), ( "adafruit_as7341", "Gain", "AS7341_Gain" )),
+        "as7341_Spectrometer", "Null_as7341_Spectrometer", True, 50 ),
+    ( "bme280_air_sensor", 0x77, (( "adafruit_bme280.basic", None, "adafruit_bme280" ), ),
+        "bme280_Air_Sensor", "Null_bme280_Air_Sensor", False, 60 ),
+    ( "capacitive_soil_moisture_sensor", 0x37, (( "adafruit_seesaw.seesaw", "Seesaw", "Seesaw" ), ),
+        "Capacitive_Soil_Moisture_Sensor", "Null_Capacitive_Soil_Moisture_Sensor", False, 70 ),
+    ( "ds2484_1_wire_thermometer", 0x18, (( "adafruit_ds248x", "Adafruit_DS248x", "Adafruit_DS248x" ), ),
+        "ds2484_1_Wire_Thermometer_Reader", "Null_ds2484_1_Wire_Thermometer_Reader", False, 80 ),
+    ( "hdc3022_air_sensor", 0x44, (( "adafruit_hdc302x", None, "adafruit_hdc302x" ), ),
+        "hdc3022_Air_Sensor", "Null_hdc3022_Air_Sensor", False, 90 ),
+    ( "lis2mdl_magnetic_field_sensor", 0x1e, (( "adafruit_lis2mdl", None, "adafruit_lis2mdl" ), ),
+        "lis2mdl_Magnetic_Field_Sensor", "Null_lis2mdl_Magnetic_Field_Sensor", False, 100 ),
+    ( "lis3mdl_magnetic_field_sensor", 0x6a, (( "adafruit_lis3mdl", "LIS3MDL", "LIS3MDL" ), ),
+        "lis3mdl_Magnetic_Field_Sensor", "Null_lis3mdl_Magnetic_Field_Sensor", False, 110 ),
+    ( "lsm303_acceleration_sensor", 0x19, (( "adafruit_lsm303_accel", None, "adafruit_lsm303_accel" ), ),
+        "lsm303_Acceleration_Sensor", "Null_lsm303_Acceleration_Sensor", False, 120 ),
+    ( "lsm6ds_accel_gyro_sensor", 0x1c, (( "adafruit_lsm6ds.lsm6ds3", "LSM6DS3", "LSM6DS" ), ),
+        "lsm6ds_Accel_Gyro_Sensor", "Null_lsm6ds_Accel_Gyro_Sensor", False, 130 ),
+    ( "ltr390_uva_sensor", 0x53, (( "adafruit_ltr390", None, "adafruit_ltr390" ), ),
+        "ltr390_UVA_Sensor", "Null_ltr390_UVA_Sensor", False, 140 ),
+    ( "mcp9808_air_thermometer", 0x1f, (( "adafruit_mcp9808", None, "adafruit_mcp9808" ), ), ### close a0, a1, a2 address jumpers on board
+        "mcp9808_Air_Thermometer", "Null_mcp9808_Air_Thermometer", False, 150 ),
+    ( "mlx90614_surface_thermometer", 0x5a, (( "adafruit_mlx90614", None, "adafruit_mlx90614" ), ),
+        "mlx90614_Surface_Thermometer", "Null_mlx90614_Surface_Thermometer", False, 160 ),
+    ( "mlx90640_thermal_camera", 0x33, (( "adafruit_mlx90640", None, "adafruit_mlx90640" ), ),
+        "mlx90640_Thermal_Camera", "Null_mlx90640_Thermal_Camera", False, 170 ),
+    ( "pcf8591_8_bit_adc_dac", 0x4f, (( "adafruit_pcf8591.pcf8591", None, "PCF8591" ), ( "adafruit_pcf8591.analog_in", "AnalogIn", "PCF8591_AnalogIn" ), ### close a0, a1, a2 address jumpers on board
+                                      ( "adafruit_pcf8591.analog_out", "AnalogOut", "PCF8591_AnalogOut" )),
+        "pcf8591_8_Bit_ADC_DAC", "Null_pcf8591_8_Bit_ADC_DAC", False, 180 ),
+    ( "pmsa0031_particulates_sensor", 0x12, (( "adafruit_pm25.i2c", "PM25_I2C", "PM25_I2C" ), ),
+        "pmsa0031_Particulates_Sensor", "Null_pmsa0031_Particulates_Sensor", False, 190 ),
+    ( "scd30_CO2_sensor", 0x61, (( "adafruit_scd30", None, "adafruit_scd30" ), ),
+        "scd30_CO2_Sensor", "Null_scd30_CO2_Sensor", False, 200 ),
+    ( "scd4x_co2_sensor", 0x62, (( "adafruit_scd4x", None, "adafruit_scd4x" ), ),
+        "scd4x_CO2_Sensor", "Null_scd4x_CO2_Sensor", False, 210 ),
+    ( "vl53l1x_4m_range_sensor", 0x29, (( "adafruit_vl53l1x", None, "adafruit_vl53l1x" ), ),
+        "vl53l1x_4m_Range_Sensor", "Null_vl53l1x_4m_Range_Sensor", False, 220 ),
+    )
+# 0x28 SparkFun conductive soil moisture sensor: TBD need library
+# 0x34 qwiic buzzer, 0x36 battery monitor (MAX17048), 0x38 touch screen (FocalTouch), 0x68 hardware clock: main unit devices
+# the mlx90614 doesn't answer the scan, so it is probed whether or not its address answers
+UNSCANNED_SENSOR_ADDRESSES = { 0x5a }
+
+class ads1015_12_Bit_ADC( Device ):
+    #https://learn.adafruit.com/adafruit-4-channel-adc-breakouts/python-circuitpython
+    def __init__( self, com_bus ):
+        super().__init__(name = "ads1015_12_bit_adc", pn = "ads1015", address = 0x48, swob = ADS1015.ADS1015( com_bus ))
+        self.channel_0 = ADS1x15_AnalogIn(self.swob, ADS1015.P0)
+        self.channel_1 = ADS1x15_AnalogIn(self.swob, ADS1015.P1)
+        self.channel_2 = ADS1x15_AnalogIn(self.swob, ADS1015.P2)
+        self.channel_3 = ADS1x15_AnalogIn(self.swob, ADS1015.P3)
+        # set up a differential channel like this self.channel_0-1 = ADS1x15_AnalogIn(swob, ADS1015.P0, ADS1015.P1)
+        # self.swob.instrument_mode = self.Mode.SINGLE # this is the default instrument_mode. I don't know where to find Mode. Waits for completed conversion to read the value TBD implement this.
+        # Mode.CONTINUOUS # read the latest value that's been converted. TBD look into this and explain
+        self.swob.gain = 1
+        # gain:
+        # setting, full scale voltage
+        # 2/3 (how do we enter a fraction?), +/- 6.144V
+        # 1, +/- 4.096V
+        # 2, +/- 2.048V
+        # 4, +/- 1.024V
+        # 8, +/- 0.512V
+        # 16, +/- 0.256V
+    def found(self):
+        print("found", self.pn, self.swob)
+    def read(self):
+        # reports 16 bit values even though the conversion is only 12 bits. Least significant four bits (LSBs) should all be 0
+        self.raw = (self.channel_0.value, self.channel_1.value, self.channel_2.value, self.channel_3.value)
+        #print( self.raw )
+        self.voltage = (self.channel_0.voltage, self.channel_1.voltage, self.channel_2.voltage, self.channel_3.voltage)
+        #print( self.voltage )
+    def header(self):
+        headers = "ads1015_channel_0_voltage-!-V, ads1015_channel_1_voltage-!-V, ads1015_channel_2_voltage-!-V, ads1015_channel_3_voltage-!-V"
+        headers += ", ads1015_channel_0_digital_number-!-counts, ads1015_channel_1_digital_number-!-counts, ads1015_channel_2_digital_number-!-counts, ads1015_channel_3_digital_number-!-counts"
+        headers += ", ads1015_gain-!-"
+        return headers
+    def log(self):
+        log_values = "{}, {}, {}, {}".format( *self.voltage )
+        log_values += ", {}, {}, {}, {}".format( *self.raw)
+        log_values += ", {}".format(self.swob.gain)
+        return log_values
+
+    def printlog(self):
+        print( self.log())
+
+class Null_ads1015_12_Bit_ADC(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class ads1115_16_Bit_ADC( Device ):
+    # to prevent address collision, connect SDA to ADDR to set the address to 0x4a
+    # https://learn.adafruit.com/adafruit-4-channel-adc-breakouts/python-circuitpython
+    def __init__( self, com_bus ):
+        super().__init__(name = "ads1115_16_bit_adc", pn = "ads1115", address = 0x4a, swob = ADS1115.ADS1115( com_bus, address = 0x4a ))
+        self.channel_0 = ADS1x15_AnalogIn(self.swob, ADS1115.P0)
+        self.channel_1 = ADS1x15_AnalogIn(self.swob, ADS1115.P1)
+        self.channel_2 = ADS1x15_AnalogIn(self.swob, ADS1115.P2)
+        self.channel_3 = ADS1x15_AnalogIn(self.swob, ADS1115.P3)
+        # set up a differential channel like this self.channel_0-1 = ADS1x15_AnalogIn(swob, ADS1115.P0, ADS1115.P1)
+        # self.swob.instrument_mode = self.Mode.SINGLE # this is the default instrument_mode. I don't know where to find Mode. Waits for completed conversion to read the value TBD implement this.
+        # Mode.CONTINUOUS # read the latest value that's been converted. TBD look into this and explain
+        self.swob.gain = 1
+        # gain:
+        # setting, full scale voltage
+        # 2/3 (how do we enter a fraction?), +/- 6.144V
+        # 1, +/- 4.096V
+        # 2, +/- 2.048V
+        # 4, +/- 1.024V
+        # 8, +/- 0.512V
+        # 16, +/- 0.256V
+    def found(self):
+        print("found", self.pn, self.swob)
+    def read(self):
+        self.raw = (self.channel_0.value, self.channel_1.value, self.channel_2.value, self.channel_3.value)
+        #print( self.raw )
+        self.voltage = (self.channel_0.voltage, self.channel_1.voltage, self.channel_2.voltage, self.channel_3.voltage)
+        #print( self.voltage )
+    def header(self):
+        headers = "ads1115_channel_0_voltage-!-V, ads1115_channel_1_voltage-!-V, ads1115_channel_2_voltage-!-V, ads1115_channel_3_voltage-!-V"
+        headers += ", ads1115_channel_0_digital_number-!-counts, ads1115_channel_1_digital_number-!-counts, ads1115_channel_2_digital_number-!-counts, ads1115_channel_3_digital_number-!-counts"
+        headers += ", ads1115_gain-!-"
+        return headers
+    def log(self):
+        log_values = "{}, {}, {}, {}".format( *self.voltage)
+        log_values += ", {}, {}, {}, {}".format( *self.raw)
+        log_values += ", {}".format(self.swob.gain)
+        return log_values
+    def printlog(self):
+        print( self.log())
+
+class Null_ads1115_16_Bit_ADC(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+# spectral sensors keep their latest reading in arrays with one slot per band, in the order of self.bands, filled in
+# place by every read so sampling doesn't build new objects; band_slots gives a band's slot, spectrum_slots the band's
+# place in the instrument's sorted band list, set by Instrument.make_band_list()
+def make_band_buffers( spectral_sensor ):
+    spectral_sensor.band_slots = { band:slot for slot, band in enumerate( spectral_sensor.bands )}
+    spectral_sensor.counts = array.array( "H", [ 0 ] * len( spectral_sensor.bands ))
+    spectral_sensor.irradiance = array.array( "f", [ 0 ] * len( spectral_sensor.bands ))
+    spectral_sensor.spectrum_slots = array.array( "B", range( 0, len( spectral_sensor.bands )))
+
+def fill_band_buffer( buffer, values ):
+    for slot in range( 0, len( buffer )):
+        buffer[slot] = values[slot]
+
+class as7265x_Spectrometer( Device ):
+    # custom library
+    # a 6 channel conversion takes two integration periods, 333 ms at the calibration default
+    # one shot: start_conversion() triggers all three chips, conversion_ready() polls, read() fetches the results
+    # in one pass over the result registers. The driver's get_value() selects the chip again for every channel.
+    def __init__( self, com_bus ):
+        super().__init__(name = "as7265x_spectrometer", pn = "as7256x", address = 0x49, swob = AS7265X( com_bus ))
+        self.one_shot = preset_as7265x_one_shot
+        self.conversion_due_time = 0
+        self.chip_temp_c = None
+        self.temperature_time = 0
+        if self.swob:
+            self.swob.disable_indicator()
+            if self.one_shot:
+                self.swob.set_measurement_mode(AS7265X_sparkfun.MEASUREMENT_MODE_6CHAN_ONE_SHOT)
+            else:
+                self.swob.set_measurement_mode(AS7265X_sparkfun.MEASUREMENT_MODE_6CHAN_CONTINUOUS)
+            self.bands = 610, 680, 730, 760, 810, 860, 560, 585, 645, 705, 900, 940, 410, 435, 460, 485, 510, 535
+            self.bandwidth = 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20
+            self.chip_n = 1,   1,   1,   1,   1,   1,   2,   2,   2,   2,   2,   2,   3,   3,   3,   3,   3,   3
+            self.dict_chip_n = {key:value for key, value in zip(self.bands, self.chip_n )}
+            self.dict_bandwidths = {key:value for key, value in zip(self.bands, self.bandwidth )}
+            make_band_buffers( self )
+            self.bands_sorted = sorted( self.bands )
+            self.uncertainty_percent = 12
+            self.gain_ratio = 16 #default, calibrated at
+            self.intg_time_ms = 166 #default, calibrated at
+            self.afov_deg = (20.5 * 2) #datasheet reports half angle.
+    # exposure control for Autoexposure_Controller: gain ratio by gain number, integration time by integration cycles
+    gain_ratios = 1, 3.7, 16, 64
+    integration_times_ms = [ 2.8 * ( cycles + 1 ) for cycles in range( 0, 256 )]
+    def check_gain_ratio(self):
+        gain_number = self.swob._gain
+        if gain_number < 1:
+            self.gain_ratio = 1
+        elif gain_number == 1:
+            self.gain_ratio = 3.7
+        elif gain_number == 2:
+            self.gain_ratio = 16
+        elif gain_number == 3:
+            self.gain_ratio = 64
+        # log the integration time the chip is using, not the calibration default
+        self.intg_time_ms = int(round((2.8*(self.swob._integration_time+1)),0))
+        return self.gain_ratio
+    def get_exposure_numbers(self):
+        return self.swob._gain, self.swob._integration_time
+    def set_exposure_numbers( self, gain_number, cycles ):
+        self.set_gain_number( gain_number )
+        self.set_integration_cycles( cycles )
+    def full_scale_counts( self, cycles ):
+        return 65535
+    def peak_counts(self):
+        return max( self.counts )
+    def read_new_exposure(self):
+        # in continuous mode the result registers still hold a conversion made at the old setting
+        self.swob.take_measurements()
+        if not self.one_shot:
+            self.swob.set_measurement_mode(AS7265X_sparkfun.MEASUREMENT_MODE_6CHAN_CONTINUOUS)
+        self.read()
+    def start_conversion(self):
+        if not self.one_shot:
+            return False
+        self.swob.clear_data_available()
+        self.swob.set_measurement_mode(AS7265X_sparkfun.MEASUREMENT_MODE_6CHAN_ONE_SHOT)
+        self.conversion_due_time = time.monotonic() + 2 * 2.8 * ( self.swob._integration_time + 1 ) / 1000
+        return True
+    def conversion_ready(self):
+        return self.swob.data_available()
+    def set_gain_number(self, gain_number):
+        if gain_number in range (0,4):
+            self.swob.set_gain( gain_number )
+        else:
+            print( "out of range: set gain number to 0-3 to get gain_ratios of 1, 3.7, 16, 64" )
+    def set_integration_cycles( self, cycles ):
+        if cycles in range (0, 256):
+            self.swob.set_integration_cycles(cycles)
+            self.intg_time_ms = int(round((2.8*(cycles+1)),0))
+        else:
+            print( "out of range: set integration cycles to 0-255 for 0-717ms integration time." )
+        return self.intg_time_ms
+    def read(self):
+        if self.chip_temp_c is None or time.monotonic() - self.temperature_time > preset_as7265x_temperature_interval_s:
+            self.read_temperatures()
+        if self.one_shot:
+            self.read_result_registers()
+            return
+        self.read_counts()
+        self.read_fcal()
+        # the uncertainty is always 12% of the factory calibrated irradiance, worked out when logged
+        # TBD stella calibrated irradiance and its uncertainty
+    def read_counts(self):
+        fill_band_buffer( self.counts, self.swob.get_value(0) ) # 0th position raw counts, bands unsorted order
+    def read_fcal(self):
+        fill_band_buffer( self.irradiance, self.swob.get_value(1) ) # 1th position factory calibrated irrad value, bands unsorted order
+    def read_temperatures(self):
+        self.chip_temp_c = {1:self.swob.get_temperature(1), 2:self.swob.get_temperature(2), 3:self.swob.get_temperature(3)}
+        self.temperature_time = time.monotonic()
+    # per chip, the six raw count registers (two bytes each) then the six calibrated registers (four byte floats),
+    # chips in the order of self.bands: NIR R-W, visible G-L, UV A-F
+    raw_registers = 0x08, 0x0a, 0x0c, 0x0e, 0x10, 0x12
+    calibrated_registers = 0x14, 0x18, 0x1c, 0x20, 0x24, 0x28
+    def read_result_registers(self):
+        swob = self.swob
+        read_register = swob.virtual_read_register
+        counts = self.counts
+        irradiance = self.irradiance
+        slot = 0
+        for chip in range( 0, 3 ):
+            swob.select_device( chip )
+            for index in range( 0, 6 ):
+                register = self.raw_registers[index]
+                counts[ slot + index ] = ( read_register( register ) << 8 ) | read_register( register + 1 )
+            for index in range( 0, 6 ):
+                register = self.calibrated_registers[index]
+                # the big endian register bytes go straight into the little endian float array, no float or tuple is made
+                struct.pack_into( "4B", irradiance, 4 * ( slot + index ),
+                                  read_register( register + 3 ), read_register( register + 2 ), read_register( register + 1 ), read_register( register ))
+            slot += 6
+    def list_channels():
+        return self.bands_sorted
+    def header( self ):
+        return "WL.nm, irrad.uW/(cm^2), irrad.uncty.uW/(cm^2), counts, chip_num, chip_temp_C"
+    def get_bandwidth(self, wavelength):
+        return self.dict_bandwidths.get( wavelength )
+    def log( self, wavelength):
+        slot = self.band_slots.get( wavelength )
+        if slot is not None:
+            return self.log_templates[slot].format( *self.log_values( slot ))
+    # the log line with the static fields (pn, wavelength, bandwidth, chip number) filled in, and the values for its {} fields
+    # binary layout letters are struct codes, r is a float ratio written without .0 when it is whole
+    binary_layout = "HffrHr"
+    def make_log_templates( self ):
+        # indexed by band slot, like the readings
+        self.log_templates = [ self.log_template( band ) for band in self.bands ]
+    def log_template( self, wavelength ):
+        return "{}, {}, {}, {{}}, {{}}, {{}}, {{}}, {{}}, {}, {{}}".format(
+            self.pn, wavelength, self.dict_bandwidths[wavelength], self.dict_chip_n[wavelength] )
+    def log_values( self, slot ):
+        irradiance = self.irradiance[slot]
+        return ( self.counts[slot], irradiance, irradiance*self.uncertainty_percent/100,
+                 self.gain_ratio, self.intg_time_ms, self.chip_temp_c[self.chip_n[slot]] )
+    def serial_log(self, wavelength):
+        if wavelength in self.bands:
+            loglist = "pn: {}".format( self.pn )
+            loglist += ", WL-!-nm: {}".format( wavelength )
+            loglist += ", BW-!-nm: {}".format( self.dict_bandwidths[wavelength] )
+            loglist += ", raw-!-counts: {}".format( self.counts[self.band_slots[wavelength]] )
+            loglist += ", irrad-!-uW_per_cm_sq: {}".format( self.irradiance[self.band_slots[wavelength]] )
+            loglist += ", gain-!-: {}".format( self.gain_ratio )
+            loglist += ", intg-!-ms: {}".format( self.intg_time_ms )
+            return loglist
+
+    def printlog(self,ch):
+        print( self.log(ch) )
+    def lamps_on(self):
+        #print( "turn on the lamps")
+        self.swob.enable_bulb(0)   # white
+        self.swob.enable_bulb(1)   # NIR
+        self.swob.enable_bulb(2)   # UV
+    def lamps_off(self):
+        #print( "turn off the lamps")
+        self.swob.disable_bulb(0)   # white
+        self.swob.disable_bulb(1)   # NIR
+        self.swob.disable_bulb(2)   # UV
+    def startup(self):
+        # blink the lamps to show the spectrometer was found
+        if not preset_fast_boot:
+            self.lamps_on()
+            time.sleep(0.1)
+            self.lamps_off()
+
+class Null_as7265x_Spectrometer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.swob = None
+        self.bands = None
+        self.bands_sorted = [0,0]   # empty list
+        self.dict_chip_n = [0,0]
+        self.chip_temps = [0,0]
+        self.counts = array.array( "H" )
+        self.irradiance = array.array( "f" )
+        self.uncert_percent = 10
+    def check_gain_ratio(self):
+        pass
+    def set_gain_number(self, gain_number):
+        pass
+    def read(self):
+        pass
+    def read_counts(self):
+        pass
+    def read_fcal(self):
+        pass
+    def read_temperatures(self):
+        pass
+    def log(self, value):
+        pass
+    def log_template(self, wavelength):
+        pass
+    def log_values(self, slot):
+        pass
+    def make_log_templates(self):
+        pass
+    def get_bandwidth(self, wavelength):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def blink(self, duration):
+        pass
+    def header(self):
+        pass
+    def lamps_on(self):
+        pass
+    def lamps_off(self):
+        pass
+    def set_integration_cycles(self):
+        pass
+    def serial_log(self, wavelength):
+        pass
+
+class as7331_Spectrometer( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "as7331_spectrometer", pn = "as7331", address = 0x74, swob = as7331.AS7331( com_bus ))
+        self.bands = 360, 300, 260
+        self.bandwidth = 80, 40, 40
+        self.chip_n = 1, 1, 1
+        self.dict_chip_n = {key:value for key, value in zip(self.bands, self.chip_n )}
+        self.dict_bandwidths = {key:value for key, value in zip(self.bands, self.bandwidth )}
+        make_band_buffers( self )
+        #https://look.ams-osram.com/m/1856fd2c69c35605/original/AS7331-Spectral-UVA-B-C-Sensor.pdf
+        self.afov_deg = (10 * 2)
+        self.fcal_unct_percent = 0 # no reported value
+        self.gain_ratio = 0 #TBD what are the defaults?
+        self.intg_time_ms = 0 #TBD what are the defaults?
+    # exposure control for Autoexposure_Controller: gain number n is 2^n gain, integration number n is 2^n ms
+    gain_ratios = 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048
+    integration_times_ms = 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384
+    def get_exposure_numbers(self):
+        return 11 - self.swob.gain, self.swob.integration_time
+    def set_exposure_numbers( self, gain_number, intg_number ):
+        self.set_gain_number( gain_number )
+        self.set_integration_time( intg_number )
+    def full_scale_counts( self, intg_number ):
+        # with the internal 1.024 MHz clock the converter counts to 2^(10 + integration number)
+        return min( 65535, 1024 * 2**intg_number )
+    def peak_counts(self):
+        return max( self.counts )
+    def read_new_exposure(self):
+        self.read()
+    def check_gain_ratio(self):
+        self.intg_time_ms = 2**self.swob.integration_time
+        gain_callout = self.swob.gain
+        if gain_callout == 11:
+            self.gain_ratio = 1
+        elif gain_callout == 10:
+            self.gain_ratio = 2
+        elif gain_callout == 9:
+            self.gain_ratio = 4
+        elif gain_callout == 8:
+            self.gain_ratio = 8
+        elif gain_callout == 7:
+            self.gain_ratio = 16
+        elif gain_callout == 6:
+            self.gain_ratio = 32
+        elif gain_callout == 5:
+            self.gain_ratio = 64
+        elif gain_callout == 4:
+            self.gain_ratio = 128
+        elif gain_callout == 3:
+            self.gain_ratio = 256
+        elif gain_callout == 2:
+            self.gain_ratio = 512
+        elif gain_callout == 1:
+            self.gain_ratio = 1024
+        elif gain_callout == 0:
+            self.gain_ratio = 2048
+        return self.gain_ratio
+
+    def set_gain_number(self, gain_number):
+        if gain_number in range (0,12):
+            if gain_number == 11:
+                gain_constant = as7331.GAIN_2048X
+            if gain_number == 10:
+                gain_constant = as7331.GAIN_1024X
+            if gain_number == 9:
+                gain_constant = as7331.GAIN_512X
+            if gain_number == 8:
+                gain_constant = as7331.GAIN_256X
+            if gain_number == 7:
+                gain_constant = as7331.GAIN_128X
+            if gain_number == 6:
+                gain_constant = as7331.GAIN_64X
+            if gain_number == 5:
+                gain_constant = as7331.GAIN_32X
+            if gain_number == 4:
+                gain_constant = as7331.GAIN_16X
+            if gain_number == 3:
+                gain_constant = as7331.GAIN_8X
+            if gain_number == 2:
+                gain_constant = as7331.GAIN_4X
+            if gain_number == 1:
+                gain_constant = as7331.GAIN_2X
+            if gain_number == 0:
+                gain_constant = as7331.GAIN_1X
+            self.swob.gain = gain_constant
+        else:
+            print( "out of range: set gain number to 0-11 to get gain_ratios from 1 to 2048" )
+
+    def set_integration_time( self, intg_number ):
+        if intg_number == 0:
+            self.integration_time = as7331.INTEGRATION_TIME_1MS
+            self.intg_time_ms = 1
+        if intg_number == 1:
+            self.integration_time = as7331.INTEGRATION_TIME_2MS
+            self.intg_time_ms = 2
+        if intg_number == 2:
+            self.integration_time = as7331.INTEGRATION_TIME_4MS
+            self.intg_time_ms = 4
+        if intg_number == 3:
+            self.integration_time = as7331.INTEGRATION_TIME_8MS
+            self.intg_time_ms = 8
+        if intg_number == 4:
+            self.integration_time = as7331.INTEGRATION_TIME_16MS
+            self.intg_time_ms = 16
+        if intg_number == 5:
+            self.integration_time = as7331.INTEGRATION_TIME_32MS
+            self.intg_time_ms = 32
+        if intg_number == 6:
+            self.integration_time = as7331.INTEGRATION_TIME_64MS
+            self.intg_time_ms = 64
+        if intg_number == 7:
+            self.integration_time = as7331.INTEGRATION_TIME_128MS
+            self.intg_time_ms = 128
+        if intg_number == 8:
+            self.integration_time = as7331.INTEGRATION_TIME_256MS
+            self.intg_time_ms = 256
+        if intg_number == 9:
+            self.integration_time = as7331.INTEGRATION_TIME_512MS
+            self.intg_time_ms = 512
+        if intg_number == 10:
+            self.integration_time = as7331.INTEGRATION_TIME_1024MS
+            self.intg_time_ms = 1024
+        if intg_number == 11:
+            self.integration_time = as7331.INTEGRATION_TIME_2048MS
+            self.intg_time_ms = 2048
+        if intg_number == 12:
+            self.integration_time = as7331.INTEGRATION_TIME_4096MS
+            self.intg_time_ms = 4096
+        if intg_number == 13:
+            self.integration_time = as7331.INTEGRATION_TIME_8192MS
+            self.intg_time_ms = 8192
+        if intg_number == 14:
+            self.integration_time = as7331.INTEGRATION_TIME_16384MS
+            self.intg_time_ms = 16384
+        if intg_number in range (0,15):
+            self.swob.integration_time = self.integration_time
+        else:
+            print( "out of range: set integration number to 0-14 for 1-16384 ms integration time." )
+        return self.intg_time_ms
+    def lamps_on(self):
+        pass
+    def lamps_off(self):
+        pass
+    def read(self):
+        self.read_counts()
+        self.read_fcal()
+    def read_counts(self):
+        # bands in the order 360 ( UVA ), 300 ( UVB ), 260 ( UVC ), then the chip temperature
+        self.counts[0], self.counts[1], self.counts[2], self.chip_temp_c_counts = self.swob.raw_values
+    def read_fcal(self):
+        self.irradiance[0], self.irradiance[1], self.irradiance[2], self.chip_temp_c = self.swob.values
+    def read_temperatures(self):
+        pass
+    def header(self):
+        return "sensorPN, Wl.nm, raw_counts, irrad.stella.cal, irrad.stella.uncty, irrad_factory.cal, irrad_factory.uncty, gain, integration_time_ms, chip_temp_C"
+        #return "UVC.WL.nm, UVC_uncal, UVB.WL.nm, UVB_uncal, UVA.WL.nm, UVA_uncal, UVS.temp.C"
+    def log( self, wavelength):
+        slot = self.band_slots.get( wavelength )
+        if slot is not None:
+            return self.log_templates[slot].format( *self.log_values( slot ))
+    binary_layout = "HfHH"
+    def make_log_templates( self ):
+        # indexed by band slot, like the readings
+        self.log_templates = [ self.log_template( band ) for band in self.bands ]
+    def log_template( self, wavelength ):
+        return "{}, {}, {}, {{}}, {{}},  - , {{}}, {{}}, {},  - ".format(
+            self.pn, wavelength, self.dict_bandwidths[wavelength], self.dict_chip_n[wavelength] )
+    def log_values( self, slot ):
+        return ( self.counts[slot], self.irradiance[slot], self.gain_ratio, self.intg_time_ms )
+    def serial_log(self, wavelength):
+        if wavelength in self.bands:
+            loglist = "pn: {}".format( self.pn )
+            loglist += ", WL-!-nm: {}".format( wavelength )
+            loglist += ", BW-!-nm: {}".format( self.dict_bandwidths[wavelength] )
+            loglist += ", raw-!-counts: {}".format( self.counts[self.band_slots[wavelength]] )
+            loglist += ", irrad-!-uW_per_cm_sq: {}".format( self.irradiance[self.band_slots[wavelength]] )
+            loglist += ", gain-!-: {}".format( self.gain_ratio )
+            loglist += ", intg-!-ms: {}".format( self.intg_time_ms )
+            return loglist
+    def get_bandwidth(self, wavelength):
+        return self.dict_bandwidths.get( wavelength )
+    def printlog(self):
+        print( self.log())
+
+class Null_as7331_Spectrometer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def read_counts(self):
+        pass
+    def read_fcal(self):
+        pass
+    def read_temperatures(self):
+        pass
+    def lamps_on(self):
+        pass
+    def lamps_off(self):
+        pass
+    def log(self, value):
+        pass
+    def log_template(self, wavelength):
+        pass
+    def log_values(self, slot):
+        pass
+    def make_log_templates(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def get_bandwidth(self, wavelength):
+        pass
+    def header(self):
+        pass
+    def check_gain_ratio(self):
+        pass
+    def serial_log(self, wavelength):
+        pass
+
+class as7341_Spectrometer( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "as7341_spectrometer", pn = "as7341", address = 0x39, swob = AS7341( com_bus ))
+        self.bands = 415, 445, 480, 515, 555, 590, 630, 682
+        self.bandwidth = 26, 30, 36, 39, 39, 40, 50, 52
+        self.chip_n = 1, 1, 1, 1, 1, 1, 1, 1
+        self.dict_chip_n = {key:value for key, value in zip(self.bands, self.chip_n )}
+        self.dict_bandwidths = {key:value for key, value in zip(self.bands, self.bandwidth )}
+        make_band_buffers( self )
+        self.colors = ["violet", "indigo", "blue", "cyan", "green", "yellow", "orange", "red"]
+        #self.tsis_cal_counts_per_irradiance = 1405.9, 2079.6, 2631.6, 3556.8, 4246.0, 5060.6, 6888.9, 9130.9
+        # first principles calibration by Sten Odenwald of NASA Heliophysics
+        self.steno_cal_counts_per_irradiance = 4398.0, 6104.0, 7583.0, 9972.0, 11536.0, 13374.0, 17115.0, 20916.0
+        self.calibration_error = 0.6
+        # not set on the chip, the data file shows - ; the reference store keys its spectra by them
+        self.gain_ratio = 1
+        self.intg_time_ms = 0
+        self.swob.led_current = 50
+    def check_gain_ratio(self):
+        pass
+    def lamps_on(self):
+        self.swob.led = True
+    def lamps_off(self):
+        self.swob.led = False
+    def blink( self, duration ):
+        self.swob.led_current = 50
+        self.swob.led = True
+        time.sleep( duration )
+        self.swob.led = False
+    def read(self):
+        # irradiance is the stenocal irradiance
+        fill_band_buffer( self.counts, self.swob.all_channels )
+        for ch in range (0,8):
+            self.irradiance[ch] = self.counts[ch]/self.steno_cal_counts_per_irradiance[ch]
+    def list_channels():
+        return self.center_wavelengths
+    def header(self, ch):
+        return " {}.WL.nm, {}.counts, {}.W/(m^2*nm), {}.uncty.W/(m^2*nm)".format( self.colors[ch], self.colors[ch], self.colors[ch], self.colors[ch] )
+    def log( self, wavelength):
+        slot = self.band_slots.get( wavelength )
+        if slot is not None:
+            return self.log_templates[slot].format( *self.log_values( slot ))
+    binary_layout = "Hf"
+    def make_log_templates( self ):
+        # indexed by band slot, like the readings
+        self.log_templates = [ self.log_template( band ) for band in self.bands ]
+    def log_template( self, wavelength ):
+        return "{}, {}, {}, {{}}, {{}},  - ,  - ,  - ,  - ,  - ".format( self.pn, wavelength, self.dict_bandwidths[wavelength] )
+    def log_values( self, slot ):
+        return ( self.counts[slot], self.irradiance[slot] )
+    def serial_log(self, wavelength):
+        if wavelength in self.bands:
+            loglist = "pn: {}".format( self.pn )
+            loglist += ", WL-!-nm: {}".format( wavelength )
+            loglist += ", BW-!-nm: {}".format( self.dict_bandwidths[wavelength] )
+            loglist += ", raw-!-counts: {}".format( self.counts[self.band_slots[wavelength]] )
+            loglist += ", irrad-!-uW_per_cm_sq: {}".format( self.irradiance[self.band_slots[wavelength]] )
+            loglist += ", gain-!-: {}".format( '-' ) #self.gain_ratio )
+            loglist += ", intg-!-ms: {}".format( '-' )#self.intg_time_ms )
+            return loglist
+    def get_bandwidth(self, wavelength):
+        return self.dict_bandwidths.get( wavelength )
+    def printlog(self,ch):
+        print( self.log(ch))
+
+class Null_as7341_Spectrometer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self, value):
+        pass
+    def log_template(self, wavelength):
+        pass
+    def log_values(self, slot):
+        pass
+    def make_log_templates(self):
+        pass
+    def serial_log(self, wavelength):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def lamps_on(self):
+        pass
+    def lamps_off(self):
+        pass
+    def blink(self, duration):
+        pass
+    def get_bandwidth(self, wavelength):
+        pass
+    def header(self):
+        pass
+    def check_gain_ratio(self):
+        pass
+
+class bme280_Air_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "bme280_air_sensor", pn = "bme280", address = 0x77, swob = adafruit_bme280.Adafruit_BME280_I2C( com_bus ))
+        self.temperature_C = None
+        self.pressure = None
+        self.altitude = None
+        self.humidity = None
+    def read(self):
+        self.temperature_C = self.swob.temperature
+        self.pressure = self.swob.pressure
+        self.humidity = self.swob.relative_humidity
+        self.altitude = self.swob.altitude
+        #print( self.altitude )
+        # TBD calculate dewpoint, but do that in an auxilliary function, because I'll have many sources of T and RH
+        # TD: =243.04*(LN(RH/100)+((17.625*T)/(243.04+T)))/(17.625-LN(RH/100)-((17.625*T)/(243.04+T)))
+        # from https://bmcnoldy.earth.miami.edu/Humidity.html
+        #self.dewpoint = 0 #self.temperature -((100-self.humidity)/5) #update this to the formula above.
+        #self.dp_uncty = 3.2
+    def log(self):
+        # name, units, value, +/-, uncertainty ## per datasheet
+        return "{}, {}, {}, {}".format( self.pressure, round(self.altitude, 3), round(self.humidity, 1), round(self.temperature_C, 3) )
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        return( "bme280_barometric_pressure-!-hPa, bme280_altitude_relative-!-m, bme280_humidity_relative-!-percent, bme280_temperature_ambient-!-C" )
+
+class Null_bme280_Air_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.swob = None
+        self.temperature_C = None
+        self.pressure = None
+        self.altitude = None
+        self.humidity = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class Capacitive_Soil_Moisture_Sensor( Device ):
+    # https://learn.adafruit.com/adafruit-stemma-soil-sensor-i2c-capacitive-moisture-sensor/python-circuitpython-test
+    def __init__( self, com_bus ):
+        super().__init__(name = "capacitive_soil_moisture_sensor", pn = "cap_sm", address = 0x37, swob = Seesaw(com_bus, addr=0x37))
+    def read(self):
+        self.soil_capacitance = self.swob.moisture_read()
+        #print( self.soil_capacitance )
+    def header(self):
+        return "capacitive_soil_moisture_signal-!-"
+    def log(self):
+        return "{}".format( self.soil_capacitance )
+    def printlog(self):
+        print( self.log())
+
+class Null_Capacitive_Soil_Moisture_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+##TBD add conductive soil moisture sensor
+
+class ds2484_1_Wire_Thermometer_Reader( Device ):
+    #https://learn.adafruit.com/adafruit-ds2484-i2c-to-1-wire-bus-adapter-breakout/circuitpython-and-python
+    def __init__( self, com_bus ):
+        super().__init__(name = "ds2484_1_wire_thermometer", pn = "ds2484", address = 0x18, swob = Adafruit_DS248x( com_bus ))
+        self.rom = bytearray(8)
+        if not self.swob.onewire_search(self.rom):
+            pass
+            #print( "no 1-wire thermometers found" )
+    def read(self):
+        self.temperature_C = self.swob.ds18b20_temperature(self.rom)
+        #print( self.temperature_C )
+    def header(self):
+        return "ds2484_temperature_material-!-C"
+    def log(self):
+        return "{}".format( round(self.temperature_C,1))
+    def printlog(self):
+        print( self.log())
+
+class Null_ds2484_1_Wire_Thermometer_Reader(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+def initialize_gps( instrument ):
+    gps = Null_GPS()
+    try:
+        gps = pa1616d_GPS( instrument.uart_bus )
+        instrument.welcome_page.announce( "initialize_gps" )
+        instrument.sensors_present.append( gps )
+        if not preset_fast_boot:
+            gps.finish_startup()
+    except Exception as err:
+        print("gps failed init: {}".format(err))
+        pass
+    return gps
+
+class pa1616d_GPS( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "gps", pn = "pa1616d", address = 0x00, swob = adafruit_gps.GPS( com_bus, debug=False))
+        self.cadence_s = 1.0 # send_start_commands sets a 1 s update interval
+        self.streams = True
+        self.last_read = 0
+    def finish_startup(self):
+        time.sleep(0.1)
+        self.request_firmware_report()
+        self.send_start_commands()
+    def send_start_commands(self):
+        self.swob.send_command(b"PMTK314,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0") #set data output configuration
+        self.swob.send_command(b"PMTK220,1000") #set update interval to 1000 ms
+
+    def request_firmware_report( self ):
+        self.swob.send_command(b"PMTK605")  # request firmware version
+        data = self.swob.read(32)  # read up to 32 bytes
+            # print(data)  # this is a bytearray type
+        if data is not None:
+            # convert bytearray to string
+            data_string = "".join([chr(b) for b in data])
+            print( "gps firmware report = ", end='')
+            report = data_string[:4]
+            print( report )
+        else:
+            report = ["False"]
+            print( "no data on firmware" )
+        if report[0] == '$':
+            print("good gps firmware report")
+        else:
+            print("gps status not determined")
+        return report
+    # TBD can we get warm start battery health information?
+    def fix(self):
+        return self.swob.has_fix
+    def read(self):
+        self.swob.update()
+        self.latitude = self.swob.latitude
+        self.longitude = self.swob.longitude
+        self.altitude = self.swob.altitude_m
+        self.timestruct = self.swob.timestamp_utc
+    def header(self):
+        return( "gps_fix-!-boolean, gps_latitude-!-degrees, gps_longitude-!-degrees, gps_altitude-!-m, gps_timestamp-!-iso8601utc" )
+    def log(self):
+        if self.timestruct is not None:
+            self.gps_timestamp = "{}{:02}{:02}T{:02}{:02}{:02}Z".format(
+                        self.timestruct.tm_year,# Note you might not get all data like year month day
+                        self.timestruct.tm_mon,
+                        self.timestruct.tm_mday,
+                        self.timestruct.tm_hour,
+                        self.timestruct.tm_min,
+                        self.timestruct.tm_sec
+                        )
+        else: self.gps_timestamp = None #"20000101T000000Z"
+        return "{}, {}, {}, {}, {}".format( self.swob.has_fix, self.latitude, self.longitude, self.altitude, self.gps_timestamp )
+    def printlog(self):
+        print( self.log())
+
+class Null_GPS(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def fix(self):
+        return False
+    def report(self):
+        pass
+    def send_start_commands(self):
+        pass
+    def finish_startup(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class hdc3022_Air_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "hdc3022_air_sensor", pn = "hdc3022", address = 0x44, swob = adafruit_hdc302x.HDC302x( com_bus ))
+        self.temperature_C = 0
+        self.humidity_percent = 0
+    def read(self):
+        self.temperature_C = self.swob.temperature
+        self.humidity_percent = self.swob.relative_humidity
+        #print( self.temperature_C )
+    def log(self):
+        # name, units, value, +/-, uncertainty ## per datasheet
+        return "{}, {}".format( round(self.temperature_C, 2), round(self.humidity_percent, 1) )
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        return( "hdc3022_temperature_ambient-!-C, hdc3022_humidity_relative-!-percent" )
+
+class Null_hdc3022_Air_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.temperature_C = 0
+        self.humidity_percent = 0
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+def initialize_lv_ez_mb1013_rangefinder( instrument, analog_in_0, sense_5V ):
+    lv_ez_mb1013_rangefinder = Null_Lv_ez_mb1013_Rangefinder()
+    try:
+        lv_ez_mb1013_rangefinder = Lv_ez_mb1013_Rangefinder( analog_in_0, sense_5V )
+        instrument.sensors_present.append( lv_ez_mb1013_rangefinder )
+    except Exception as err:
+        pass
+        #print( "error:", err )
+    return lv_ez_mb1013_rangefinder
+
+class Lv_ez_mb1013_Rangefinder( Device ):
+    def __init__( self, analog_in_0, sense_5V):
+        super().__init__(name = "lv_ez_mb1013_rangefinder", pn = "lv_ez_mb1013", address = 0x00, swob = True)
+        self.range_m = None
+        self.analog_in_0 = analog_in_0
+        self.sense_5V = sense_5V
+    def read(self):
+        supply_v = 2 * (self.sense_5V.value * 3.3) / 65536
+        range_m =self.analog_in_0.value * 8.312 / 100000 - 0.05 # offset
+        self.range_m = round(range_m, 3)
+    def log(self):
+        return "{}, {}".format( self.analog_in_0.value, self.range_m )
+    def header(self):
+        return "analog_input_0_digital_number-!-counts, hrlv-ez-mb1013_range-!-m"
+
+class Null_Lv_ez_mb1013_Rangefinder(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.range_m = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class lis2mdl_Magnetic_Field_Sensor( Device ):
+    #https://www.st.com/en/mems-and-sensors/lis2mdl.html#documentation
+    def __init__( self, com_bus ):
+        super().__init__(name = "lis2mdl_magnetic_field_sensor", pn = "lis2mdl", address = 0x1E, swob = adafruit_lis2mdl.LIS2MDL(com_bus ))
+        self.cadence_s = 0.1
+        self.Bx_uT = None
+        self.By_uT = None
+        self.Bz_uT = None
+        self.B_uncertainty_uT = 0.3 #TBD how close is this uncertainty to actual performance
+    def read(self):
+        self.Bx_uT, self.By_uT, self.Bz_uT = self.swob.magnetic
+        #print( self.Bx_uT, self.By_uT, self.Bz_uT )
+    def log(self):
+        return "{}, {}, {}".format(
+            round(self.Bx_uT, 3),
+            round(self.By_uT, 3),
+            round(self.Bz_uT, 3))
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        return( "lis2mdl_magnetic_field_x-!-uT, lis2mdl_magnetic_field_y-!-uT, lis2mdl_magnetic_field_z-!-uT" )
+
+class Null_lis2mdl_Magnetic_Field_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.Bx = None
+        self.By = None
+        self.Bz = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class lis3mdl_Magnetic_Field_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "lis3mdl_magnetic_field_sensor", pn = "lis3mdl", address = 0x6a, swob = LIS3MDL(com_bus ))
+        self.cadence_s = 0.1
+        self.Bx_uT = None
+        self.By_uT = None
+        self.Bz_uT = None
+        self.B_uncertainty_uT = 0.3 #TBD how close is this uncertainty to actual performance
+    def read(self):
+        self.Bx_uT, self.By_uT, self.Bz_uT = self.swob.magnetic
+        #print( self.Bx_uT, self.By_uT, self.Bz_uT )
+    def log(self):
+        return "{}, {}, {}".format(
+            round(self.Bx_uT, 3),
+            round(self.By_uT, 3),
+            round(self.Bz_uT, 3))
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        return( "lis3mdl_magnetic_field_x-!-uT, lis3mdl_magnetic_field_y-!-uT, lis3mdl_magnetic_field_z-!-uT" )
+
+class Null_lis3mdl_Magnetic_Field_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.Bx = None
+        self.By = None
+        self.Bz = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class lsm303_Acceleration_Sensor( Device ):
+    #https://www.st.com/resource/en/datasheet/lsm303agr.pdf
+    def __init__( self, com_bus ):
+        super().__init__(name = "lsm303_acceleration_sensor", pn = "lms303", address = 0x19, swob = adafruit_lsm303_accel.LSM303_Accel( com_bus ))
+        self.cadence_s = 0.1
+        self.Ax_m_per_s2 = None
+        self.Ay_m_per_s2 = None
+        self.Az_m_per_s2 = None
+        self.A_uncertainty_m_per_s2= 0.4
+    def read(self):
+        self.Ax_m_per_s2, self.Ay_m_per_s2, self.Az_m_per_s2 = self.swob.acceleration
+        #print( self.Ax_m_per_s2, self.Ay_m_per_s2, self.Az_m_per_s2 )
+    def log(self):
+        return "{}, {}, {}".format(
+            round(self.Ax_m_per_s2, 3),
+            round(self.Ay_m_per_s2, 3),
+            round(self.Az_m_per_s2, 3))
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        return( "lsm303_acceleration_x-!-m_per_s_sq, lsm303_acceleration_y-!-m_per_s_sq, lsm303_acceleration_z-!-m_per_s_sq" )
+
+class Null_lsm303_Acceleration_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.Ax_m_per_s2 = None
+        self.Ay_m_per_s2 = None
+        self.Az_m_per_s2 = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class lsm6ds_Accel_Gyro_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "lsm6ds_accel_gyro_sensor", pn = "lms6ds", address = 0x1c, swob = LSM6DS( com_bus ))
+        self.cadence_s = 0.1
+        self.Ax_m_per_s2 = 0
+        self.Ay_m_per_s2 = 0
+        self.Az_m_per_s2 = 0
+        self.wx_deg_per_s = 0
+        self.wy_deg_per_s = 0
+        self.wz_deg_per_s = 0
+        self.A_uncertainty_m_per_s2= 0.4
+    def read(self):
+        self.Ax_m_per_s2, self.Ay_m_per_s2, self.Az_m_per_s2 = self.swob.acceleration
+        self.wx_deg_per_s, self.wy_deg_per_s, self.wz_deg_per_s = self.swob.gyro
+        #print( self.wx_rad_per_s, self.wy_rad_per_s, self.wz_rad_per_s  )
+    def log(self):
+        return "{}, {}, {}, {}, {}, {}".format(
+            round(self.Ax_m_per_s2, 3),
+            round(self.Ay_m_per_s2, 3),
+            round(self.Az_m_per_s2, 3),
+            round(self.wx_deg_per_s, 3),
+            round(self.wy_deg_per_s, 3),
+            round(self.wz_deg_per_s, 3)
+            )
+    def printlog(self):
+        print( self.log())
+    def header(self):
+        headers = "lsm6ds_acceleration_x-!-m_per_s_sq, lsm6ds_acceleration_y-!-m_per_s_sq, lsm6ds_acceleration_z-!-m_per_s_sq"
+        headers += "lsm6ds_rotation_x-!-degrees_per_s, lsm6ds_rotation_x-!-degrees_per_s, lsm6ds_rotation_x-!-degrees_per_s"
+        return headers
+
+class Null_lsm6ds_Accel_Gyro_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.Ax_m_per_s2 = None
+        self.Ay_m_per_s2 = None
+        self.Az_m_per_s2 = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class ltr390_UVA_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "ltr390_uva_sensor", pn = "ltr390", address = 0x53, swob = adafruit_ltr390.LTR390( com_bus ))
+        self.cadence_s = 1.0 # reading uvs and light switches modes, each needs a fresh conversion
+    def read(self):
+        self.UVA = self.swob.uvs
+        self.uv_index = self.swob.uvi
+        self.light_raw = self.swob.light
+        self.lux = self.swob.lux
+        #print( self.lux )
+    def header(self):
+        return "ltr390_illumination-!-counts, ltr390_illumination-!-lux, ltr390_uva-!-counts, ltr390_uv_index-!-"
+    def log(self):
+        return "{}, {}, {}, {}".format( self.light_raw, self.lux, self.UVA, self.uv_index )
+    def printlog(self):
+        print( self.log())
+
+class Null_ltr390_UVA_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+def initialize_battery_monitor( instrument ):
+    battery_monitor = Null_Battery_Monitor()
+    try:
+        battery_monitor = max1704x_Battery_Monitor( instrument.i2c_bus )
+        instrument.welcome_page.announce( "initialize_battery_monitor" )
+        instrument.sensors_present.append( battery_monitor )
+    except:
+        pass
+    return battery_monitor
+
+class max1704x_Battery_Monitor( Device ): #child class ( parent class ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "battery_monitor", pn = "max1704x", address = 0x36, swob = adafruit_max1704x.MAX17048( com_bus ))
+        self.cadence_s = 30.0 # the fuel gauge changes slowly
+        self.voltage = self.swob.cell_voltage
+        self.percentage = round(self.swob.cell_percent, 1)
+    def read(self):
+        self.voltage = self.swob.cell_voltage
+        self.percentage = round(self.swob.cell_percent, 1)
+        #print( self.percentage )
+    def header(self):
+        return "max1704x_battery_voltage-!-V, max1704x_battery_energy-!-percent"
+    def log(self):
+        return "{}, {}".format( self.voltage, self.percentage )
+    def printlog(self):
+        print( self.log())
+
+class Null_Battery_Monitor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        self.voltage = 0
+        self.percentage = 0
+    def log(self):
+        return "{}, {}".format( self.voltage, self.percentage )
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class mcp9808_Air_Thermometer( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "mcp9808_air_thermometer", pn = "mcp9808", address = 0x1f, swob = adafruit_mcp9808.MCP9808( com_bus, address = 0x1f ))
+        self.temperature_C = None
+    def read(self):
+        self.temperature_C = self.swob.temperature
+        #print( self.temperature_C )
+    def header(self):
+        return "mcp9808_temperature_ambient-!-C"
+    def log(self):
+        return "{}".format( round(self.temperature_C, 1 ))
+    def printlog(self):
+        print( self.log())
+
+class Null_mcp9808_Air_Thermometer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.temperature_C = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class mlx90614_Surface_Thermometer( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "mlx90614_surface_thermometer", pn = "mlx90614", address = 0x5A, swob = adafruit_mlx90614.MLX90614( com_bus ))
+        self.surface_temperature_C = 0
+        self.ambient_temperature_C = 0
+    def read(self):
+        self.surface_temperature_C = self.swob.object_temperature
+        self.ambient_temperature_C = self.swob.ambient_temperature
+    def header(self):
+        return "mlx90614_temperature_surface-!-C, mlx90614_temperature_local-!-C"
+    def log(self):
+        return "{}, {}".format( round(self.surface_temperature_C,1), round(self.ambient_temperature_C,1) )
+    def printlog(self):
+        print( self.log())
+
+class Null_mlx90614_Surface_Thermometer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.surface_temperature_C = 0
+        self.ambient_temperature_C = 0
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class mlx90640_Thermal_Camera( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "mlx90640_thermal_camera", pn = "mlx90640", address = 0x33, swob = adafruit_mlx90640.MLX90640( com_bus ))
+        # TBD self.refresh_rate = adafruit_mlx90640.RefreshRate.REFRESH_2_HZ
+        # TBD self.refresh_rate = self.swob.RefreshRate.REFRESH_4_HZ
+    def read(self):
+        pass
+        #self.t_surface_C = self.swob.object_temperature
+    def header(self):
+        return ""
+    def log(self):
+        pass
+        #return "{}".format( self.t_surface_C )
+    def printlog(self):
+        print( self.log())
+
+class Null_mlx90640_Thermal_Camera(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class pcf8591_8_Bit_ADC_DAC( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "pcf8591_8_bit_adc_dac", pn = "pcf8591", address = 0x4f, swob = PCF8591.PCF8591( com_bus, address = 0x4f ))
+        self.raw_0 = None
+        self.raw_1 = None
+        self.raw_2 = None
+        self.raw_3 = None
+        self.voltage_0 = None
+        self.voltage_1 = None
+        self.voltage_2 = None
+        self.voltage_3 = None
+    def read(self):
+        self.raw_0 = PCF8591_AnalogIn(self.swob, PCF8591.A0).value
+        self.raw_1 = PCF8591_AnalogIn(self.swob, PCF8591.A1).value
+        self.raw_2 = PCF8591_AnalogIn(self.swob, PCF8591.A2).value
+        self.raw_3 = PCF8591_AnalogIn(self.swob, PCF8591.A3).value
+        self.voltage_0 = (self.raw_0/ 65535) * 3.3
+        self.voltage_1 = (self.raw_1/ 65535) * 3.3
+        self.voltage_2 = (self.raw_2/ 65535) * 3.3
+        self.voltage_3 = (self.raw_3/ 65535) * 3.3
+    def set(self, value):
+        PCF8591_AnalogOut(self.swob, PCF8591.OUT).value = value #32767 max
+    def header(self):
+        headers = "pcf8591_channel_0_digital_number-!-counts, pcf8591_channel_1_digital_number-!-counts, pcf8591_channel_2_digital_number-!-counts, pcf8591_channel_3_digital_number-!-counts"
+        headers += ", pcf8591_channel_0_voltage-!-V, pcf8591_channel_1_voltage-!-V, pcf8591_channel_2_voltage-!-V, pcf8591_channel_3_voltage-!-V"
+        return headers
+    def log(self):
+        return "{}, {}, {}, {}, {}, {}, {}, {}".format( self.raw_0, self.raw_1, self.raw_2, self.raw_3, self.voltage_0, self.voltage_1, self.voltage_2, self.voltage_3 )
+    def printlog(self):
+        print( self.log())
+
+class Null_pcf8591_8_Bit_ADC_DAC(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def read(self, value):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class pmsa0031_Particulates_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "pmsa0031_particulates_sensor", pn = "pmsa0031", address = 0x12, swob = PM25_I2C( com_bus, reset_pin = None ))
+        self.cadence_s = 1.0
+        self.aqip = None
+        self.pm100 = None
+        self.pm25 = None
+        self.ratio = None
+    def read(self):
+        try:
+            self.data = self.swob.read()
+        except RuntimeError as err:
+            self.data = None
+            print( err )
+        if self.data is not None:
+            self.aqip = calculate_aqi_p( self.data["pm25 standard"], self.data["pm100 standard"] )
+        self.pm25 = self.data["pm25 standard"]
+        self.pm100 = self.data["pm100 standard"]
+    def header(self):
+        headers = "pmsa0031_air_quality_index_for_particulates-!-, pmsa0031_pm2.5_over_pm10_ratio-!-, pmsa0031_pm1-!-ug_per_m_cubed"
+        headers += ", pmsa0031_pm2.5-!-ug_per_m_cubed, pmsa0031_pm10-!-ug_per_m_cubed, pmsa0031_particle_count_0.3m-!-count_per_100mL"
+        headers += ", pmsa0031_particle_count_0.5m-!-count_per_100mL, pmsa0031_particle_count_1m-!-count_per_100mL, pmsa0031_particle_count_2.5m-!-count_per_100mL"
+        headers += ", pmsa0031_particle_count_5m-!-count_per_100mL, pmsa0031_particle_count_10m-!-count_per_100mL"
+        return headers
+    def log(self):
+        if self.data["pm100 standard"] > 0:
+            ratio = round(self.data["pm25 standard"]/self.data["pm100 standard"], 2)
+        else:
+            ratio = 1
+        self.datastring = "{}, {},{}, {}, {}, {}, {}, {}, {}, {}, {}".format(
+                self.aqip,
+                self.ratio,
+                self.data["pm10 standard"],
+                self.data["pm25 standard"],
+                self.data["pm100 standard"],
+                self.data["particles 03um"],
+                self.data["particles 05um"],
+                self.data["particles 10um"],
+                self.data["particles 25um"],
+                self.data["particles 50um"],
+                self.data["particles 100um"])
+        return self.datastring
+    def printlog(self):
+        print( self.log())
+
+class Null_pmsa0031_Particulates_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.aqip = None
+        self.pm100 = None
+        self.pm25 = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+def initialize_qwiic_buzzer( i2c_bus, i2c_addresses ):
+    buzzer = Null_Qwiic_Buzzer()
+    try:
+        if 0x34 in i2c_addresses:
+            import_driver( "qwiic_buzzer", None, "qwiic_buzzer" )
+        buzzer = Qwiic_Buzzer( i2c_bus )
+    except Exception as err:
+        print( "buzzer failed to initialize: {}".format(err) )
+        pass
+    return buzzer
+
+class Qwiic_Buzzer( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "qwiic_buzzer", pn = "BOB-24474", address = 0x34, swob = qwiic_buzzer.QwiicBuzzer(i2c_driver = com_bus))
+        self.swob.configure( self.swob.VOLUME_MAX )
+        self.mute = False
+    def read(self):
+        pass
+    def beep(self):
+        if self.mute:
+            pass
+        else:
+            self.swob.on()
+    def stop(self):
+        self.swob.off()
+    def set(self, frequency_hz, time_ms ):
+        self.swob.configure( frequency_hz, time_ms )
+    def header(self):
+        return ""
+    def log(self):
+        return ""
+    def printlog(self):
+        print( self.log())
+
+class Null_Qwiic_Buzzer(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def beep(self):
+        pass
+    def stop(self):
+        pass
+    def set(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class scd30_CO2_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "scd30_CO2_sensor", pn = "scd30", address = 0x61, swob = adafruit_scd30.SCD30(com_bus))
+        self.cadence_s = 2.0 # default measurement interval
+        self.temperature_C = None
+        self.humidity = None
+        self.co2_ppm = None
+        self.co2_ppm_uncertainty = None
+    def data_ready(self):
+        return self.swob.data_available
+    def read(self):
+        # called once data_ready() has seen a new measurement; the driver's CO2, temperature and relative_humidity
+        # would each check the data ready flag again, so the measurement is read once and its values taken from it
+        self.swob._read_data()
+        self.temperature_C = self.swob._temperature
+        self.humidity = self.swob._relative_humidity
+        self.co2_ppm = self.swob._co2
+        self.co2_ppm_uncertainty = 30 + self.co2_ppm * 0.03
+    def header(self):
+        return "scd30_co2_ambient-!-ppm, scd30_co2_uncertainty-!-ppm, scd30_temperature_ambient-!-C, scd30_humidity_relative-!-percent"
+    def log(self):
+        return "{}, {}, {}, {}".format( round (self.co2_ppm, 1), round(self.co2_ppm_uncertainty, 1), round(self.temperature_C, 1) , int(round(self.humidity, 0)))
+    def printlog(self):
+        print( self.log())
+
+class Null_scd30_CO2_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class scd4x_CO2_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "scd4x_co2_sensor", pn = "scd4x", address = 0x62, swob = adafruit_scd4x.SCD4X( com_bus ))
+        self.cadence_s = 5.0 # periodic measurement interval
+        if self.swob:
+            self.swob.start_periodic_measurement()
+        self.temperature_C = None
+        self.humidity = None
+        self.co2_ppm = None
+    def data_ready(self):
+        return self.swob.data_ready
+    def read(self):
+        self.co2_ppm = self.swob.CO2
+        self.co2_uncty_ppm = 50 + self.co2_ppm * 0.05
+        self.temperature_C = self.swob.temperature
+        self.humidity = self.swob.relative_humidity
+    def header(self):
+        return "scd4x_co2_ambient-!-ppm, scd30_co2_uncertainty-!-ppm, scd4x_temperature_ambient-!-C, scd4x_humidity_relative-!-percent"
+    def log(self):
+        return "{}, {}, {}, {}".format( round(self.co2_ppm,1), round(self.co2_uncty_ppm,1), round(self.temperature_C,1), int(round(self.humidity,0)) )
+    def printlog(self):
+        print( self.log())
+
+class Null_scd4x_CO2_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+        self.temperature_C = None
+        self.humidity = None
+        self.co2_ppm = None
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+class vl53l1x_4m_Range_Sensor( Device ):
+    def __init__( self, com_bus ):
+        super().__init__(name = "vl53l1x_4m_range_sensor", pn = "vl53l1x", address = 0x29, swob = adafruit_vl53l1x.VL53L1X( com_bus ))
+        self.cadence_s = 0.1 # timing budget set below
+        #self.model_id, self.module_type, self.mask_rev = self.swob.instrument_model_info
+        #print("Model ID: 0x{:0X}".format(self.instrument_model_id))
+        #print("Module Type: 0x{:0X}".format(self.module_type))
+        #print("Mask Revision: 0x{:0X}".format(self.mask_rev))
+        self.swob.start_ranging()
+        self.swob.clear_interrupt()
+        self.swob.distance_instrument_mode = 2 # long distance instrument_mode
+        self.swob.timing_budget = 100
+        self.range_m = None
+    def data_ready(self):
+        return self.swob.data_ready
+    def read(self):
+        # called once data_ready() has seen a new range
+        self.range_m = self.swob.distance/100 #reports in cm for whatever reason
+    def header(self):
+        return "vl53l1x_distance-!-m"
+    def log(self):
+        return "{}".format( self.range_m )
+    def printlog(self):
+        print( self.log())
+
+class Null_vl53l1x_4m_Range_Sensor(Device):
+    def __init__( self ):
+        super().__init__(name = None, swob = None)
+    def read(self):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+    def header(self):
+        pass
+
+def calculate_aqi_p( p25_reading, p100_reading ):
+    gc.collect()
+    p25_break_points = (0, 12, 12.1, 35.4, 35.5, 55.4, 55.5, 150.4, 150.5, 250.4, 250.5, 350.4, 350.5, 500.4)
+    #print( p25_break_points )
+    p100_break_points = (0, 54, 55, 154, 155, 254, 255, 354, 355, 424, 425, 504, 505, 604)
+    #print( p100_break_points )
+    AQI_levels = (0, 50, 51, 100, 101, 150, 151, 200, 201, 300, 301, 400, 401, 500)
+    #print( AQI_levels )
+    p25_index = 0
+    p100_index = 0
+    for i in range (len(AQI_levels)-1):
+        if (p25_reading > p25_break_points[i] and p25_reading < p25_break_points[i+1]):
+            p25_index = i
+    #aqi = int((((ihi-ilo)/(bhi-blo))*(reading-blo))+ilo)
+    aqi25 = int((((AQI_levels[p25_index+1] - AQI_levels[p25_index])/(p25_break_points[p25_index+1] - p25_break_points[p25_index]))*(p25_reading-p25_break_points[p25_index]))+AQI_levels[p25_index])
+    #print(aqi25)
+    for n in range (len(AQI_levels)-1):
+        if (p100_reading > p100_break_points[i] and p100_reading < p100_break_points[i+1]):
+            p100_index = i
+    aqi100 = int((((AQI_levels[p100_index+1] - AQI_levels[p100_index])/(p100_break_points[p100_index+1] - p100_break_points[p100_index]))*(p100_reading-p25_break_points[p100_index]))+AQI_levels[p100_index])
+    #print(aqi100)
+    #print( p25_break_points[p25_index], p25_break_points[p25_index+1], AQI_levels[p25_index], AQI_levels[p25_index+1], p100_break_points[p100_index], p100_break_points[p100_index+1], AQI_levels[p100_index], AQI_levels[p100_index+1])
+    if aqi100 > aqi25:
+        return aqi100
+    else:
+        return aqi25
+
+def increment_select( page ):
+    select_value = (page.select_value + encoder_move) % page.number_of_select_positions
+
+# input events, a tuple with one of these first
+INPUT_PRESS = 0     # ( INPUT_PRESS, )
+
+INPUT_TURN = 1      # ( INPUT_TURN, +1 or -1 ), one per encoder step
+
+INPUT_TOUCH = 2     # ( INPUT_TOUCH, tx, ty ), when a touch starts
+
+class Input_Events:
+    # first in, first out inputs from the encoder and touch screen to the pages. Bounded: when the pages fall behind,
+    # inputs past the length are dropped rather than applied long after they were made.
+    def __init__( self, length ):
+        self.length = length
+        self.items = []
+        self.received = 0
+        self.presses = 0
+        self.dropped = 0
+    def put( self, event ):
+        self.received += 1
+        if event[0] == INPUT_PRESS:
+            self.presses += 1
+        if len( self.items ) >= self.length:
+            self.dropped += 1
+            return
+        self.items.append( event )
+    def get( self ):
+        if not self.items:
+            return None
+        return self.items.pop( 0 )
+
+def initialize_rotary_encoder( pin_a, pin_b, pin_button ):
+    encoder = Null_Rotary_Encoder()
+    try:
+        encoder = Rotary_Encoder( pin_a, pin_b, pin_button )
+    except Exception as err:
+        print( "encoder failed: {}".format(err))
+    return encoder
+
+class Rotary_Encoder( Device ):
+    # rotaryio counts the steps and keypad debounces the button and queues its presses in the background,
+    # a read collects what happened since the last one without missing a step or a press between reads
+    def __init__( self, pin_a, pin_b, pin_button ):
+        super().__init__(name = "rotary_encoder", pn = "encoder", address = 00, swob = rotaryio.IncrementalEncoder( pin_b, pin_a ))
+        self.keys = keypad.Keys(( pin_button, ), value_when_pressed = False, pull = True )
+        self.key_event = keypad.Event()
+        self.last_position = self.swob.position
+        self.press_event = ( INPUT_PRESS, )
+        self.turn_events = {  1: ( INPUT_TURN,  1 ),
+                             -1: ( INPUT_TURN, -1 ) }
+    def read_events( self, input_events ):
+        try:
+            while self.keys.events.get_into( self.key_event ):
+                if self.key_event.pressed:
+                    input_events.put( self.press_event )
+            position = self.swob.position
+            while position != self.last_position:
+                step = 1 if position > self.last_position else -1
+                self.last_position += step
+                input_events.put( self.turn_events[ step ] )
+        except Exception as err:
+            print( err )
+    def log(self):
+        pass
+    def printlog(self):
+        pass
+
+class Null_Rotary_Encoder(Device):
+    def __init__( self ):
+        self.swob = None
+    def read(self):
+        pass
+    def read_events( self, input_events ):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        print( "encoder failed to initialize" )
+    def printlog(self):
+        pass
+
+def initialize_touch_screen( bus, interrupt_pin_name = None ):
+    touch_screen = Null_Touch_Screen()
+    try:
+        touch_screen = Focal_Touch_Screen( bus )
+    except Exception as err:
+        print( "touch screen fail: {}".format(err))
+        return touch_screen
+    if interrupt_pin_name:
+        try:
+            import countio
+            touch_screen.interrupt_counter = countio.Counter( getattr( board, interrupt_pin_name ), edge = countio.Edge.FALL, pull = digitalio.Pull.UP )
+        except Exception as err:
+            print( "touch screen interrupt on {} failed, polling instead: {}".format( interrupt_pin_name, err ))
+    return touch_screen
+
+class Focal_Touch_Screen( Device ):
+    # the controller pulses its INT line once per report while a finger is on the panel. With the line counted the
+    # bus is read only when the count moves, otherwise touched is polled every preset_touch_poll_interval_s.
+    def __init__( self, com_bus ):
+        super().__init__(name = "touch_screen", pn = "FocalTouch", address = 0x38, swob = adafruit_focaltouch.Adafruit_FocalTouch(com_bus, debug=False))
+        self.flag = False
+        self.is_touched = False
+        self.was_touched = False
+        self.interrupt_counter = None
+        self.interrupt_count = 0
+        self.next_poll_time = 0
+    def read(self):
+        try:
+            self.is_touched = self.swob.touched
+            if self.is_touched:
+                #print( "touched" )
+                self.dict = self.swob.touches
+                self.tx = 320 - self.dict[0]['y'] #transform
+                self.ty = self.dict[0]['x'] #transform
+        except Exception as err:
+            print( err )
+    def read_events( self, input_events ):
+        if self.interrupt_counter is not None:
+            count = self.interrupt_counter.count
+            if count == self.interrupt_count:
+                # no report since the last check, the finger is off the panel
+                self.was_touched = False
+                return
+            self.interrupt_count = count
+        else:
+            now = time.monotonic()
+            if now < self.next_poll_time:
+                return
+            self.next_poll_time = now + preset_touch_poll_interval_s
+        self.read()
+        if self.is_touched and not self.was_touched:
+            input_events.put(( INPUT_TOUCH, self.tx, self.ty ))
+        self.was_touched = self.is_touched
+    def log(self):
+        pass
+    def printlog(self):
+        print( self.log())
+
+class Null_Touch_Screen(Device):
+    def __init__( self ):
+        self.swob = None
+        self.is_touched = False
+    def read(self):
+        pass
+    def read_events( self, input_events ):
+        pass
+    def log(self):
+        pass
+    def report(self):
+        pass
+    def printlog(self):
+        pass
+
+def initialize_display( spi_bus ):
+    try:
+        # displayio/dafruit_ili9341 library owns the pins until display release
+        displayio.release_displays()
+        tft_dc = board.D11
+        tft_cs = board.D12
+        display_bus = FourWire(spi_bus, command=tft_dc, chip_select=tft_cs )
+        display = adafruit_ili9341.ILI9341(display_bus, width=320, height=240, rotation=0)
+        print( "display initialized")
+
+    except ValueError as err:
+        print("Error: display failed to initialize {:}".format(err))
+        display = False
+    if display:
+        display_group = displayio.Group()
+        display.root_group = display_group
+    return display_group
+
+def initialize_uart( txpin, rxpin ):
+    try:
+        uart = busio.UART(txpin, rxpin, baudrate=9600, timeout=10)
+        print( "uart bus initialized" )
+    except:
+        uart = False
+    return uart
+
+def read_analog_in( pin ):
+    ain_counts = pin.value
+
+def read_5V_supply( pin ):
+    voltage = 2 * (pin.value * 3.3) / 65536
+
+def flash_indicator( lamp ):
+    flash_count = 4
+    flash_interval_s = 0.2
+    for index in range (0, flash_count):
+        lamp.value = True
+        time.sleep( flash_interval_s )
+        lamp.value = False
+        time.sleep( flash_interval_s )
+
+def initialize_led( pin ):
+    LED = digitalio.DigitalInOut( pin )
+    LED.direction = digitalio.Direction.OUTPUT
+    count = 4
+    interval = 0.1
+    if not preset_fast_boot:
+        LED.value = True
+        time.sleep(interval)
+        LED.value = False
+    return LED
+
+def initialize_neopixel( pin ):
+    try:
+        num_pixels = 1
+        ORDER = neopixel.RGB
+        neopixel_instance = neopixel.NeoPixel( pin, num_pixels, brightness=0.3, auto_write=True, pixel_order=ORDER )
+        print( "neopixel initialized" )
+    except:
+        neopixel_instance = False
+        print( "neopixel failed to initialize" )
+    return neopixel_instance
+
+def initialize_i2c_bus():
+    try:
+        i2c_bus = board.I2C() #TBD might need to limit speed to 100kHz for the mlx90614
+        print( "i2c bus initialized" )
+    except:
+        print( "i2c bus failed to initialize" )
+        i2c_bus = False
+    return i2c_bus
+
+def scan_i2c_bus( i2c_bus ):
+    i2c_addresses = set()
+    if not i2c_bus:
+        return i2c_addresses
+    while not i2c_bus.try_lock():
+        pass
+    try:
+        i2c_addresses = set( i2c_bus.scan() )
+    finally:
+        i2c_bus.unlock()
+    #print( [ hex( address ) for address in i2c_addresses ] )
+    return i2c_addresses
+
+def import_driver( module_name, attribute, global_name ):
+    # "from module import attribute as global_name", or "import module as global_name", made at run time
+    module = __import__( module_name )
+    for submodule_name in module_name.split( "." )[1:]:
+        module = getattr( module, submodule_name )
+    if attribute is not None:
+        module = getattr( module, attribute )
+    globals()[ global_name ] = module
+
+def initialize_sensors( instrument, i2c_addresses ):
+    # every registry sensor ends up in sensors_by_name, the device if it is found, otherwise its null stand in
+    for name, address, driver_imports, class_name, null_class_name, spectral, priority in sorted( SENSOR_REGISTRY, key = lambda entry: entry[6] ):
+        sensor = None
+        if address in i2c_addresses or address in UNSCANNED_SENSOR_ADDRESSES:
+            try:
+                for module_name, attribute, global_name in driver_imports:
+                    import_driver( module_name, attribute, global_name )
+                sensor = globals()[ class_name ]( instrument.i2c_bus )
+                instrument.welcome_page.announce( "initialize_{}".format( name ))
+                if spectral:
+                    instrument.spectral_sensors_present.append( sensor )
+                else:
+                    instrument.sensors_present.append( sensor )
+                sensor.startup()
+            except ImportError as err:
+                print( "{} driver missing: {}".format( name, err ))
+            except Exception as err:
+                #print( "{} failed: {}".format( name, err ))
+                pass
+        if sensor is None:
+            sensor = globals()[ null_class_name ]()
+        instrument.sensors_by_name[ name ] = sensor
+    instrument.spectrometry = len( instrument.spectral_sensors_present ) > 0
+    gc.collect()
+    return instrument.sensors_by_name
+
+def initialize_sd_card( spi_bus, sd_cs_pin ):
+    try:
+        sdcard = sdcardio.SDCard( spi_bus, sd_cs_pin )
+        vfs = storage.VfsFat(sdcard)
+        storage.mount(vfs, "/sd")
+        print( "SD card initialized" )
+    except Exception as err:
+        print("SD card fail: missing or full: {}".format(err))
+        print( "*** The card may be missing, or you may need to create a folder named sd in the root directory of CIRCUITPY ***" )
+        vfs = False
+    return vfs
@@ -0,0 +1,1282 @@
+# STELLA-1.2 instrument core: main(), the instrument state, spectra, sample queue and the asyncio tasks
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+from stella.clock import *
+from stella.devices import *
+from stella.data_logging import *
+from stella.pages import *
+from stella.usb_data import *
+
+def main( startup_start_time, start_mem_free_kB ):
+    # code.py passes the time and free memory from before any import, so the startup report covers loading these modules
+    startup_profiler = create_startup_profiler( startup_start_time, start_mem_free_kB * 1000 )
+    startup_profiler.mark( "imports", imports_end_time, mem_free_after_imports )
+    startup_profiler.mark( "module definitions" )
+    displayio.release_displays()
+    UID = get_uid()
+    spi_bus = board.SPI()
+    vfs = initialize_sd_card( spi_bus, board.A5 )
+    i2c_bus = initialize_i2c_bus()
+    i2c_addresses = scan_i2c_bus( i2c_bus )
+    gps_uart_bus = initialize_uart( board.TX, board.RX )
+    onboard_neopixel = initialize_neopixel( board.NEOPIXEL )
+    if vfs:
+        onboard_neopixel.fill(YELLOW)
+    else:
+        onboard_neopixel.fill(RED)
+    buzzer = initialize_qwiic_buzzer( i2c_bus, i2c_addresses )
+    buzzer.mute = False
+    buzzer.set(932, 130) # frequency in Hz, time in ms. 932 Hz is B flat in octave 5. Fairly pleasant through this piezo driver, though maybe a bit medical in tone.
+    buzzer.beep()
+    battery_indicator = initialize_led( board.LED )
+    startup_profiler.mark( "buses, sd card, indicators" )
+
+    instrument = create_instrument( i2c_bus, spi_bus, gps_uart_bus, UID, buzzer )
+    instrument.welcome_page.show()
+    spectral_register = create_spectral_register( instrument )
+    create_reference_store( instrument, vfs )
+    create_data_file_manager( instrument, vfs )
+    startup_profiler.mark( "display, clock, welcome page" )
+
+    # supported sensors, from SENSOR_REGISTRY in devices.py
+    initialize_sensors( instrument, i2c_addresses )
+    as7265x_spectrometer = instrument.sensors_by_name[ "as7265x_spectrometer" ]
+    hdc3022_air_sensor = instrument.sensors_by_name[ "hdc3022_air_sensor" ]
+    mlx90614_surface_thermometer = instrument.sensors_by_name[ "mlx90614_surface_thermometer" ]
+    instrument.welcome_page.announce( "Found {} external sensors".format( len(instrument.sensors_present) + len(instrument.spectral_sensors_present)))
+    sense_5V = AnalogIn(board.A1)
+    analog_in_0 = AnalogIn(board.A0)
+    if mlx90614_surface_thermometer.pn and as7265x_spectrometer.pn:
+        lv_ez_mb1013_rangefinder = initialize_lv_ez_mb1013_rangefinder( instrument, analog_in_0, sense_5V )
+    else:
+        lv_ez_mb1013_rangefinder = False
+    spectral_register.target_sensors = [ sensor for sensor in ( lv_ez_mb1013_rangefinder, mlx90614_surface_thermometer, hdc3022_air_sensor ) if sensor in instrument.sensors_present ]
+    battery_monitor = initialize_battery_monitor( instrument )
+    gps = initialize_gps( instrument )
+
+
+    #plus_5v_supply = False #TBD make a device object with digital out and analog in, check it for rising and falling
+    enable_5V = digitalio.DigitalInOut( board.D10 )
+    enable_5V.direction = digitalio.Direction.OUTPUT
+    enable_5V.value = True
+    # plus_5v_supply.enable(), .read(), .log(), .disable()
+    startup_profiler.mark( "sensors" )
+
+    # the controls bar is always on screen, every other page is built the first time it is shown
+    controls_page = make_controls_page( instrument, gps, battery_monitor ) #1
+    page_cache = instrument.page_cache
+    page_cache.add( 2, make_main_menu_page, ( instrument, ))
+    page_cache.add( 3, make_status_page, ( instrument, ))
+    page_cache.add( 4, make_settings_page, ( instrument, ))
+    page_cache.add( 5, make_sensor_list_page, ( instrument, ))
+    page_cache.add( 6, make_generic_sensor_page, ( instrument, ))
+    page_cache.add( 7, make_time_place_page, ( instrument, ))
+    page_cache.add( 8, make_air_analyzer_page, ( instrument, ))
+    if instrument.spectrometry:
+        page_cache.add( 9, make_remote_sensing_pages, ( instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder ), companions = [ 10 ] )
+        instrument.active_page_number = 9
+    else:
+        page_cache.add( 9, make_remote_sensing_missing_page, ( instrument, )) #9 alt
+    startup_profiler.mark( "controls bar" )
+
+    instrument.make_band_list()
+    instrument.make_header()
+
+
+    try:
+        if vfs:
+            onboard_neopixel.fill(GREEN)
+        for sensor in instrument.sensors_present:
+            # fast boot: the first sample reads the sensors without a cadence moments from now
+            if ( sensor.cadence_s or not preset_fast_boot ) and sensor.data_ready():
+                sensor.refresh()
+        gps.read()
+        controls_page.update_values( instrument )
+        loop_benchmark = initialize_loop_benchmark( instrument, vfs )
+        data_logger = initialize_data_logger( instrument, vfs )
+        create_storage_manager( instrument, vfs )
+        create_usb_data_stream( instrument, vfs )
+        initialize_autoexposure( instrument )
+        task_scheduler = create_task_scheduler( instrument, controls_page, battery_monitor, onboard_neopixel, loop_benchmark, data_logger, vfs )
+        task_scheduler.startup_profiler = startup_profiler
+        if preset_fast_boot:
+            task_scheduler.deferred_startup.append( gps.finish_startup )
+        startup_profiler.mark( "header, data file, scheduler" )
+        asyncio.run( task_scheduler.run() )
+
+        #TBD announce exit message and clean up
+
+    finally:
+        if instrument.task_scheduler:
+            instrument.task_scheduler.write_queued_samples()
+        instrument.data_logger.close()
+        instrument.data_file_manager.save()
+        print( "data file closed" )
+        displayio.release_displays()
+        print( "displayio displays released" )
+        i2c_bus.deinit()
+        print( "i2c_bus deinitialized" )
+
+class Instrument:
+    def __init__( self, i2c_bus, spi_bus, uart_bus, UID, buzzer):
+        self.i2c_bus = i2c_bus
+        self.uart_bus = uart_bus
+        self.device_type = DEVICE_TYPE
+        self.uid = UID
+        self.buzzer = buzzer
+        self.usb_serial_out_enabled = usb_serial_out_enabled
+        self.sample_interval_s = preset_sample_interval_s
+        self.burst_count = preset_burst_count
+        # data file layout, the storage manager may move these on when the card fills
+        self.log_binary = preset_log_binary
+        self.burst_summary_only = preset_burst_summary_only
+        self.storage_manager = None
+        self.data_file_manager = None
+        self.usb_data_stream = None
+        self.pages_list = []
+        self.palette = make_palette()
+        self.main_display_group = initialize_display( spi_bus )
+        self.page_cache = create_page_cache( self )
+        self.welcome_page = make_welcome_page( self )
+        self.hardware_clock = initialize_hardware_clock( i2c_bus )
+        #self.hardware_clock.report()
+        self.hardware_clock.sync_system_clock()
+        self.clock_battery_ok_text =  "clock battery OK: {}".format( self.hardware_clock.battery_ok() )
+        self.welcome_page.announce( self.clock_battery_ok_text )
+        self.update_time()
+        self.last_datestamp = self.datestamp
+        self.batch_number = update_batch(self.datestamp)
+        print( "batch number = {}".format( self.batch_number ))
+        self.filename = None
+        self.data_logger = Null_Data_Logger()
+        self.task_scheduler = None
+        self.spectral_register = None
+        self.reference_store = None
+        self.log_reflectance = False
+        self.autoexposure_controllers = {}
+        self.sensors_present = []
+        self.spectral_sensors_present = []
+        self.sensors_by_name = {}
+        self.spectrometry = False
+        self.record = record_on_startup
+        self.session_tag = "{}-{}-session-".format(self.uid, self.iso_time)
+        self.measurement_counter = 0
+        self.rotary_encoder = initialize_rotary_encoder( pin_a = board.A3, pin_b = board.A4, pin_button = board.A2 )
+        self.encoder_increment = 0
+        self.button_pressed = False
+        self.touch_screen = initialize_touch_screen( self.i2c_bus, preset_touch_interrupt_pin )
+        self.input_events = Input_Events( preset_input_event_queue_length )
+        self.touch_tx = 0
+        self.touch_ty = 0
+        self.input_flag = False
+        self.input_interval_start = 0
+        self.input_interval = 1
+        self.active_page_number = 2
+        self.last_active_page_number = 0
+        self.take_burst = False
+        self.main_menu_select = 6  # default to first main menu item selected
+        self.main_menu_select_count = 17
+        self.remote_sensing_select = 2  # default to record/pause
+        self.remote_sensing_select_count = 17
+    def update_batch(self):
+        self.batch_number = update_batch(self.datestamp)
+    def update_time(self):
+        # one snapshot, so the timestamp, decimal hour and datestamp of a row always agree
+        self.hardware_clock.snapshot()
+        self.datestamp = self.hardware_clock.datestamp
+        self.iso_time = self.hardware_clock.iso_time
+        self.decimal_time = self.hardware_clock.decimal_hour
+    def update_filename(self):
+        self.data_logger.close()
+        update_filename( self )
+        print( "filename_in_use:", self.filename )
+    def calendar_day_changed( self ):
+        return self.datestamp != self.last_datestamp
+    def start_calendar_day( self ):
+        # called by the sample task once the previous day's samples are written
+        self.last_datestamp = self.datestamp
+        print( "new calendar day, updating system values" )
+        self.update_batch()
+        self.update_filename()
+        self.session_tag = "{}-{}-session-".format(self.uid, self.iso_time)
+        self.measurement_counter = 0
+    def make_band_list( self ):
+        # the instrument's band slots are the places in the sorted band list; the live spectrum and the reference
+        # spectra are arrays indexed by them, and each spectral sensor's spectrum_slots says where its own bands go
+        self.wavelength_bands_list = []
+        band_owners = []
+        for sensor_index in range( 0, len( self.spectral_sensors_present )):
+            for band in self.spectral_sensors_present[sensor_index].bands:
+                self.wavelength_bands_list.append(band)
+                band_owners.append(( band, sensor_index ))
+        band_owners.sort()
+        self.wavelength_bands_list_sorted = [ band for band, sensor_index in band_owners ]
+        # the routing table for the data file rows: each band once, in order, with the ( sensor, band slot ) pairs that measure it
+        self.band_routes = []
+        route_band = None
+        for spectrum_slot in range( 0, len( band_owners )):
+            band, sensor_index = band_owners[spectrum_slot]
+            sensor = self.spectral_sensors_present[sensor_index]
+            slot = sensor.band_slots[band]
+            sensor.spectrum_slots[slot] = spectrum_slot
+            if band != route_band:
+                self.band_routes.append( [] )
+                route_band = band
+            self.band_routes[-1].append(( sensor, slot ))
+        #print( "line 411 -- wavelength_bands_list_sorted: ")
+        #print( self.wavelength_bands_list_sorted  )
+        self.number_of_plot_points = len( self.wavelength_bands_list_sorted )
+        if self.spectral_register:
+            self.spectral_register.make_spectrum_buffers()
+        #print( "number of bands: ", end = "")
+        #print( self.number_of_plot_points )
+    def make_header( self ):
+        self.header = "unique_identifier"
+        self.header += ", unique_measurement_number"
+        self.header += ", timestamp-!-iso8601utc"
+        self.header += ", batch_number"
+        self.header += ", burst_counter"
+        self.header += ", decimal_time-!-hour"
+        self.system_header = self.header
+        spectral_header_list = []
+        spectral_header_list.append( "spectral_sensor_part_number" )
+        spectral_header_list.append( "spectral_wavelength-!-nm" )
+        spectral_header_list.append( "spectral_bandwidth-!-nm" )
+        spectral_header_list.append( "spectral_photodetector_digital_number-!-counts" )
+        spectral_header_list.append( "spectral_irradiance-!-uW_per_cm_sq" )
+        spectral_header_list.append( "spectral_uncertainty_in_irradiance-!-uW_per_cm_sq" )
+        spectral_header_list.append( "spectral_gain-!-" )
+        spectral_header_list.append( "spectral_integration_time-!-ms" )
+        spectral_header_list.append( "spectral_detector_chip_number" )
+        spectral_header_list.append( "spectral_detector_chip_temperature-!-C" )
+        self.log_reflectance = preset_log_reflectance and self.spectrometry and self.reference_store is not None
+        if self.log_reflectance:
+            spectral_header_list.append( "spectral_reflectance-!-" )
+        self.spectral_header_count = len( spectral_header_list )
+        if self.spectrometry:
+            for item in spectral_header_list:
+                self.header += ", {}".format( item )
+        for sensor in self.sensors_present:
+            self.header += ", "
+            self.header += sensor.header()
+            if sensor.cadence_s:
+                self.header += ", {}_data_age-!-s".format( sensor.name )
+        self.header += ("\n")
+        #print( self.header )
+        #print( "spectral_header_count: ", self.spectral_header_count )
+        self.make_log_templates()
+        # the binary description is also the usb data stream's header, so it is made for text logging too
+        self.make_binary_header()
+        if self.log_binary:
+            self.file_header = self.binary_header
+            self.file_extension = "bin"
+        else:
+            self.file_header = self.header
+            self.file_extension = "csv"
+        self.update_filename()
+    def make_log_templates( self ):
+        # format strings for every data file row, built once per sensor configuration so each row is one format call
+        # band rows follow the band routes, the sensors that log each band and where in their readings it is
+        self.system_log_template = "{}, {{}}{{}}, {{}}, {{}}, {{}}, {{}}".format( self.uid )
+        if self.spectrometry:
+            self.system_row_template = "{}" + ", - " * self.spectral_header_count + "{}\n"
+        else:
+            self.system_row_template = "{}{}\n"
+        self.band_rows = self.band_routes
+        self.band_row_templates = []
+        self.band_row_lengths = []      # values each band row takes, to split the flat list of band values
+        for spectral_sensor in self.spectral_sensors_present:
+            spectral_sensor.make_log_templates()
+        for row in self.band_rows:
+            row_template = "{}"
+            row_length = 0
+            for spectral_sensor, slot in row:
+                row_template += ", " + spectral_sensor.log_templates[slot]
+                row_length += len( spectral_sensor.binary_layout )
+                if self.log_reflectance:
+                    row_template += ", {}"
+                    row_length += 1
+            self.band_row_templates.append( row_template + "\n" )
+            self.band_row_lengths.append( row_length )
+    def format_sample_rows( self, system_log ):
+        # text logging: one system row, then one row per band
+        rows = [ self.system_row_template.format( system_log, self.get_sensor_log() ) ]
+        values = [ system_log ]
+        for index in range( 0, len( self.band_rows )):
+            del values[1:]
+            for spectral_sensor, slot in self.band_rows[index]:
+                values.extend( spectral_sensor.log_values( slot ))
+                if self.log_reflectance:
+                    values.append( self.reference_store.sensor_reflectance( spectral_sensor, slot ))
+            rows.append( self.band_row_templates[index].format( *values ))
+        return rows
+    def make_binary_header( self ):
+        # the binary data file starts with a description of every row, each record after it is only the values that change
+        binary_format = "<"
+        band_templates = []
+        for row in self.band_rows:
+            row_templates = []
+            for spectral_sensor, slot in row:
+                template = spectral_sensor.log_templates[slot]
+                layout = spectral_sensor.binary_layout
+                if self.log_reflectance:
+                    template += ", {}"
+                    layout += "f"
+                row_templates.append({ "template": template, "layout": layout })
+                binary_format += layout.replace( "r", "f" )
+            band_templates.append( row_templates )
+        self.binary_values_format = binary_format
+        description = {
+            "format_version": 1,
+            "device_type": self.device_type,
+            "software_version": SOFTWARE_VERSION_NUMBER,
+            "uid": self.uid,
+            "csv_header": self.header,
+            "spectrometry": self.spectrometry,
+            "spectral_placeholder_count": self.spectral_header_count,
+            "bands": band_templates
+            }
+        self.last_binary_session_tag = None
+        self.binary_description = json.dumps( description ).encode()
+        self.binary_header = b"STELLA1B" + pack_binary_block( b"H", self.binary_description )
+    def pack_binary_record( self ):
+        # call after get_system_log() and the sensor reads
+        record = b""
+        if self.session_tag != self.last_binary_session_tag:
+            self.last_binary_session_tag = self.session_tag
+            record += pack_binary_block( b"S", self.session_tag.encode())
+        record += pack_binary_block( b"R", self.pack_binary_payload() )
+        return record
+    def pack_binary_payload( self ):
+        # the R block of the sample just read: counters, time, the sensor text, then the band values
+        timenow = self.hardware_clock.timenow
+        sensor_text = self.get_sensor_log().encode()
+        values = self.band_values()
+        payload = struct.pack( "<IHHHBBBBBH", self.measurement_counter, self.batch_number, self.burst_counter,
+                               timenow.tm_year, timenow.tm_mon, timenow.tm_mday, timenow.tm_hour, timenow.tm_min, timenow.tm_sec,
+                               len( sensor_text ))
+        payload += sensor_text
+        payload += struct.pack( self.binary_values_format, *values )
+        return payload
+    def band_values( self ):
+        # every value of the band rows, in row order
+        values = []
+        for row in self.band_rows:
+            for spectral_sensor, slot in row:
+                values.extend( spectral_sensor.log_values( slot ))
+                if self.log_reflectance:
+                    values.append( self.reference_store.sensor_reflectance( spectral_sensor, slot ))
+        return values
+    def format_statistics_rows( self, burst_statistics ):
+        # a system row and band rows for each statistic, laid out like the sample rows with the statistic in the burst_counter column
+        rows = []
+        for statistic_index in range( 0, len( burst_statistics.statistic_names )):
+            system_log = self.system_log_template.format( self.session_tag, self.measurement_counter - 1, self.iso_time, self.batch_number,
+                                                          burst_statistics.statistic_names[ statistic_index ], self.decimal_time )
+            sensor_text = ""
+            for value in burst_statistics.sensor_statistics.row( statistic_index ):
+                sensor_text += ", {}".format( value )
+            rows.append( self.system_row_template.format( system_log, sensor_text ))
+            values = burst_statistics.band_statistics.row( statistic_index )
+            start = 0
+            for index in range( 0, len( self.band_rows )):
+                end = start + self.band_row_lengths[index]
+                rows.append( self.band_row_templates[index].format( system_log, *values[start:end] ))
+                start = end
+        return rows
+    def pack_binary_statistics( self, burst_statistics ):
+        # one U block per statistic: the R record layout with the statistic number in the burst counter field and every band value a float
+        record = b""
+        timenow = self.hardware_clock.timenow
+        for statistic_index in range( 0, len( burst_statistics.statistic_names )):
+            sensor_text = ""
+            for value in burst_statistics.sensor_statistics.row( statistic_index ):
+                sensor_text += ", {}".format( value )
+            sensor_text = sensor_text.encode()
+            values = burst_statistics.band_statistics.row( statistic_index, missing = float( "nan" ))
+            payload = struct.pack( "<IHHHBBBBBH", self.measurement_counter - 1, self.batch_number, statistic_index,
+                                   timenow.tm_year, timenow.tm_mon, timenow.tm_mday, timenow.tm_hour, timenow.tm_min, timenow.tm_sec,
+                                   len( sensor_text ))
+            payload += sensor_text
+            payload += struct.pack( "<{}f".format( len( values )), *values )
+            record += pack_binary_block( b"U", payload )
+        return record
+    def hide_all_pages( self ):
+        hide_all_pages( self.pages_list )
+    def build_unique_measurement_number( self ):
+        self.unique_measurement_number = "{}{}".format(self.session_tag, self.measurement_counter)
+        return self.unique_measurement_number
+    def get_sensor_log( self ):
+        # devices read on their own cadence log their latest value and its age in seconds
+        sensor_text = ""
+        for sensor in self.sensors_present:
+            sensor_text += ", "
+            sensor_text += sensor.log()
+            if sensor.cadence_s:
+                sensor_text += ", {}".format( sensor.age_s() )
+        self.sensor_log = sensor_text
+        return sensor_text
+    def get_system_log( self ):
+        self.update_time()
+        return self.system_log_template.format( self.session_tag, self.measurement_counter,
+                                                self.iso_time, self.batch_number, self.burst_counter, self.decimal_time )
+    def check_inputs( self ):
+        # collect the inputs the hardware captured since the last check, the display task applies them one per frame
+        events_before = self.input_events.received
+        presses_before = self.input_events.presses
+        self.rotary_encoder.read_events( self.input_events )
+        self.touch_screen.read_events( self.input_events )
+        if self.input_events.presses != presses_before:
+            self.buzzer.beep()
+        if self.input_events.received != events_before:
+            self.input_flag = True
+            self.input_interval_start = time.monotonic()
+    def apply_input_event( self ):
+        event = self.input_events.get()
+        if event is None:
+            return
+        if event[0] == INPUT_PRESS:
+            self.button_pressed = True
+        elif event[0] == INPUT_TURN:
+            self.encoder_increment = event[1]
+        elif event[0] == INPUT_TOUCH:
+            self.touch_tx = event[1]
+            self.touch_ty = event[2]
+    def add_spectral_graph_page( self, spectral_graph_page ):
+        self.spectral_graph_page = spectral_graph_page
+    def show_active_page( self ):
+        if self.active_page_number != self.last_active_page_number:
+            self.last_active_page_number = self.active_page_number
+            # built here the first time it is shown
+            page = self.page_cache.get( self.active_page_number )
+            hide_all_pages( self.pages_list )
+            page.show()
+            if self.active_page_number == 2 or self.active_page_number == 9: # main menu, remote sensing
+                self.pages_list[ 1 ].show()  # controls
+            if self.active_page_number == 9:
+                if self.spectrometry:
+                    self.pages_list[ 10 ].show() # spectral graph
+    def update_active_page( self ):
+        # the page shown, an input handled by update_values may already have moved active_page_number on
+        page_number = self.last_active_page_number
+        self.apply_input_event()
+        self.pages_list[ page_number ].update_values( self )
+        if page_number == 9:
+            if self.spectrometry:
+                self.spectral_graph_page.update_plot_data()
+        if self.encoder_increment != 0:
+            if self.active_page_number == 2:
+                self.main_menu_select = (self.main_menu_select + self.encoder_increment) % self.main_menu_select_count
+            if self.active_page_number == 9:
+                self.remote_sensing_select = (self.remote_sensing_select + self.encoder_increment) % self.remote_sensing_select_count
+            self.encoder_increment = 0
+
+def pack_binary_block( tag, payload ):
+    # one byte tag, two byte little endian length, payload
+    return tag + struct.pack( "<H", len( payload )) + payload
+
+class Running_Statistics:
+    # Welford's running mean and variance, with min and max, for each position of a list of values added one sample at a time.
+    # Text and nan values are not counted, a text position reports the last text seen.
+    def __init__( self ):
+        self.start( 0 )
+    def start( self, size ):
+        self.size = size
+        self.count = [ 0 ] * size
+        self.mean = [ 0.0 ] * size
+        self.m2 = [ 0.0 ] * size
+        self.minimum = [ None ] * size
+        self.maximum = [ None ] * size
+        self.text = [ None ] * size
+    def add( self, values ):
+        if len( values ) != self.size:
+            # the layout changed (a sensor's log got longer or shorter), the statistics start again
+            self.start( len( values ))
+        for index in range( 0, len( values )):
+            value = values[index]
+            if isinstance( value, str ):
+                try:
+                    value = float( value )
+                except ValueError:
+                    self.text[index] = value.strip()
+                    continue
+            if isinstance( value, bool ) or value != value:
+                self.text[index] = value
+                continue
+            count = self.count[index] + 1
+            self.count[index] = count
+            delta = value - self.mean[index]
+            self.mean[index] += delta / count
+            self.m2[index] += delta * ( value - self.mean[index] )
+            if count == 1 or value < self.minimum[index]:
+                self.minimum[index] = value
+            if count == 1 or value > self.maximum[index]:
+                self.maximum[index] = value
+    def row( self, statistic_index, missing = "-" ):
+        # statistic_index follows Burst_Statistics.statistic_names: mean, std, min, max, n
+        values = []
+        for index in range( 0, self.size ):
+            count = self.count[index]
+            if statistic_index == 4:
+                values.append( count )
+            elif count == 0:
+                if self.text[index] is None or not isinstance( missing, str ):
+                    values.append( missing )
+                else:
+                    values.append( self.text[index] )
+            elif statistic_index == 0:
+                values.append( self.mean[index] )
+            elif statistic_index == 1:
+                if count > 1:
+                    values.append( math.sqrt( self.m2[index] / ( count - 1 )))
+                else:
+                    values.append( 0.0 )
+            elif statistic_index == 2:
+                values.append( self.minimum[index] )
+            else:
+                values.append( self.maximum[index] )
+        return values
+
+class Burst_Statistics:
+    # the band values and the sensor columns of the system row, accumulated over one burst
+    statistic_names = "mean", "std", "min", "max", "n"
+    def __init__( self ):
+        self.band_statistics = Running_Statistics()
+        self.sensor_statistics = Running_Statistics()
+        self.samples = 0
+    def start( self ):
+        self.band_statistics.start( 0 )
+        self.sensor_statistics.start( 0 )
+        self.samples = 0
+    def add( self, instrument ):
+        # call after the sample is formatted, so the sensor columns are the ones just logged
+        self.band_statistics.add( instrument.band_values() )
+        self.sensor_statistics.add( instrument.sensor_log.split( "," )[1:] )
+        self.samples += 1
+
+def create_instrument( i2c_bus, spi_bus, uart_bus, UID, buzzer ):
+    instrument = Instrument( i2c_bus, spi_bus, uart_bus, UID, buzzer )
+    return instrument
+
+class Spectral_Register:
+    def __init__( self, instrument ):
+        self.instrument = instrument
+        self.scale_linear = True
+        self.y_axis_irradiance = True
+        self.scope = 0
+        self.number_of_scope_choices = 6
+        self.autoexposure = preset_autoexposure_on_startup
+        self.lamps_on = False
+        self.five_x_values = [[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0],[0,0,0,0,0]]
+        self.data_source = 0
+        self.number_of_data_source_choices = 3
+        self.x_axis_units = 0
+        self.number_of_x_axis_units_choices = 4
+        self.live = True
+        self.number_of_plot_points = 0
+        self.show_table = False
+        self.wavelength_range = (410, 1000)
+        self.wavelengths_to_plot = []
+        # the latest spectrum, taken once by the sampling task and shared by the data file and the live graph,
+        # in the instrument's band slots
+        self.spectrum_counts = array.array( "H" )
+        self.spectrum_irradiance = array.array( "f" )
+        self.spectrum_time = None
+        self.spectrum_sequence = 0
+        # range, surface and air temperature describe the target of the spectrum, the sampling task reads them with each one
+        self.target_sensors = []
+        self.reference_store = None
+    def make_spectrum_buffers( self ):
+        length = len( self.instrument.wavelength_bands_list_sorted )
+        self.spectrum_counts = array.array( "H", [ 0 ] * length )
+        self.spectrum_irradiance = array.array( "f", [ 0 ] * length )
+        if self.reference_store:
+            self.reference_store.make_spectrum_buffers()
+    def publish_spectrum( self ):
+        for spectral_sensor in self.instrument.spectral_sensors_present:
+            copy_to_spectrum( spectral_sensor, spectral_sensor.counts, self.spectrum_counts )
+            copy_to_spectrum( spectral_sensor, spectral_sensor.irradiance, self.spectrum_irradiance )
+        self.spectrum_time = time.monotonic()
+        self.spectrum_sequence += 1
+        if self.reference_store:
+            self.reference_store.update()
+    def preview_due( self ):
+        # a reference or dark capture takes spectra back to back until it has its average
+        if self.reference_store and self.reference_store.capture_kind and self.instrument.spectral_sensors_present:
+            return True
+        # between samples the live graph still needs a spectrum now and then, taken only while it is on screen
+        if not preset_spectrum_preview_interval_s or not self.live or not self.instrument.spectral_sensors_present:
+            return False
+        if self.instrument.record or self.instrument.active_page_number != 9:
+            return False
+        return self.spectrum_time is None or time.monotonic() > self.spectrum_time + preset_spectrum_preview_interval_s
+    def calculate_five_x_values( self ):
+        c_m_per_s = 299792458
+        nm_per_m = 10**9
+        Hz_per_THz = 10**12
+        h_e_V_per_Hz = 4.135667696/10**15
+        self.five_x_values[0][2] = int( (self.five_x_values[0][0] + self.five_x_values[0][4])/2 )
+        self.five_x_values[0][1] = int( (self.five_x_values[0][0] + self.five_x_values[0][2])/2 )
+        self.five_x_values[0][3] = int( (self.five_x_values[0][2] + self.five_x_values[0][4])/2 )
+        for index in range( 0, 5 ):
+            self.five_x_values[1][index] = int((c_m_per_s / ((self.five_x_values[0][index])/nm_per_m))/Hz_per_THz) # frequency
+            self.five_x_values[2][index] = round((self.five_x_values[1][index]* Hz_per_THz)*h_e_V_per_Hz,1)  # energy
+            self.five_x_values[3][index] = int( 10000000/self.five_x_values[0][index] )  # wave number
+
+def create_spectral_register( instrument ):
+    spectral_register = Spectral_Register( instrument )
+    instrument.spectral_register = spectral_register
+    return spectral_register
+
+NAN = float( "nan" )
+
+def copy_to_spectrum( spectral_sensor, values, spectrum ):
+    # a sensor's values, in its band slots, into their slots of an instrument wide spectrum
+    spectrum_slots = spectral_sensor.spectrum_slots
+    for slot in range( 0, len( spectrum_slots )):
+        spectrum[ spectrum_slots[slot] ] = values[slot]
+
+def sum_spectra( total, values ):
+    if ulab_numpy:
+        return total + ulab_numpy.array( values, dtype = ulab_numpy.float )
+    return [ a + b for a, b in zip( total, values )]
+
+def zero_spectrum( length ):
+    if ulab_numpy:
+        return ulab_numpy.zeros( length, dtype = ulab_numpy.float )
+    return [ 0.0 ] * length
+
+def divide_spectra( sample, reference, reference_scale, dark, dark_scale, result ):
+    # ( sample - dark ) / ( reference - dark ) band by band into result, the reference and dark scaled to the sample's
+    # exposure, the divisor kept at one count or more so a band with no signal in the reference reads 0, not infinity
+    if ulab_numpy:
+        sample = ulab_numpy.array( sample, dtype = ulab_numpy.float )
+        reference = ulab_numpy.array( reference, dtype = ulab_numpy.float ) * reference_scale
+        if dark is not None:
+            dark = ulab_numpy.array( dark, dtype = ulab_numpy.float ) * dark_scale
+            sample = sample - dark
+            reference = reference - dark
+        fill_band_buffer( result, sample / ulab_numpy.maximum( reference, 1 ))
+        return
+    for index in range( 0, len( result )):
+        dark_counts = 0
+        if dark is not None:
+            dark_counts = dark[index] * dark_scale
+        result[index] = ( sample[index] - dark_counts ) / max( reference[index] * reference_scale - dark_counts, 1 )
+
+def sensor_exposure( spectral_sensor ):
+    # gain ratio and integration time ms; a sensor that doesn't set them on the chip counts as gain 1, no integration time
+    return getattr( spectral_sensor, "gain_ratio", 1 ), getattr( spectral_sensor, "intg_time_ms", 0 )
+
+class Reference_Store:
+    # averaged reference and dark spectra per spectral sensor, gain and integration time, read from the SD card once at
+    # startup and written back after each capture, and the reflectance of each new spectrum against them
+    def __init__( self, instrument, vfs ):
+        self.instrument = instrument
+        self.vfs = vfs
+        self.filename = "/sd/reference_spectra.json"
+        self.spectra = {}           # exposure key: pn, gain_ratio, intg_time_ms, bands, and the "reference" and "dark" averages
+        self.latest_keys = {}       # ( pn, kind ): exposure key of the latest capture, used once the exposure has moved on
+        self.capture_kind = None
+        self.capture_sums = {}      # pn: [ sensor, exposure key, spectra summed, counts sum, irradiance sum ]
+        self.sequence = 0           # finished captures, the graph redraws when it changes
+        self.status = ""
+        # the latest spectrum's s/ref and the references in use, in the instrument's band slots for the graph,
+        # nan in the slots of a sensor with no reference
+        self.reflectance = array.array( "f" )
+        self.reference_counts = array.array( "f" )
+        self.reference_irradiance = array.array( "f" )
+        self.reflectance_by_sensor = {}     # pn: s/ref in the sensor's band slots
+        self.has_reference = False
+        self.load()
+    def make_spectrum_buffers( self ):
+        length = len( self.instrument.wavelength_bands_list_sorted )
+        self.reflectance = array.array( "f", [ NAN ] * length )
+        self.reference_counts = array.array( "f", [ NAN ] * length )
+        self.reference_irradiance = array.array( "f", [ NAN ] * length )
+        self.reflectance_by_sensor = {}
+        for spectral_sensor in self.instrument.spectral_sensors_present:
+            self.reflectance_by_sensor[ spectral_sensor.pn ] = array.array( "f", [ NAN ] * len( spectral_sensor.bands ))
+    def exposure_key( self, spectral_sensor ):
+        gain_ratio, intg_time_ms = sensor_exposure( spectral_sensor )
+        return "{} {} {}".format( spectral_sensor.pn, gain_ratio, intg_time_ms )
+    def start_capture( self, kind ):
+        self.capture_kind = kind
+        self.capture_sums = {}
+        self.status = ""
+    def find( self, spectral_sensor, kind ):
+        # the average taken at this exposure, or the latest one scaled by gain x integration time
+        entry = self.spectra.get( self.exposure_key( spectral_sensor ))
+        if entry and kind in entry:
+            return entry[kind], 1
+        key = self.latest_keys.get(( spectral_sensor.pn, kind ))
+        if key is None:
+            return None, 1
+        entry = self.spectra[key]
+        exposure = entry["gain_ratio"] * entry["intg_time_ms"]
+        if not exposure:
+            return entry[kind], 1
+        gain_ratio, intg_time_ms = sensor_exposure( spectral_sensor )
+        return entry[kind], gain_ratio * intg_time_ms / exposure
+    def update( self ):
+        # called with every published spectrum
+        if self.capture_kind:
+            self.accumulate()
+        self.has_reference = False
+        for spectral_sensor in self.instrument.spectral_sensors_present:
+            sensor_reflectance = self.reflectance_by_sensor[ spectral_sensor.pn ]
+            reference, reference_scale = self.find( spectral_sensor, "reference" )
+            if reference is None:
+                for slot in range( 0, len( sensor_reflectance )):
+                    sensor_reflectance[slot] = NAN
+                copy_to_spectrum( spectral_sensor, sensor_reflectance, self.reflectance )
+                copy_to_spectrum( spectral_sensor, sensor_reflectance, self.reference_counts )
+                copy_to_spectrum( spectral_sensor, sensor_reflectance, self.reference_irradiance )
+                continue
+            self.has_reference = True
+            dark, dark_scale = self.find( spectral_sensor, "dark" )
+            if dark is not None:
+                dark = dark["counts"]
+            divide_spectra( spectral_sensor.counts, reference["counts"], reference_scale, dark, dark_scale, sensor_reflectance )
+            copy_to_spectrum( spectral_sensor, sensor_reflectance, self.reflectance )
+            copy_to_spectrum( spectral_sensor, reference["counts"], self.reference_counts )
+            copy_to_spectrum( spectral_sensor, reference["irradiance"], self.reference_irradiance )
+    def sensor_reflectance( self, spectral_sensor, slot ):
+        return self.reflectance_by_sensor[ spectral_sensor.pn ][slot]
+    def accumulate( self ):
+        spectra_summed = preset_reference_average_count
+        for spectral_sensor in self.instrument.spectral_sensors_present:
+            key = self.exposure_key( spectral_sensor )
+            sums = self.capture_sums.get( spectral_sensor.pn )
+            if sums is None or sums[1] != key:
+                # autoexposure moved, the average starts again at the new setting
+                sums = [ spectral_sensor, key, 0, zero_spectrum( len( spectral_sensor.bands )), zero_spectrum( len( spectral_sensor.bands ))]
+                self.capture_sums[ spectral_sensor.pn ] = sums
+            sums[2] += 1
+            sums[3] = sum_spectra( sums[3], spectral_sensor.counts )
+            sums[4] = sum_spectra( sums[4], spectral_sensor.irradiance )
+            spectra_summed = min( spectra_summed, sums[2] )
+        self.status = "{} {}/{}".format( self.capture_kind, spectra_summed, preset_reference_average_count )
+        if spectra_summed >= preset_reference_average_count:
+            self.finish_capture()
+    def finish_capture( self ):
+        for spectral_sensor, key, count, counts_sum, irradiance_sum in self.capture_sums.values():
+            entry = self.spectra.get( key )
+            if entry is None:
+                gain_ratio, intg_time_ms = sensor_exposure( spectral_sensor )
+                entry = { "pn": spectral_sensor.pn, "gain_ratio": gain_ratio,
+                          "intg_time_ms": intg_time_ms, "bands": list( spectral_sensor.bands )}
+                self.spectra[key] = entry
+            entry[ self.capture_kind ] = { "counts": [ float( value ) / count for value in counts_sum ],
+                                           "irradiance": [ float( value ) / count for value in irradiance_sum ],
+                                           "timestamp": self.instrument.iso_time }
+            self.latest_keys[( spectral_sensor.pn, self.capture_kind )] = key
+        self.status = "{} set".format( self.capture_kind )
+        self.capture_kind = None
+        self.capture_sums = {}
+        self.sequence += 1
+        self.save()
+    def load( self ):
+        if not self.vfs:
+            return
+        try:
+            with open( self.filename, "r" ) as reference_file:
+                stored = json.load( reference_file )
+            self.spectra = stored["spectra"]
+            for pn, kind, key in stored["latest"]:
+                self.latest_keys[( pn, kind )] = key
+            print( "reference spectra loaded: {}".format( len( self.spectra )))
+        except ( OSError, ValueError, KeyError ):
+            pass
+    def save( self ):
+        if not self.vfs:
+            return
+        latest = [[ pn, kind, key ] for ( pn, kind ), key in self.latest_keys.items()]
+        try:
+            with open( self.filename, "w" ) as reference_file:
+                json.dump({ "spectra": self.spectra, "latest": latest }, reference_file )
+        except OSError as err:
+            print( "reference spectra not saved: {}".format( err ))
+
+def create_reference_store( instrument, vfs ):
+    reference_store = Reference_Store( instrument, vfs )
+    instrument.reference_store = reference_store
+    instrument.spectral_register.reference_store = reference_store
+    return reference_store
+
+class Autoexposure_Controller:
+    # counts scale with gain ratio x integration time, so one reading tells how far to step:
+    # the next setting is predicted from the brightest channel instead of searched for one step at a time
+    def __init__( self, spectral_sensor ):
+        self.spectral_sensor = spectral_sensor
+        self.gain_ratios = spectral_sensor.gain_ratios
+        self.integration_times_ms = spectral_sensor.integration_times_ms
+        self.gain_number, self.integration_number = spectral_sensor.get_exposure_numbers()
+        self.window_low, self.window_high = preset_autoexposure_window
+        self.target = preset_autoexposure_target
+        self.saturated_step = 16    # a saturated reading gives no scale, step down this far and look again
+        self.starved_step = 16      # neither does a dark one
+    def exposure( self, gain_number, integration_number ):
+        return self.gain_ratios[ gain_number ] * self.integration_times_ms[ integration_number ]
+    def longest_integration_within( self, integration_ms ):
+        # integration times are in increasing order
+        integration_ms = min( integration_ms, preset_autoexposure_max_integration_ms )
+        low = 0
+        high = len( self.integration_times_ms ) - 1
+        while low < high:
+            middle = ( low + high + 1 ) // 2
+            if self.integration_times_ms[ middle ] <= integration_ms:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+    def choose( self, exposure_wanted ):
+        # the lowest gain that reaches the wanted exposure within the longest allowed integration time, low gain is less noisy
+        least_acceptable = exposure_wanted * self.window_low / self.target
+        for gain_number in range( 0, len( self.gain_ratios )):
+            integration_number = self.longest_integration_within( exposure_wanted / self.gain_ratios[ gain_number ] )
+            if self.exposure( gain_number, integration_number ) >= least_acceptable:
+                return gain_number, integration_number
+        return len( self.gain_ratios ) - 1, integration_number
+    def adjust( self ):
+        # call after a read, returns True when the settings changed and the sensor needs a new conversion
+        peak_counts = self.spectral_sensor.peak_counts()
+        full_scale = self.spectral_sensor.full_scale_counts( self.integration_number )
+        if self.window_low * full_scale <= peak_counts <= self.window_high * full_scale:
+            return False
+        exposure = self.exposure( self.gain_number, self.integration_number )
+        if peak_counts >= 0.98 * full_scale:
+            counts_per_exposure = None
+            exposure_wanted = exposure / self.saturated_step
+        elif peak_counts < 1:
+            counts_per_exposure = None
+            exposure_wanted = exposure * self.starved_step
+        else:
+            counts_per_exposure = peak_counts / exposure
+            exposure_wanted = self.target * full_scale / counts_per_exposure
+        gain_number, integration_number = self.choose( exposure_wanted )
+        new_full_scale = self.spectral_sensor.full_scale_counts( integration_number )
+        if counts_per_exposure and new_full_scale != full_scale:
+            # short integrations have a smaller full scale on some sensors, aim at the one that will apply
+            gain_number, integration_number = self.choose( self.target * new_full_scale / counts_per_exposure )
+        if ( gain_number, integration_number ) == ( self.gain_number, self.integration_number ):
+            return False    # already at the end of the range, another conversion would read the same
+        self.gain_number = gain_number
+        self.integration_number = integration_number
+        self.spectral_sensor.set_exposure_numbers( gain_number, integration_number )
+        print( "autoexposure: {} peak {} counts, gain {}, integration {} ms".format( self.spectral_sensor.name, peak_counts,
+                self.gain_ratios[ gain_number ], self.integration_times_ms[ integration_number ] ))
+        return True
+
+def initialize_autoexposure( instrument ):
+    # one controller for each spectral sensor with gain and integration time control
+    instrument.autoexposure_controllers = {}
+    for spectral_sensor in instrument.spectral_sensors_present:
+        if hasattr( spectral_sensor, "set_exposure_numbers" ):
+            try:
+                instrument.autoexposure_controllers[ spectral_sensor ] = Autoexposure_Controller( spectral_sensor )
+            except Exception as err:
+                print( "autoexposure failed for {}: {}".format( spectral_sensor.name, err ))
+    return instrument.autoexposure_controllers
+
+class Loop_Benchmark:
+    # per stage timing of the main loop, kept in fixed size rings of nanosecond durations
+    def __init__( self, instrument, vfs ):
+        self.instrument = instrument
+        self.vfs = vfs
+        self.ring_size = benchmark_ring_size
+        self.report_interval_s = benchmark_report_interval_s
+        self.stage_names = []
+        self.rings = {}
+        self.ring_index = {}
+        self.ring_count = {}
+        self.last_report_time = time.monotonic()
+        self.filename = "bench_{}-{}.csv".format( instrument.datestamp, instrument.batch_number )
+        self.file_header_written = False
+    def now( self ):
+        return time.monotonic_ns()
+    def record( self, stage_name, stage_start_ns ):
+        stage_stop_ns = time.monotonic_ns()
+        if stage_name not in self.rings:
+            self.stage_names.append( stage_name )
+            self.rings[ stage_name ] = [0] * self.ring_size
+            self.ring_index[ stage_name ] = 0
+            self.ring_count[ stage_name ] = 0
+        index = self.ring_index[ stage_name ]
+        self.rings[ stage_name ][ index ] = stage_stop_ns - stage_start_ns
+        self.ring_index[ stage_name ] = ( index + 1 ) % self.ring_size
+        self.ring_count[ stage_name ] += 1
+        return stage_stop_ns
+    def statistics( self, stage_name ):
+        count = min( self.ring_count[ stage_name ], self.ring_size )
+        durations = sorted( self.rings[ stage_name ][ 0:count ] )
+        median_ns = durations[ count // 2 ]
+        p95_ns = durations[ min( count - 1, int( count * 0.95 )) ]
+        return count, durations[0], median_ns, p95_ns, durations[-1]
+    def check_report( self ):
+        if time.monotonic() > self.last_report_time + self.report_interval_s:
+            self.last_report_time = time.monotonic()
+            self.report()
+    def report( self ):
+        lines = []
+        for stage_name in self.stage_names:
+            count, min_ns, median_ns, p95_ns, max_ns = self.statistics( stage_name )
+            lines.append( "{}, {}, {}, {:.3f}, {:.3f}, {:.3f}, {:.3f}\n".format(
+                self.instrument.iso_time, stage_name, count, min_ns/1000000, median_ns/1000000, p95_ns/1000000, max_ns/1000000 ))
+        print( "benchmark: stage, samples, min ms, median ms, p95 ms, max ms" )
+        for line in lines:
+            print( "benchmark: {}".format( line[ line.find(", ")+2: ] ), end="" )
+        if self.vfs:
+            try:
+                with open( "/sd/{}".format( self.filename ), "a" ) as f:
+                    if not self.file_header_written:
+                        f.write( "timestamp-!-iso8601utc, stage, samples, min-!-ms, median-!-ms, p95-!-ms, max-!-ms\n" )
+                        self.file_header_written = True
+                    for line in lines:
+                        f.write( line )
+            except OSError as err:
+                print( "benchmark write failed: {}".format( err ))
+
+class Startup_Profiler:
+    # time and heap taken by each phase of startup, reported once the first sample is taken
+    def __init__( self, start_time_ns, start_mem_free ):
+        self.start_time_ns = start_time_ns
+        self.last_time_ns = start_time_ns
+        self.last_mem_free = start_mem_free
+        self.phases = []
+    def mark( self, phase_name, time_ns = None, mem_free = None ):
+        # ends the phase running since the last mark, time and free memory are taken now unless given
+        if time_ns is None:
+            gc.collect()
+            time_ns = time.monotonic_ns()
+            mem_free = gc.mem_free()
+        self.phases.append(( phase_name, time_ns - self.last_time_ns, self.last_mem_free - mem_free ))
+        self.last_time_ns = time_ns
+        self.last_mem_free = mem_free
+    def report( self ):
+        print( "startup: phase, s, heap used kB" )
+        for phase_name, duration_ns, heap_used in self.phases:
+            print( "startup: {}, {:.3f}, {:.1f}".format( phase_name, duration_ns/1000000000, heap_used/1000 ))
+        print( "startup: {:.3f} s in all, {} kB free".format(( self.last_time_ns - self.start_time_ns )/1000000000, int( self.last_mem_free/1000 )))
+
+def create_startup_profiler( start_time_ns, start_mem_free ):
+    startup_profiler = Startup_Profiler( start_time_ns, start_mem_free )
+    return startup_profiler
+
+class Null_Loop_Benchmark:
+    def __init__( self ):
+        pass
+    def now( self ):
+        return 0
+    def record( self, stage_name, stage_start_ns ):
+        return 0
+    def check_report( self ):
+        pass
+    def report( self ):
+        pass
+
+def initialize_loop_benchmark( instrument, vfs ):
+    loop_benchmark = Null_Loop_Benchmark()
+    if benchmark_enabled:
+        try:
+            loop_benchmark = Loop_Benchmark( instrument, vfs )
+            print( "loop benchmark enabled, reporting every {} s".format( loop_benchmark.report_interval_s ))
+        except Exception as err:
+            print( "loop benchmark failed: {}".format( err ))
+    return loop_benchmark
+
+class Sample_Queue:
+    # first in, first out hand off from the sampling task to the logging task. CircuitPython's asyncio has no Queue.
+    def __init__( self, length ):
+        self.length = length
+        self.items = []
+        self.item_added = asyncio.Event()
+        self.item_removed = asyncio.Event()
+    async def put( self, item ):
+        while len( self.items ) >= self.length:
+            self.item_removed.clear()
+            await self.item_removed.wait()
+        self.items.append( item )
+        self.item_added.set()
+    async def get( self ):
+        while not self.items:
+            self.item_added.clear()
+            await self.item_added.wait()
+        item = self.items.pop( 0 )
+        self.item_removed.set()
+        return item
+
+class Task_Scheduler:
+    # the instrument's work split into cooperative asyncio tasks: input polling, page redraws, sampling,
+    # logging and housekeeping. A task gives up the processor at every await, so a slow sensor read or SD card
+    # write holds up the touch screen and rotary encoder for one step, not for the whole sample.
+    def __init__( self, instrument, controls_page, battery_monitor, onboard_neopixel, loop_benchmark, data_logger, vfs ):
+        self.instrument = instrument
+        self.controls_page = controls_page
+        self.battery_monitor = battery_monitor
+        self.onboard_neopixel = onboard_neopixel
+        self.loop_benchmark = loop_benchmark
+        self.data_logger = data_logger
+        self.vfs = vfs
+        self.sample_queue = Sample_Queue( preset_sample_queue_length )
+        self.burst_statistics = Burst_Statistics()
+        self.startup_profiler = None
+        # fast boot: work that waits until the first sample is taken, the first page and these startup steps
+        self.first_sample_taken = asyncio.Event()
+        self.deferred_startup = []
+        instrument.task_scheduler = self
+    async def run( self ):
+        if not preset_fast_boot or not self.instrument.record:
+            self.first_sample_taken.set()
+        tasks = [
+            asyncio.create_task( self.input_task() ),
+            asyncio.create_task( self.display_task() ),
+            asyncio.create_task( self.sample_task() ),
+            asyncio.create_task( self.log_task() ),
+            asyncio.create_task( self.housekeeping_task() )]
+        if self.instrument.usb_data_stream.enabled:
+            tasks.append( asyncio.create_task( self.usb_data_task() ))
+        for sensor in self.instrument.sensors_present:
+            if sensor.cadence_s:
+                tasks.append( asyncio.create_task( self.sensor_task( sensor )))
+        await asyncio.gather( *tasks )
+    async def input_task( self ):
+        instrument = self.instrument
+        last_poll = self.loop_benchmark.now()
+        while True:
+            stage_start = self.loop_benchmark.record( "input_poll_gap", last_poll )
+            instrument.check_inputs()
+            last_poll = self.loop_benchmark.record( "check_inputs", stage_start )
+            if instrument.input_flag:
+                if time.monotonic() > instrument.input_interval_start + instrument.input_interval:
+                    instrument.input_flag = False
+            await asyncio.sleep( preset_input_poll_interval_s )
+    async def display_task( self ):
+        instrument = self.instrument
+        # fast boot: the first page is built once the first sample is on its way to the card
+        await self.first_sample_taken.wait()
+        for finish_startup in self.deferred_startup:
+            finish_startup()
+            await asyncio.sleep( 0 )
+        if self.startup_profiler and not instrument.record:
+            # not recording, so startup ends here
+            self.startup_profiler.report()
+            self.startup_profiler = None
+        while True:
+            stage_start = self.loop_benchmark.now()
+            instrument.show_active_page()
+            stage_start = self.loop_benchmark.record( "show_active_page", stage_start )
+            instrument.update_active_page()
+            stage_start = self.loop_benchmark.record( "update_active_page", stage_start )
+            self.controls_page.update_values( instrument )
+            self.loop_benchmark.record( "controls_page.update_values", stage_start )
+            await asyncio.sleep( preset_display_interval_s )
+    async def sample_task( self ):
+        instrument = self.instrument
+        last_sample_time = time.monotonic() - instrument.sample_interval_s
+        while True:
+            # a sample starts on the interval while recording, or on a burst request, once the user stops touching the controls
+            sample_due = instrument.record and time.monotonic() > last_sample_time + instrument.sample_interval_s
+            if ( sample_due or instrument.take_burst ) and not instrument.input_flag:
+                last_sample_time = time.monotonic()
+                await self.take_sample()
+                instrument.storage_manager.sample_logged()
+            elif instrument.spectral_register.preview_due() and not instrument.input_flag:
+                await self.take_preview()
+            else:
+                await asyncio.sleep( preset_input_poll_interval_s )
+    async def take_preview( self ):
+        # between samples the live graph gets a spectrum, and the remote sensing page the target readings that go with it
+        for sensor in self.instrument.spectral_register.target_sensors:
+            if sensor.cadence_s is None or ( not self.reads_on_cadence( sensor ) and sensor.data_ready() ):
+                stage_start = self.loop_benchmark.now()
+                sensor.refresh()
+                self.loop_benchmark.record( sensor.name, stage_start )
+                await asyncio.sleep( 0 )
+        await self.read_spectral_sensors()
+    def reads_on_cadence( self, sensor ):
+        # while recording, a device that updates slower than the samples are taken, or that streams, is read by its own
+        # task; the others are read with each sample, so no device is polled more often than its values are logged
+        if sensor.cadence_s is None or not self.instrument.record:
+            return False
+        return sensor.streams or sensor.cadence_s > self.instrument.sample_interval_s
+    async def sensor_task( self, sensor ):
+        # a device read on its cadence is read only when it has new data, the samples log its latest value and age
+        while True:
+            if not self.reads_on_cadence( sensor ):
+                await asyncio.sleep( sensor.cadence_s )
+            elif sensor.data_ready():
+                stage_start = self.loop_benchmark.now()
+                sensor.refresh()
+                self.loop_benchmark.record( sensor.name, stage_start )
+                await asyncio.sleep( sensor.cadence_s )
+            else:
+                await asyncio.sleep( sensor.cadence_s / 4 )
+    async def take_sample( self ):
+        instrument = self.instrument
+        instrument.update_time()
+        new_day = instrument.calendar_day_changed()
+        if new_day or instrument.storage_manager.pending_layout or instrument.data_file_manager.rotation_due():
+            # records already queued are written in the layout and file they were made for
+            while self.sample_queue.items:
+                await asyncio.sleep( 0 )
+            if new_day:
+                instrument.start_calendar_day()
+            if instrument.storage_manager.pending_layout:
+                instrument.storage_manager.apply_pending_layout()
+            if instrument.data_file_manager.rotation_due():
+                instrument.data_file_manager.rotate()
+        burst_statistics = preset_burst_statistics and instrument.burst_count > 1
+        if burst_statistics:
+            self.burst_statistics.start()
+        # data file rows in a record: the system row, then one per band
+        record_rows = 1 + len( instrument.band_rows )
+        for instrument.burst_counter in range( 0, instrument.burst_count ):
+            self.controls_page.update_burst_countdown( instrument.burst_count - instrument.burst_counter )
+            system_log = instrument.get_system_log()
+            # one shot spectral conversions run while the other sensors are read
+            converting = self.start_spectral_conversions()
+            for sensor in instrument.sensors_present:
+                if sensor.cadence_s is None or ( not self.reads_on_cadence( sensor ) and sensor.data_ready() ):
+                    stage_start = self.loop_benchmark.now()
+                    sensor.refresh()
+                    self.loop_benchmark.record( sensor.name, stage_start )
+                    await asyncio.sleep( 0 )
+            await self.read_spectral_sensors( converting )
+            if self.vfs:
+                # format now, while the sensor values belong to this sample, and leave the card to the logging task
+                if instrument.log_binary:
+                    record = instrument.pack_binary_record()
+                    instrument.usb_data_stream.send_sample( instrument, record )
+                else:
+                    record = instrument.format_sample_rows( system_log )
+                    instrument.usb_data_stream.send_sample( instrument )
+                if not ( burst_statistics and instrument.burst_summary_only ):
+                    await self.sample_queue.put(( record, record_rows, instrument.iso_time ))
+                if burst_statistics:
+                    self.burst_statistics.add( instrument )
+            else:
+                instrument.usb_data_stream.send_sample( instrument )
+            instrument.measurement_counter += 1
+            if self.startup_profiler:
+                self.startup_profiler.mark( "first sample" )
+                self.startup_profiler.report()
+                self.startup_profiler = None
+                self.first_sample_taken.set()
+        if burst_statistics and self.vfs:
+            statistics_rows = record_rows * len( self.burst_statistics.statistic_names )
+            if instrument.log_binary:
+                statistics_record = instrument.pack_binary_statistics( self.burst_statistics )
+                instrument.usb_data_stream.send_statistics( instrument, statistics_record )
+                await self.sample_queue.put(( statistics_record, statistics_rows, instrument.iso_time ))
+            else:
+                await self.sample_queue.put(( instrument.format_statistics_rows( self.burst_statistics ), statistics_rows, instrument.iso_time ))
+                if instrument.usb_data_stream.connected:
+                    instrument.usb_data_stream.send_statistics( instrument, instrument.pack_binary_statistics( self.burst_statistics ))
+        instrument.take_burst = False
+        self.controls_page.burst_color.color_index = 16
+    def start_spectral_conversions( self ):
+        return [ spectral_sensor for spectral_sensor in self.instrument.spectral_sensors_present if spectral_sensor.start_conversion() ]
+    async def wait_for_conversion( self, spectral_sensor ):
+        # the other tasks run until the conversion is due, then data ready is polled
+        wait_s = spectral_sensor.conversion_due_time - time.monotonic()
+        if wait_s > 0:
+            await asyncio.sleep( wait_s )
+        while not spectral_sensor.conversion_ready():
+            await asyncio.sleep( preset_as7265x_poll_interval_s )
+    async def read_spectral_sensors( self, converting = None ):
+        instrument = self.instrument
+        if converting is None:
+            converting = self.start_spectral_conversions()
+        # sensors that read in the foreground first, then the ones converting in the background as they finish
+        spectral_sensors = [ spectral_sensor for spectral_sensor in instrument.spectral_sensors_present if spectral_sensor not in converting ]
+        spectral_sensors.extend( converting )
+        for spectral_sensor in spectral_sensors:
+            if spectral_sensor in converting:
+                await self.wait_for_conversion( spectral_sensor )
+            stage_start = self.loop_benchmark.now()
+            spectral_sensor.read()
+            self.loop_benchmark.record( spectral_sensor.name, stage_start )
+            await asyncio.sleep( 0 )
+            autoexposure_controller = instrument.autoexposure_controllers.get( spectral_sensor )
+            if autoexposure_controller and instrument.spectral_register.autoexposure:
+                # a saturated or starved reading is taken again at the predicted setting, so the sample is not wasted
+                for step in range( 0, preset_autoexposure_max_steps ):
+                    if not autoexposure_controller.adjust():
+                        break
+                    stage_start = self.loop_benchmark.now()
+                    if spectral_sensor.start_conversion():
+                        await self.wait_for_conversion( spectral_sensor )
+                        stage_start = self.loop_benchmark.now()
+                        spectral_sensor.read()
+                    else:
+                        spectral_sensor.read_new_exposure()
+                    self.loop_benchmark.record( "autoexposure", stage_start )
+                    await asyncio.sleep( 0 )
+            spectral_sensor.check_gain_ratio()
+        instrument.spectral_register.publish_spectrum()
+    async def log_task( self ):
+        while True:
+            record, rows, iso_time = await self.sample_queue.get()
+            self.write_record( record, rows, iso_time )
+            self.data_logger.check_flush( self.battery_monitor )
+    def write_record( self, record, rows, iso_time ):
+        # iso_time: the sample's timestamp, the sample task has moved on to the next one by now
+        if not self.vfs:
+            return
+        if self.instrument.take_burst:
+            self.onboard_neopixel.fill( BLUE )
+        else:
+            self.onboard_neopixel.fill( GREEN )
+        stage_start = self.loop_benchmark.now()
+        bytes_before = self.data_logger.bytes_logged
+        try:
+            if self.instrument.log_binary:
+                self.data_logger.write_bytes( record )
+            else:
+                for row in record:
+                    self.data_logger.write( row )
+            self.instrument.data_file_manager.rows_written( rows, self.data_logger.bytes_logged - bytes_before, iso_time )
+        except Exception as err:
+            print( "write to file failed: {}".format( err ))
+            self.vfs = False
+        self.loop_benchmark.record( "sd_append", stage_start )
+        self.onboard_neopixel.fill( OFF )
+    def write_queued_samples( self ):
+        # at shutdown, so samples already taken still reach the card
+        while self.sample_queue.items:
+            record, rows, iso_time = self.sample_queue.items.pop( 0 )
+            self.write_record( record, rows, iso_time )
+    async def usb_data_task( self ):
+        usb_data_stream = self.instrument.usb_data_stream
+        while True:
+            stage_start = self.loop_benchmark.now()
+            usb_data_stream.update()
+            self.loop_benchmark.record( "usb_data", stage_start )
+            if usb_data_stream.busy():
+                # a file transfer sends a chunk each turn, the other tasks still run in between
+                await asyncio.sleep( 0 )
+            else:
+                await asyncio.sleep( preset_usb_stream_interval_s )
+    async def housekeeping_task( self ):
+        instrument = self.instrument
+        while True:
+            if not self.vfs:
+                self.onboard_neopixel.fill( RED )
+            #TBD flash battery indicator when battery percentage < 20
+            #TBD command 5V supply
+            #TBD command servo motors
+            #TBD command source lamps
+            #TBD command DAC output
+            self.data_logger.check_flush( self.battery_monitor )
+            instrument.page_cache.check_memory()
+            instrument.storage_manager.update()
+            instrument.data_file_manager.check_save()
+            self.loop_benchmark.check_report()
+            await asyncio.sleep( preset_housekeeping_interval_s )
+
+def create_task_scheduler( instrument, controls_page, battery_monitor, onboard_neopixel, loop_benchmark, data_logger, vfs ):
+    task_scheduler = Task_Scheduler( instrument, controls_page, battery_monitor, onboard_neopixel, loop_benchmark, data_logger, vfs )
+    return task_scheduler
@@ -0,0 +1,2187 @@
+# STELLA-1.2 pages: the screens shown on the display and the controls bar
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+
+class Page:
+    def __init__( self ):
+        pass
+    def show(self):
+        self.group.hidden = False
+    def hide(self):
+        self.group.hidden = True
+    def update_values(self):
+        pass
+
+class Page_Cache:
+    # pages are built the first time they are shown instead of at boot, and stay built so going back to one is quick.
+    # Past preset_page_cache_size built pages, or below preset_page_cache_min_free_kB of free memory, the least
+    # recently shown page is dropped from the display and built again the next time it is shown.
+    # Pinned pages, the welcome page and the controls bar, are never dropped.
+    def __init__( self, instrument ):
+        self.instrument = instrument
+        self.makers = {}
+        self.companions = {}
+        self.pinned = []
+        self.recently_shown = []
+    def add( self, page_number, make_page, arguments, companions = [] ):
+        # companions are pages make_page builds along with this one, shown and dropped together with it
+        self.makers[ page_number ] = ( make_page, arguments )
+        self.companions[ page_number ] = companions
+    def place( self, page_number, page, pinned = False ):
+        # called by each make_*_page function. The display group is kept in page number order, so pages
+        # draw over one another the way they did when every page was built at boot.
+        pages_list = self.instrument.pages_list
+        while len( pages_list ) <= page_number:
+            pages_list.append( None )
+        pages_list[ page_number ] = page
+        for later_page in pages_list[ page_number + 1: ]:
+            if later_page is not None:
+                group_index = self.instrument.main_display_group.index( later_page.group )
+                self.instrument.main_display_group.insert( group_index, page.group )
+                break
+        else:
+            self.instrument.main_display_group.append( page.group )
+        if pinned:
+            self.pinned.append( page_number )
+    def is_built( self, page_number ):
+        return page_number < len( self.instrument.pages_list ) and self.instrument.pages_list[ page_number ] is not None
+    def get( self, page_number ):
+        if page_number not in self.pinned:
+            if page_number in self.recently_shown:
+                self.recently_shown.remove( page_number )
+            self.recently_shown.append( page_number )
+        if not self.is_built( page_number ):
+            while len( self.recently_shown ) > preset_page_cache_size:
+                self.drop( self.recently_shown[0] )
+            make_page, arguments = self.makers[ page_number ]
+            make_page( *arguments )
+            self.check_memory()
+        return self.instrument.pages_list[ page_number ]
+    def drop( self, page_number ):
+        if page_number in self.recently_shown:
+            self.recently_shown.remove( page_number )
+        for number in [ page_number ] + self.companions.get( page_number, [] ):
+            if self.is_built( number ):
+                page = self.instrument.pages_list[ number ]
+                self.instrument.main_display_group.remove( page.group )
+                self.instrument.pages_list[ number ] = None
+                if page is getattr( self.instrument, "spectral_graph_page", None ):
+                    self.instrument.spectral_graph_page = None
+        gc.collect()
+        print( "page cache: dropped page {}, memory free {} kB".format( page_number, int( gc.mem_free()/1000 )))
+    def check_memory( self ):
+        # called after a page is built and by the housekeeping task, never drops the page on screen
+        if gc.mem_free() > preset_page_cache_min_free_kB * 1000:
+            return
+        gc.collect()
+        while gc.mem_free() < preset_page_cache_min_free_kB * 1000 and len( self.recently_shown ) > 1:
+            self.drop( self.recently_shown[0] )
+
+def create_page_cache( instrument ):
+    page_cache = Page_Cache( instrument )
+    return page_cache
+
+class Spectral_Graph_Page( Page ):
+    def __init__( self, instrument, spectral_register ):
+        super().__init__()
+        self.instrument = instrument
+        self.spectral_register = spectral_register
+        self.palette = instrument.palette
+        self.points = []
+        self.plot_layout_key = None
+        self.plot_wavelengths = []
+        self.plot_slots = []
+        self.plotted_key = None
+    def make_group( self ):
+        self.group = displayio.Group()
+        graph_x = 14 #4
+        graph_width = 320-60-24
+        graph_height = 240-124 #240-120
+        message_height = int( graph_height/4 )
+        message_offset = 10
+        graph_y = 80
+        self.graph_pix_y0 = graph_y + graph_height
+        self.graph_pix_x0 = graph_x
+        self.graph_pix_xn = self.graph_pix_x0 + graph_width
+        self.graph_pix_yn = self.graph_pix_y0 - graph_height
+        graph_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=graph_width, height=graph_height-4, x=graph_x, y=graph_y+4 )
+        self.group.append( graph_background )
+        ## make all the plot points, store them on the x-axis
+        self.pixels_per_point = 2 #4
+        self.point_height = 2
+        self.number_of_points = int(graph_width / self.pixels_per_point)
+        #print( "number_of_points", self.number_of_points )
+        for index in range (0, self.number_of_points):
+            #color_index = index % 10 or color_index = 0
+            point = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0 , width=self.pixels_per_point, height=self.point_height,
+                        x=self.graph_pix_x0 + index*self.pixels_per_point, y=self.graph_pix_y0 - self.point_height )
+            self.points.append(point)
+            self.group.append(point)
+
+        self.message_bar = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                        width=graph_width-2*message_offset, height=message_height,
+                        x=self.graph_pix_x0+message_offset, y=self.graph_pix_y0 - message_offset - message_height )
+        self.group.append( self.message_bar )
+        self.message_bar.hidden = True
+        message_group = displayio.Group(scale=2, x=self.graph_pix_x0+3*message_offset, y=self.graph_pix_y0 - message_height+4)
+        message_text = "updating graph"
+        self.message_text_area = label.Label(terminalio.FONT, text=message_text, color=self.palette[19])
+        message_group.append(self.message_text_area)
+        self.message_text_area.hidden = True
+        self.group.append(message_group)
+
+        # future function banner
+        self.banner_group = displayio.Group()
+        select_width = 2
+        banner_width = 250
+        banner_height = 60
+        banner_x = 30
+        banner_y = 110
+        banner_color_x = banner_x + select_width
+        banner_color_y = banner_y + select_width
+        banner_border = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=banner_width, height=banner_height, x=banner_x, y=banner_y)
+        self.banner_group.append( banner_border )
+        banner_color_width = banner_width - 2 * select_width
+        banner_color_height = banner_height - 2 * select_width
+        banner_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=banner_color_width, height=banner_color_height, x=banner_color_x, y=banner_color_y)
+        self.banner_group.append( banner_color )
+        banner_text_x = banner_color_x + 3
+        banner_text_y = banner_color_y + 12
+        banner_text_group = displayio.Group(scale=2, x=banner_text_x, y=banner_text_y)
+        banner_text = "*future function: "
+        banner_text_area = label.Label(terminalio.FONT, text=banner_text, color=self.palette[0])
+        banner_text_group.append(banner_text_area)
+        self.banner_group.append(banner_text_group)
+        self.banner_message_group = displayio.Group(scale=2, x=banner_text_x, y=banner_text_y+26)
+        banner_message = "message goes here"
+        self.banner_message_area = label.Label(terminalio.FONT, text=banner_message, color=self.palette[0])
+        self.banner_message_group.append( self.banner_message_area )
+        self.banner_group.append(self.banner_message_group)
+        self.group.append( self.banner_group )
+        self.banner_group.hidden = True
+
+        return self.group
+
+    # wavelength range of each scope choice, and the spectrum color of each wavelength band
+    scope_wavelength_ranges = ( (410, 1000), (410, 700), (700, 1000), (200, 1000), (200, 700), (200, 400) )
+    spectrum_color_edges = ( 390, 420, 450, 470, 500, 520, 550, 570, 600, 630, 660, 690, 720, 745, 785 )
+    spectrum_colors = ( 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38 )
+    def spectrum_color( self, wavelength, color_index ):
+        # below 390 or above 785 nm is black, exactly 785 nm is in no band and keeps the color the point has
+        if wavelength < self.spectrum_color_edges[0] or wavelength > self.spectrum_color_edges[-1]:
+            return 0
+        for index in range( 0, len( self.spectrum_colors )):
+            if self.spectrum_color_edges[index] <= wavelength < self.spectrum_color_edges[index+1]:
+                return self.spectrum_colors[index]
+        return color_index
+    def make_plot_layout( self, spectrum ):
+        # everything about the plot that depends only on the scope and the bands present, done again only when they change:
+        # which band each point sits on or between, and the color, width and x of every point.
+        # spectrum is in the instrument's band slots, nan where a band has no value
+        self.plot_wavelengths = []
+        self.plot_slots = []
+        wavelength_range = self.scope_wavelength_ranges[ self.spectral_register.scope ]
+        self.spectral_register.wavelength_range = wavelength_range
+        self.spectral_register.wavelengths_to_plot = []
+        bands = self.instrument.wavelength_bands_list_sorted
+        for slot in range( 0, len( bands )):
+            item = bands[slot]
+            if wavelength_range[0] <= item < wavelength_range[1]:
+                self.spectral_register.wavelengths_to_plot.append(item)
+                if spectrum[slot] == spectrum[slot]:
+                    self.plot_wavelengths.append(item)
+                    self.plot_slots.append(slot)
+        if self.spectral_register.wavelengths_to_plot:
+            self.spectral_register.five_x_values[0][0] = self.spectral_register.wavelengths_to_plot[0]
+            self.spectral_register.five_x_values[0][4] = self.spectral_register.wavelengths_to_plot[-1]
+            self.spectral_register.calculate_five_x_values()
+        else:
+            self.spectral_register.scope = (self.spectral_register.scope +1) % self.spectral_register.number_of_scope_choices
+        if len( self.plot_wavelengths ) < 2:
+            self.plot_wavelengths = []
+            self.plot_slots = []
+            return
+        self.plot_values = [0] * len( self.plot_wavelengths )
+        wavelength_nm_per_point = (self.plot_wavelengths[-1] - self.plot_wavelengths[0])/(self.number_of_points - 1 )
+        indicies_of_active_points = []
+        for wavelength in self.plot_wavelengths:
+            indicies_of_active_points.append(int( round((wavelength - self.plot_wavelengths[0]) / wavelength_nm_per_point,0)))
+        # each point is drawn at plot_values[segment] + fraction * ( plot_values[segment+1] - plot_values[segment] )
+        self.point_segments = []
+        self.point_fractions = []
+        segment = 0
+        for index in range (0, self.number_of_points):
+            while segment < len( indicies_of_active_points ) - 2 and index >= indicies_of_active_points[segment+1]:
+                segment += 1
+            start = indicies_of_active_points[segment]
+            self.point_segments.append( segment )
+            self.point_fractions.append( (index - start) / (indicies_of_active_points[segment+1] - start) )
+            point = self.points[index]
+            if index in indicies_of_active_points:
+                wavelength = self.plot_wavelengths[ indicies_of_active_points.index( index ) ]
+                bandwidth = 0
+                for spectral_sensor in self.instrument.spectral_sensors_present:
+                    if not bandwidth:
+                        bandwidth = spectral_sensor.get_bandwidth( wavelength ) or 0
+                bw_in_points = int( bandwidth/wavelength_nm_per_point )*self.pixels_per_point
+                point.color_index = self.spectrum_color( wavelength, point.color_index )
+                point.width = bw_in_points
+                point.x = self.graph_pix_x0 + index*self.pixels_per_point - int(bw_in_points/2)
+                point.height = self.point_height *3
+            else:
+                point.color_index = 19
+                point.width = self.pixels_per_point
+                point.height = self.point_height
+                point.x = self.graph_pix_x0 + index*self.pixels_per_point
+        # force every y to be written on the next frame
+        self.point_y_pixels = [ None ] * self.number_of_points
+    def check_plot_layout( self, spectrum, source ):
+        # the bands with values change only with the source plotted ( 0 sample, 1 s/ref, 2 ref ) and the references taken
+        layout_key = ( self.spectral_register.scope, self.instrument.number_of_plot_points, source,
+                       self.spectral_register.reference_store.sequence )
+        if layout_key != self.plot_layout_key:
+            self.plot_layout_key = layout_key
+            self.make_plot_layout( spectrum )
+    def plot( self, spectrum, source = 0 ):
+        # per frame: band values to pixels, writing y only on the points that moved so displayio redraws only those
+        self.check_plot_layout( spectrum, source )
+        if not self.plot_wavelengths:
+            return
+        values = self.plot_values
+        plot_slots = self.plot_slots
+        for index in range( 0, len( values )):
+            value = spectrum[ plot_slots[index] ]
+            if not self.spectral_register.scale_linear:
+                if value < 1:
+                    value = 0
+                else:
+                    value = math.log( value, 10 )
+            values[index] = value
+        # points between bands are interpolated, so the band values hold the extremes
+        low_value = min( values )
+        y_value_span = max( values ) - low_value
+        if y_value_span > 0:
+            y_pix_per_value = ( self.graph_pix_y0 - self.graph_pix_yn ) / y_value_span
+        else:
+            y_pix_per_value = 1
+        y_pix_base = self.graph_pix_y0 - self.point_height
+        point_segments = self.point_segments
+        point_fractions = self.point_fractions
+        point_y_pixels = self.point_y_pixels
+        for index in range (0, self.number_of_points):
+            segment = point_segments[index]
+            value = values[segment] + point_fractions[index] * ( values[segment+1] - values[segment] )
+            y_pix = y_pix_base - int( y_pix_per_value *( value - low_value ))
+            if y_pix != point_y_pixels[index]:
+                point_y_pixels[index] = y_pix
+                self.points[index].y = y_pix
+
+    def update_plot_data( self ):
+        # the graph shows the spectrum the sampling task published, it never reads the sensors itself
+        spectral_register = self.spectral_register
+        if spectral_register.live and spectral_register.spectrum_sequence:
+            reference_store = spectral_register.reference_store
+            plot_key = ( spectral_register.spectrum_sequence, spectral_register.y_axis_irradiance, spectral_register.scale_linear,
+                         spectral_register.scope, self.instrument.number_of_plot_points, spectral_register.data_source, reference_store.sequence )
+            if plot_key == self.plotted_key:
+                return
+            self.plotted_key = plot_key
+            # without a reference, s/ref and ref fall back to the sample
+            if spectral_register.data_source == 1 and reference_store.has_reference:
+                self.plot( reference_store.reflectance, 1 )
+            elif spectral_register.data_source == 2 and reference_store.has_reference:
+                if spectral_register.y_axis_irradiance:
+                    self.plot( reference_store.reference_irradiance, 2 )
+                else:
+                    self.plot( reference_store.reference_counts, 2 )
+            elif spectral_register.y_axis_irradiance:
+                self.plot( spectral_register.spectrum_irradiance )
+            else:
+                self.plot( spectral_register.spectrum_counts )
+
+def make_spectral_graph_page( instrument, spectral_register ):
+    instrument.welcome_page.announce( "make_spectral_graph_page" )
+    page = Spectral_Graph_Page( instrument, spectral_register )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 10, page )
+    return page
+
+class Remote_Sensing_Page( Page ):
+    def __init__( self, instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder ):
+        self.instrument = instrument
+        self.palette = instrument.palette
+        self.spectral_register = spectral_register
+        self.hdc3022_air_sensor = hdc3022_air_sensor
+        self.mlx90614_surface_thermometer = mlx90614_surface_thermometer
+        self.lv_ez_mb1013_rangefinder = lv_ez_mb1013_rangefinder
+        self.banner_duration = 3
+        self.banner_hide_time = 0
+        self.banner_select = None
+        self.readout_sequence = None
+        self.shown_reference_status = spectral_register.reference_store.status
+        super().__init__()
+    def make_group( self ):
+        extra_space = 8
+        self.group = displayio.Group()
+        separator_bar_height = 2
+        rs_background_y = 54 + separator_bar_height
+        rs_background_height = 240 - rs_background_y
+        upper_text_y = rs_background_y + 14
+        select_width = 4
+        offset = 4
+        upper_select_y = offset + rs_background_y
+        upper_control_height = 14
+        upper_select_height = upper_control_height + 2*select_width
+        upper_control_y = upper_select_y + select_width
+        rs_background = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=320, height=rs_background_height, x=0, y=rs_background_y)
+        self.group.append( rs_background )
+        # scale
+        scale_select_x = offset
+        scale_color_x = scale_select_x + select_width
+        scale_select_width = 49
+        self.scale_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=scale_select_width, height=upper_select_height, x=scale_select_x, y=upper_select_y)
+        self.group.append( self.scale_select )
+        self.scale_select.hidden = True
+        scale_control_width = scale_select_width - 2 * select_width
+        self.scale_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=scale_control_width, height=upper_control_height, x=scale_color_x, y=upper_control_y)
+        self.group.append( self.scale_color )
+        scale_text_x = scale_color_x + 3
+        scale_group = displayio.Group(scale=1, x=scale_text_x, y=upper_text_y)
+        scale_text = "linear"
+        self.scale_text_area = label.Label(terminalio.FONT, text=scale_text, color=self.palette[0])
+        scale_group.append(self.scale_text_area)
+        self.group.append(scale_group)
+        # units
+        units_y_select_x = offset + scale_select_width - select_width
+        units_y_color_x = units_y_select_x + select_width
+        units_y_select_width = 73
+        self.units_y_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=units_y_select_width, height=upper_select_height, x=units_y_select_x, y=upper_select_y)
+        self.group.append( self.units_y_select )
+        self.units_y_select.hidden = True
+        units_y_control_width = units_y_select_width - 2 * select_width
+        self.units_y_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=units_y_control_width, height=upper_control_height, x=units_y_color_x, y=upper_control_y)
+        self.group.append( self.units_y_color )
+        units_y_text_x = units_y_color_x + 3
+        units_y_group = displayio.Group(scale=1, x=units_y_text_x, y=upper_text_y)
+        units_y_text = "irradiance"
+        self.units_y_text_area = label.Label(terminalio.FONT, text=units_y_text, color=self.palette[0])
+        units_y_group.append(self.units_y_text_area)
+        self.group.append(units_y_group)
+        # spectrum
+        spectrum_select_x = offset + scale_select_width + units_y_select_width - 2* select_width
+        spectrum_color_x = spectrum_select_x + select_width
+        spectrum_select_width = 96
+        self.spectrum_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=spectrum_select_width, height=upper_select_height, x=spectrum_select_x, y=upper_select_y)
+        self.group.append( self.spectrum_select )
+        self.spectrum_select.hidden = True
+        spectrum_control_width = spectrum_select_width - 2 * select_width
+        self.spectrum_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=spectrum_control_width, height=upper_control_height, x=spectrum_color_x, y=upper_control_y)
+        self.group.append( self.spectrum_color )
+        spectrum_text_x = spectrum_color_x + 3
+        spectrum_group = displayio.Group(scale=1, x=spectrum_text_x, y=upper_text_y)
+        spectrum_text = "uv + vis + nir"
+        #spectrum_text = "near infrared"
+        #spectrum_text = "ultraviolet"
+        #spectrum_text = "visible"
+        #spectrum_text = "uv + visible"
+        self.spectrum_text_area = label.Label(terminalio.FONT, text=spectrum_text, color=self.palette[0])
+        spectrum_group.append(self.spectrum_text_area)
+        self.group.append(spectrum_group)
+
+
+        # exposure
+        exposure_select_x = offset + scale_select_width + units_y_select_width + spectrum_select_width - 3*select_width
+        exposure_color_x = exposure_select_x + select_width
+        exposure_select_width = 49
+        self.exposure_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=exposure_select_width, height=upper_select_height, x=exposure_select_x, y=upper_select_y)
+        self.group.append( self.exposure_select )
+        self.exposure_select.hidden = True
+        exposure_control_width = exposure_select_width - 2 * select_width
+        self.exposure_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=exposure_control_width, height=upper_control_height, x=exposure_color_x, y=upper_control_y)
+        self.group.append( self.exposure_color )
+        exposure_text_x = exposure_color_x + 3
+        exposure_group = displayio.Group(scale=1, x=exposure_text_x, y=upper_text_y)
+        exposure_text = "autoEx"
+        self.exposure_text_area = label.Label(terminalio.FONT, text=exposure_text, color=self.palette[0])
+        exposure_group.append(self.exposure_text_area)
+        self.group.append(exposure_group)
+
+        # lamps
+        lamps_select_x = offset + scale_select_width + units_y_select_width + spectrum_select_width + exposure_select_width - 4* select_width
+        lamps_color_x = lamps_select_x + select_width
+        lamps_select_width = 66
+        self.lamps_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=lamps_select_width, height=upper_select_height, x=lamps_select_x, y=upper_select_y)
+        self.group.append( self.lamps_select )
+        self.lamps_select.hidden = True
+        lamps_control_width = lamps_select_width - 2 * select_width
+        self.lamps_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=lamps_control_width, height=upper_control_height, x=lamps_color_x, y=upper_control_y)
+        self.group.append( self.lamps_color )
+        lamps_text_x = lamps_color_x + 3
+        lamps_group = displayio.Group(scale=1, x=lamps_text_x, y=upper_text_y)
+        lamps_text = "lamps off"
+        self.lamps_text_area = label.Label(terminalio.FONT, text=lamps_text, color=self.palette[0])
+        lamps_group.append(self.lamps_text_area)
+        self.group.append(lamps_group)
+        # lower controls
+        lower_control_height = 14
+        lower_select_y = 240 - offset - separator_bar_height - lower_control_height - select_width
+        lower_select_height = lower_control_height + 2*select_width
+        lower_control_y = lower_select_y + select_width
+        lower_text_y = lower_control_y + 6
+        # data_source
+        data_source_select_x = offset
+        data_source_color_x = data_source_select_x + select_width
+        data_source_select_width = 50
+        self.data_source_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=data_source_select_width, height=lower_select_height, x=data_source_select_x, y=lower_select_y)
+        self.group.append( self.data_source_select )
+        self.data_source_select.hidden = True
+        data_source_control_width = data_source_select_width - 2 * select_width
+        self.data_source_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=data_source_control_width, height=lower_control_height, x=data_source_color_x, y=lower_control_y)
+        self.group.append( self.data_source_color )
+        data_source_text_x = data_source_color_x + 3
+        data_source_group = displayio.Group(scale=1, x=data_source_text_x, y=lower_text_y)
+        data_source_text = "s/ref"
+        self.data_source_text_area = label.Label(terminalio.FONT, text=data_source_text, color=self.palette[0])
+        data_source_group.append(self.data_source_text_area)
+        self.group.append(data_source_group)
+
+        #graph_settings
+        graph_settings_select_x = offset + data_source_select_width
+        graph_settings_color_x = graph_settings_select_x + select_width
+        graph_settings_select_width = 36
+        self.graph_settings_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=graph_settings_select_width, height=lower_select_height, x=graph_settings_select_x, y=lower_select_y)
+        self.group.append( self.graph_settings_select )
+        self.graph_settings_select.hidden = True
+        graph_settings_control_width = graph_settings_select_width - 2 * select_width
+        self.graph_settings_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=graph_settings_control_width, height=lower_control_height, x=graph_settings_color_x, y=lower_control_y)
+        self.group.append( self.graph_settings_color )
+        graph_settings_text_x = graph_settings_color_x + 3
+        graph_settings_group = displayio.Group(scale=1, x=graph_settings_text_x, y=lower_text_y)
+        graph_settings_text = "set"
+        self.graph_settings_text_area = label.Label(terminalio.FONT, text=graph_settings_text, color=self.palette[0])
+        graph_settings_group.append(self.graph_settings_text_area)
+        self.group.append(graph_settings_group)
+        # units_x
+        units_x_select_x = offset + data_source_control_width +graph_settings_select_width+ extra_space - 4
+        units_x_color_x = units_x_select_x + select_width
+        units_x_select_width = 96
+        self.units_x_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=units_x_select_width, height=lower_select_height, x=units_x_select_x, y=lower_select_y)
+        self.group.append( self.units_x_select )
+        self.units_x_select.hidden = True
+        units_x_control_width = units_x_select_width - 2 * select_width
+        self.units_x_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=units_x_control_width, height=lower_control_height, x=units_x_color_x, y=lower_control_y)
+        self.group.append( self.units_x_color )
+        units_x_text_x = units_x_color_x + 4
+        units_x_group = displayio.Group(scale=1, x=units_x_text_x, y=lower_text_y)
+        units_x_text = "wavelength nm"
+        self.units_x_text_area = label.Label(terminalio.FONT, text=units_x_text, color=self.palette[0])
+        units_x_group.append(self.units_x_text_area)
+        self.group.append(units_x_group)
+
+        # table / graph
+        table_graph_select_width = 46
+        table_graph_select_x = offset + data_source_control_width + graph_settings_control_width + units_x_control_width + 2*extra_space
+        table_graph_color_x = table_graph_select_x + select_width
+        self.table_graph_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=table_graph_select_width, height=lower_select_height, x=table_graph_select_x, y=lower_select_y)
+        self.group.append( self.table_graph_select )
+        self.table_graph_select.hidden = True
+        table_graph_control_width = table_graph_select_width - 2 * select_width
+        self.table_graph_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=table_graph_control_width, height=lower_control_height, x=table_graph_color_x, y=lower_control_y)
+        self.group.append( self.table_graph_color )
+        table_graph_text_x = table_graph_color_x + 3
+        table_graph_group = displayio.Group(scale=1, x=table_graph_text_x, y=lower_text_y)
+        table_graph_text = "table"
+        self.table_graph_text_area = label.Label(terminalio.FONT, text=table_graph_text, color=self.palette[0])
+        table_graph_group.append(self.table_graph_text_area)
+        self.group.append(table_graph_group)
+
+        # live
+        live_select_width = 36
+        live_select_x = offset + data_source_control_width + graph_settings_control_width + units_x_control_width + table_graph_select_width +2*extra_space
+        live_color_x = live_select_x + select_width
+        self.live_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=live_select_width, height=lower_select_height, x=live_select_x, y=lower_select_y)
+        self.group.append( self.live_select )
+        self.live_select.hidden = True
+        live_control_width = live_select_width - 2 * select_width
+        self.live_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=live_control_width, height=lower_control_height, x=live_color_x, y=lower_control_y)
+        self.group.append( self.live_color )
+        live_text_x = live_color_x + 3
+        live_group = displayio.Group(scale=1, x=live_text_x, y=lower_text_y)
+        live_text = "LIVE"
+        self.live_text_area = label.Label(terminalio.FONT, text=live_text, color=self.palette[0])
+        live_group.append(self.live_text_area)
+        self.group.append(live_group)
+
+        # RETURN
+
+        return_select_width = 50
+        return_select_x = 320 - offset - return_select_width
+        return_color_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=lower_select_height, x=return_select_x, y=lower_select_y)
+        self.group.append( self.return_select )
+        self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=lower_control_height, x=return_color_x, y=lower_control_y)
+        self.group.append( self.return_color )
+        return_text_x = return_color_x + 3
+        return_group = displayio.Group(scale=1, x=return_text_x, y=lower_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+        right_sidebar_width = 50
+        right_sidebar_x = 320 - right_sidebar_width#tbd remove
+        range_text_y = upper_control_y + 25
+        range_group = displayio.Group(scale=1, x=right_sidebar_x, y=range_text_y)
+        range_text = "range m"
+        range_text_area = label.Label(terminalio.FONT, text=range_text, color=self.palette[0])
+        range_group.append(range_text_area)
+        self.group.append(range_group)
+        range_value_group = displayio.Group(scale=2, x=right_sidebar_x, y=range_text_y+20)
+        range_value_text = "0.0m"
+        self.range_value_text_area = label.Label(terminalio.FONT, text=range_value_text, color=self.palette[0])
+        range_value_group.append(self.range_value_text_area)
+        self.group.append(range_value_group)
+        right_sidebar_spacing_y = 44
+        temperature_text_y = range_text_y + right_sidebar_spacing_y
+        temperature_group = displayio.Group(scale=1, x=right_sidebar_x, y=temperature_text_y)
+        temperature_text = "T sf-air"
+        temperature_text_area = label.Label(terminalio.FONT, text=temperature_text, color=self.palette[0])
+        temperature_group.append(temperature_text_area)
+        self.group.append(temperature_group)
+        temperature_value_group = displayio.Group(scale=2, x=right_sidebar_x, y=temperature_text_y+20)
+        temperature_value_text = "0.0C"
+        self.temperature_value_text_area = label.Label(terminalio.FONT, text=temperature_value_text, color=self.palette[0])
+        temperature_value_group.append(self.temperature_value_text_area)
+        self.group.append(temperature_value_group)
+        humidity_text_y = temperature_text_y + right_sidebar_spacing_y
+        humidity_group = displayio.Group(scale=1, x=right_sidebar_x, y=humidity_text_y)
+        humidity_text = "humidity"
+        humidity_text_area = label.Label(terminalio.FONT, text=humidity_text, color=self.palette[0])
+        humidity_group.append(humidity_text_area)
+        self.group.append(humidity_group)
+        humidity_value_group = displayio.Group(scale=2, x=right_sidebar_x, y=humidity_text_y+20)
+        humidity_value_text = "00%"
+        self.humidity_value_text_area = label.Label(terminalio.FONT, text=humidity_value_text, color=self.palette[0])
+        humidity_value_group.append(self.humidity_value_text_area)
+        self.group.append(humidity_value_group)
+        # values bar
+        values_bar_height = 14
+        values_bar_y = 240 - offset - values_bar_height - lower_control_height
+        values_bar_text_y = values_bar_y + 6
+        values_width = 26
+        left_value_x = 2* offset
+        values_spacing = int((320 - left_value_x - values_width - right_sidebar_width) / 4)
+        # left_value
+        left_value_group = displayio.Group(scale=1, x=left_value_x, y=values_bar_y)
+        left_value_text = "000"
+        self.left_value_text_area = label.Label(terminalio.FONT, text=left_value_text, color=self.palette[0])
+        left_value_group.append(self.left_value_text_area)
+        self.group.append(left_value_group)
+        # left_mid_value
+        left_mid_value_x = offset + values_spacing
+        left_mid_value_group = displayio.Group(scale=1, x=left_mid_value_x, y=values_bar_y)
+        left_mid_value_text = "000"
+        self.left_mid_value_text_area = label.Label(terminalio.FONT, text=left_mid_value_text, color=self.palette[0])
+        left_mid_value_group.append(self.left_mid_value_text_area)
+        self.group.append(left_mid_value_group)
+        # mid_value
+        mid_value_x = offset + 2* values_spacing
+        mid_value_group = displayio.Group(scale=1, x=mid_value_x, y=values_bar_y)
+        mid_value_text = "000"
+        self.mid_value_text_area = label.Label(terminalio.FONT, text=mid_value_text, color=self.palette[0])
+        mid_value_group.append(self.mid_value_text_area)
+        self.group.append(mid_value_group)
+        # right_mid_value
+        right_mid_value_x = offset + 3*values_spacing
+        right_mid_value_group = displayio.Group(scale=1, x=right_mid_value_x, y=values_bar_y)
+        right_mid_value_text = "000"
+        self.right_mid_value_text_area = label.Label(terminalio.FONT, text=right_mid_value_text, color=self.palette[0])
+        right_mid_value_group.append(self.right_mid_value_text_area)
+        self.group.append(right_mid_value_group)
+        # right_value
+        right_value_x = offset + 4*values_spacing
+        right_value_group = displayio.Group(scale=1, x=right_value_x, y=values_bar_y)
+        right_value_text = "000"
+        self.right_value_text_area = label.Label(terminalio.FONT, text=right_value_text, color=self.palette[0])
+        right_value_group.append(self.right_value_text_area)
+        self.group.append(right_value_group)
+
+        return self.group
+    def add_spectral_graph_page(self, spectral_graph_page):
+        self.spectral_graph_page = spectral_graph_page
+    def show_banner( self, message ):
+        # stays up until its deadline or until the selection moves, without holding up the other tasks
+        self.spectral_graph_page.banner_message_area.text = message
+        self.spectral_graph_page.banner_group.hidden = False
+        self.banner_hide_time = time.monotonic() + self.banner_duration
+        self.banner_select = self.instrument.remote_sensing_select
+    def check_banner( self ):
+        if not self.spectral_graph_page.banner_group.hidden:
+            if time.monotonic() > self.banner_hide_time or self.instrument.remote_sensing_select != self.banner_select:
+                self.spectral_graph_page.banner_group.hidden = True
+
+    def update_values( self, instrument ):
+        self.left_value_text_area.text = "{}".format(self.spectral_register.five_x_values[self.spectral_register.x_axis_units][0])
+        self.left_mid_value_text_area.text = "{}".format(self.spectral_register.five_x_values[self.spectral_register.x_axis_units][1])
+        self.mid_value_text_area.text = "{}".format(self.spectral_register.five_x_values[self.spectral_register.x_axis_units][2])
+        self.right_mid_value_text_area.text = "{}".format(self.spectral_register.five_x_values[self.spectral_register.x_axis_units][3])
+        self.right_value_text_area.text = "{}".format(self.spectral_register.five_x_values[self.spectral_register.x_axis_units][4])
+        if self.spectral_register.scale_linear:
+            self.scale_text_area.text = "linear"
+        else:
+            self.scale_text_area.text = "log"
+        if self.spectral_register.y_axis_irradiance:
+            self.units_y_text_area.text = "irradiance"
+        else:
+            self.units_y_text_area.text = "raw counts"
+        if self.spectral_register.scope == 0:
+            self.spectrum_text_area.text = "visible + nir"
+        if self.spectral_register.scope == 1:
+            self.spectrum_text_area.text = "visible"
+        if self.spectral_register.scope == 2:
+            self.spectrum_text_area.text = "near infrared"
+        if self.spectral_register.scope == 3:
+            self.spectrum_text_area.text = "uv + vis + nir"
+        if self.spectral_register.scope == 4:
+            self.spectrum_text_area.text = "uv + visible"
+        if self.spectral_register.scope == 5:
+            self.spectrum_text_area.text = "ultraviolet"
+        if self.spectral_register.autoexposure:
+            self.exposure_text_area.text = "autoEx"
+        else:
+            self.exposure_text_area.text = "holdEx"
+        if self.spectral_register.lamps_on:
+            self.lamps_text_area.text = "lamps on"
+        else:
+            self.lamps_text_area.text = "lamps off"
+        if self.spectral_register.data_source == 0:
+            self.data_source_text_area.text = "sample"
+        if self.spectral_register.data_source == 1:
+            self.data_source_text_area.text = "s/ref"
+        if self.spectral_register.data_source == 2:
+            self.data_source_text_area.text = "ref"
+        if self.spectral_register.x_axis_units == 0:
+            self.units_x_text_area.text = "wavelength nm"
+        if self.spectral_register.x_axis_units == 1:
+            self.units_x_text_area.text = "frequency THz"
+        if self.spectral_register.x_axis_units == 2:
+            self.units_x_text_area.text = "energy eV"
+        if self.spectral_register.x_axis_units == 3:
+            self.units_x_text_area.text = "wavenumber/cm"
+        if self.spectral_register.live:
+            self.live_text_area.text = "LIVE"
+        else:
+            self.live_text_area.text = "HOLD"
+        if self.spectral_register.show_table:
+            self.table_graph_text_area.text = "graph"
+        else:
+            self.table_graph_text_area.text = "table"
+
+        if instrument.remote_sensing_select == 6:
+            self.scale_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.scale_linear = not self.spectral_register.scale_linear
+                instrument.button_pressed = False
+        else:
+            self.scale_select.hidden = True
+        if instrument.remote_sensing_select == 7:
+            self.units_y_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.y_axis_irradiance = not self.spectral_register.y_axis_irradiance
+                instrument.button_pressed = False
+        else:
+            self.units_y_select.hidden = True
+        if instrument.remote_sensing_select == 8:
+            self.spectrum_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.scope = (self.spectral_register.scope + 1) % self.spectral_register.number_of_scope_choices
+                instrument.button_pressed = False
+        else:
+            self.spectrum_select.hidden = True
+        if instrument.remote_sensing_select == 9:
+            self.exposure_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.autoexposure = not self.spectral_register.autoexposure
+                instrument.button_pressed = False
+        else:
+            self.exposure_select.hidden = True
+        if instrument.remote_sensing_select == 10:
+            self.lamps_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.lamps_on = not self.spectral_register.lamps_on
+                for spectral_sensor in self.instrument.spectral_sensors_present:
+                    if self.spectral_register.lamps_on:
+                        spectral_sensor.lamps_on()
+                    else:
+                        spectral_sensor.lamps_off()
+                instrument.button_pressed = False
+        else:
+            self.lamps_select.hidden = True
+        if instrument.remote_sensing_select == 11:
+            self.data_source_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.data_source = (self.spectral_register.data_source + 1) % self.spectral_register.number_of_data_source_choices
+                if self.spectral_register.data_source and not self.spectral_register.reference_store.has_reference:
+                    self.show_banner( "no ref: press set" )
+                instrument.button_pressed = False
+        else:
+            self.data_source_select.hidden = True
+        if instrument.remote_sensing_select == 12:
+            self.graph_settings_select.hidden = False
+            if instrument.button_pressed:
+                # sample: take a dark spectrum, s/ref and ref: take a reference
+                if self.spectral_register.data_source == 0:
+                    self.spectral_register.reference_store.start_capture( "dark" )
+                    self.show_banner( "dark: cover optics" )
+                else:
+                    self.spectral_register.reference_store.start_capture( "reference" )
+                    self.show_banner( "ref: white panel" )
+                instrument.button_pressed = False
+        else:
+            self.graph_settings_select.hidden = True
+        if self.spectral_register.reference_store.status != self.shown_reference_status:
+            self.shown_reference_status = self.spectral_register.reference_store.status
+            if self.shown_reference_status:
+                self.show_banner( self.shown_reference_status )
+        if instrument.remote_sensing_select == 13:
+            self.units_x_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.x_axis_units = (self.spectral_register.x_axis_units + 1) % self.spectral_register.number_of_x_axis_units_choices
+                instrument.button_pressed = False
+        else:
+            self.units_x_select.hidden = True
+        if instrument.remote_sensing_select == 14:
+            self.table_graph_select.hidden = False
+            if instrument.button_pressed:
+                self.show_banner( "table or graph" )
+                #self.spectral_register.show_table = not self.spectral_register.show_table
+                instrument.button_pressed = False
+        else:
+            self.table_graph_select.hidden = True
+        if instrument.remote_sensing_select == 15:
+            self.live_select.hidden = False
+            if instrument.button_pressed:
+                self.spectral_register.live = not self.spectral_register.live
+                instrument.button_pressed = False
+        else:
+            self.live_select.hidden = True
+        if instrument.remote_sensing_select == 16:
+            self.return_select.hidden = False
+            if instrument.button_pressed:
+                instrument.active_page_number = 2
+                instrument.button_pressed = False
+        else:
+            self.return_select.hidden = True
+        self.check_banner()
+
+        # range, temperature and humidity are the values the sampling task read with the latest spectrum
+        if self.spectral_register.live and self.spectral_register.spectrum_sequence != self.readout_sequence:
+            self.readout_sequence = self.spectral_register.spectrum_sequence
+            if self.mlx90614_surface_thermometer.pn and self.hdc3022_air_sensor.pn:
+                range_m = self.lv_ez_mb1013_rangefinder.range_m if self.lv_ez_mb1013_rangefinder else None
+                if range_m is None:
+                    self.range_value_text_area.text = " --"
+                elif range_m < 0.3:
+                    self.range_value_text_area.text = "<0.3"
+                elif range_m > 2.5:
+                    self.range_value_text_area.text = ">2.5"
+                else:
+                    self.range_value_text_area.text = "{}".format(round(range_m,2))
+                t_surface_minus_air_C = int(self.mlx90614_surface_thermometer.surface_temperature_C - self.hdc3022_air_sensor.temperature_C)
+                if t_surface_minus_air_C < 0:
+                    self.temperature_value_text_area.text = "{}C".format(t_surface_minus_air_C)
+                elif t_surface_minus_air_C < 10:
+                    self.temperature_value_text_area.text = " {}C".format(t_surface_minus_air_C)
+                else:
+                    self.temperature_value_text_area.text = "{}C".format(t_surface_minus_air_C)
+
+                self.humidity_value_text_area.text = "{}%".format(int(self.hdc3022_air_sensor.humidity_percent))
+            else:
+                self.range_value_text_area.text = " --"
+                self.humidity_value_text_area.text = " --"
+                self.temperature_value_text_area.text = " --"
+
+def make_remote_sensing_pages( instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder ):
+    # the remote sensing page and the spectral graph drawn inside it are built, shown and dropped together
+    remote_sensing_page = make_remote_sensing_page( instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder ) #9
+    spectral_graph_page = make_spectral_graph_page( instrument, spectral_register ) #10 takes a lot of time
+    instrument.add_spectral_graph_page( spectral_graph_page )
+    remote_sensing_page.add_spectral_graph_page( spectral_graph_page )
+    return remote_sensing_page
+
+def make_remote_sensing_page( instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder ):
+    instrument.welcome_page.announce( "make_remote_sensing_page" )
+    page = Remote_Sensing_Page( instrument, spectral_register, hdc3022_air_sensor, mlx90614_surface_thermometer, lv_ez_mb1013_rangefinder )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 9, page )
+    return page
+
+class Main_Menu_Page( Page ):
+    def __init__( self, palette):
+        super().__init__()
+        self.palette = palette
+    def make_group( self ):
+        menu_list = "Remote Sense", "Air Analyzer", "Sensors", "Time / Place", "*future use", "*future use", "*future use", "*future use"#, "* Air Analyz", "* Heat", "* Plants"
+        menu_color_list = 20, 12, 21, 14, 19, 19, 19, 19
+        self.group = displayio.Group()
+        start_y = 54
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240-start_y, x=0, y=start_y )
+        self.group.append( status_background )
+        title_bar = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=320-2*5, height=24, x=0+5, y=start_y)
+        self.group.append( title_bar )
+        title_group = displayio.Group(scale=2, x=100, y=12+start_y)
+        title_text = "Main Menu"
+        title_text_area = label.Label(terminalio.FONT, text=title_text, color=self.palette[0])
+        title_group.append(title_text_area)
+        self.group.append(title_group)
+        #selection rectangles
+        selection_start_x = 2
+        selection_start_y = 78
+        selection_offset_x = 158
+        selection_offset_y = 31
+        self.selection_rectangles = []
+        #TBD be more clever about this section
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x, y=selection_start_y))
+        self.group.append( self.selection_rectangles[0] )
+        self.selection_rectangles[0].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x+selection_offset_x, y=selection_start_y))
+        self.group.append( self.selection_rectangles[1] )
+        self.selection_rectangles[1].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x, y=selection_start_y+selection_offset_y))
+        self.group.append( self.selection_rectangles[2] )
+        self.selection_rectangles[2].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x+selection_offset_x, y=selection_start_y+selection_offset_y))
+        self.group.append( self.selection_rectangles[3] )
+        self.selection_rectangles[3].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x, y=selection_start_y+selection_offset_y*2))
+        self.group.append( self.selection_rectangles[4] )
+        self.selection_rectangles[4].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x+selection_offset_x, y=selection_start_y+selection_offset_y*2))
+        self.group.append( self.selection_rectangles[5] )
+        self.selection_rectangles[5].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x, y=selection_start_y+selection_offset_y*3))
+        self.group.append( self.selection_rectangles[6] )
+        self.selection_rectangles[6].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=158, height=36, x=selection_start_x+selection_offset_x, y=selection_start_y+selection_offset_y*3))
+        self.group.append( self.selection_rectangles[7] )
+        self.selection_rectangles[7].hidden = True
+        #choice color rectangles
+        selection_border = 5
+        choice_rectangles = []
+        #TBD be more clever about this section
+        choice_width = 158-2*selection_border
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[0],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border, y=selection_start_y+selection_border))
+        self.group.append( choice_rectangles[0] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[1],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border+selection_offset_x, y=selection_start_y+selection_border))
+        self.group.append( choice_rectangles[1] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[2],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border, y=selection_start_y+selection_border+selection_offset_y))
+        self.group.append( choice_rectangles[2] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[3],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border+selection_offset_x, y=selection_start_y+selection_border+selection_offset_y))
+        self.group.append( choice_rectangles[3] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[4],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border, y=selection_start_y+selection_border+selection_offset_y*2))
+        self.group.append( choice_rectangles[4] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[5],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border+selection_offset_x, y=selection_start_y+selection_border+selection_offset_y*2))
+        self.group.append( choice_rectangles[5] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[6],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border, y=selection_start_y+selection_border+selection_offset_y*3))
+        self.group.append( choice_rectangles[6] )
+        choice_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=menu_color_list[7],
+            width=choice_width, height=36-2*selection_border, x=selection_start_x+selection_border+selection_offset_x, y=selection_start_y+selection_border+selection_offset_y*3))
+        self.group.append( choice_rectangles[7] )
+
+
+
+        #choice text
+        menu_spacing_y = selection_offset_y
+        menu_start_y = 12+start_y+30
+        menu_spacing_x = 158
+        menu_start_x = 10
+        for index in range ( 0, len(menu_list), 2):
+            item_group = displayio.Group(scale=2, x=menu_start_x, y=menu_start_y+menu_spacing_y*int(index/2))
+            item_text = menu_list[ index ]
+            item_text_area = label.Label(terminalio.FONT, text=item_text, color=self.palette[0])
+            item_group.append(item_text_area)
+            self.group.append(item_group)
+            if index + 1 < len(menu_list):
+                item_group = displayio.Group(scale=2, x=menu_start_x+menu_spacing_x, y=menu_start_y+menu_spacing_y*int(index/2))
+                item_text = menu_list[ index+1 ]
+                item_text_area = label.Label(terminalio.FONT, text=item_text, color=self.palette[0])
+                item_group.append(item_text_area)
+                self.group.append(item_group)
+
+        footer_start_y = 204
+        footer_offset_x = 106
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=104, height=36, x=selection_start_x, y=footer_start_y))
+        self.group.append( self.selection_rectangles[8] )
+        self.selection_rectangles[8].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=104, height=36, x=selection_start_x+footer_offset_x, y=footer_start_y))
+        self.group.append( self.selection_rectangles[9] )
+        self.selection_rectangles[9].hidden = True
+        self.selection_rectangles.append( vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=104, height=36, x=selection_start_x+2*footer_offset_x, y=footer_start_y))
+        self.group.append( self.selection_rectangles[10] )
+        self.selection_rectangles[10].hidden = True
+        status_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=16, width=96, height=28, x=selection_start_x+4, y=208)
+        self.group.append( status_color )
+        self.more_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=96, height=28, x=selection_start_x+4+footer_offset_x, y=208)
+        self.group.append( self.more_color )
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=22, width=96, height=28, x=selection_start_x+4+2*footer_offset_x, y=208)
+        self.group.append( self.return_color )
+
+        footer_text_start_x = 14
+        footer_text_y = 222
+        status_text = "Status"
+        status_group = displayio.Group(scale=2, x=footer_text_start_x, y=footer_text_y)
+        status_text_area = label.Label(terminalio.FONT, text=status_text, color=self.palette[0])
+        status_group.append(status_text_area)
+        self.group.append(status_group)
+        more_text =   "*More.."
+        more_group = displayio.Group(scale=2, x=footer_text_start_x+footer_offset_x, y=footer_text_y)
+        more_text_area = label.Label(terminalio.FONT, text=more_text, color=self.palette[0])
+        more_group.append(more_text_area)
+        self.group.append(more_group)
+        return_text = "RETURN"
+        return_group = displayio.Group(scale=2, x=footer_text_start_x+2*footer_offset_x, y=footer_text_y)
+        return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(return_text_area)
+        self.group.append(return_group)
+        return self.group
+
+    def update_values( self, instrument ):
+        if instrument.main_menu_select in range( 10, 13 ): ### skip future use choices
+            instrument.main_menu_select = 14
+        if instrument.main_menu_select == 15:  ### skip future use *more option
+            instrument.main_menu_select = 16
+        if instrument.main_menu_select == 6:
+            self.selection_rectangles[0].hidden = False
+            if instrument.button_pressed:
+                instrument.active_page_number = 9
+                instrument.button_pressed = False
+        else:
+            self.selection_rectangles[0].hidden = True
+        if instrument.main_menu_select == 7:
+            self.selection_rectangles[1].hidden = False
+            if instrument.button_pressed:
+                instrument.active_page_number = 8
+                instrument.button_pressed = False
+        else:
+            self.selection_rectangles[1].hidden = True
+        if instrument.main_menu_select == 8:
+            self.selection_rectangles[2].hidden = False
+            if instrument.button_pressed:
+                instrument.active_page_number = 5
+                instrument.button_pressed = False
+        else:
+            self.selection_rectangles[2].hidden = True
+        if instrument.main_menu_select == 9:
+            if instrument.button_pressed:
+                instrument.active_page_number = 7
+                instrument.button_pressed = False
+            self.selection_rectangles[3].hidden = False
+        else:
+            self.selection_rectangles[3].hidden = True
+        if instrument.main_menu_select == 10:
+            self.selection_rectangles[4].hidden = False
+        else:
+            self.selection_rectangles[4].hidden = True
+        if instrument.main_menu_select == 11:
+            self.selection_rectangles[5].hidden = False
+        else:
+            self.selection_rectangles[5].hidden = True
+        if instrument.main_menu_select == 12:
+            self.selection_rectangles[6].hidden = False
+        else:
+            self.selection_rectangles[6].hidden = True
+        if instrument.main_menu_select == 13:
+            self.selection_rectangles[7].hidden = False
+        else:
+            self.selection_rectangles[7].hidden = True
+        if instrument.main_menu_select == 14:
+            self.selection_rectangles[8].hidden = False
+            if instrument.button_pressed:
+                instrument.active_page_number = 3
+                instrument.button_pressed = False
+        else:
+            self.selection_rectangles[8].hidden = True
+        if instrument.main_menu_select == 15:
+            self.selection_rectangles[9].hidden = False
+        else:
+            self.selection_rectangles[9].hidden = True
+        if instrument.main_menu_select == 16:
+            self.selection_rectangles[10].hidden = False
+            if instrument.button_pressed:
+                print("TBD go back to previous page" )
+                instrument.button_pressed = False
+        else:
+            self.selection_rectangles[10].hidden = True
+
+def make_main_menu_page( instrument ):
+    instrument.welcome_page.announce( "make_main_menu_page" )
+    page = Main_Menu_Page(instrument.palette)
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 2, page )
+    return page
+
+class Controls_Page( Page ):
+    def __init__( self, palette, gps, battery_monitor ):
+        super().__init__()
+        self.palette = palette
+        self.gps = gps
+        self.battery_monitor = battery_monitor
+        self.select_value = 2
+        self.number_of_select_values = 7
+    def make_group( self ):
+        self.group = displayio.Group()
+        control_bar_height = 54
+        text_y1 = 16
+        text_y2 = text_y1 + 14 + 3
+        select_width = 4
+        offset = 4
+        select_height = control_bar_height - 2 * offset
+        select_y = offset
+        control_y = select_y + select_width
+        control_height = select_height - 2 * select_width
+        controls_background = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=320, height=control_bar_height, x=0, y=0)
+        self.group.append( controls_background )
+        # gps
+        gps_select_x = offset - 1
+        gps_color_x = gps_select_x + select_width
+        gps_select_width = 44
+        self.gps_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=gps_select_width, height=select_height, x=gps_select_x, y=select_y)
+        self.group.append( self.gps_select )
+        self.gps_select.hidden = True
+        gps_control_width = gps_select_width - 2 * select_width
+        self.gps_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=8, width=gps_control_width, height=control_height, x=gps_color_x, y=control_y)
+        self.group.append( self.gps_color )
+        gps_text_x = gps_color_x + 3
+        gps_group = displayio.Group(scale=1, x=gps_text_x, y=text_y1+2)
+        gps_text = " GPS"
+        gps_text_area = label.Label(terminalio.FONT, text=gps_text, color=self.palette[9])
+        gps_group.append(gps_text_area)
+        self.group.append(gps_group)
+        gps_value_group = displayio.Group(scale=1, x=gps_text_x, y=text_y2)
+        gps_value_text = "nofix"
+        self.gps_value_text_area = label.Label(terminalio.FONT, text=gps_value_text, color=self.palette[9])
+        gps_value_group.append(self.gps_value_text_area)
+        self.group.append(gps_value_group)
+        # batch
+        batch_select_x = 2*offset+gps_select_width-3
+        batch_color_x = batch_select_x + select_width
+        batch_select_width = 52
+        self.batch_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=batch_select_width, height=select_height, x=batch_select_x, y=select_y)
+        self.group.append( self.batch_select )
+        self.batch_select.hidden = True
+        batch_control_width = batch_select_width - 2 * select_width
+        batch_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=6, width=batch_control_width, height=control_height, x=batch_color_x, y=control_y)
+        self.group.append( batch_color )
+        self.batch_text_x = batch_color_x + 5
+        batch_group = displayio.Group(scale=1, x=self.batch_text_x+1, y=text_y1)
+        batch_text = "batch"
+        batch_text_area = label.Label(terminalio.FONT, text=batch_text, color=self.palette[9])
+        batch_group.append(batch_text_area)
+        self.group.append(batch_group)
+        self.batch_value_group = displayio.Group(scale=2, x=self.batch_text_x, y=text_y2)
+        batch_value_text = "000"
+        self.batch_value_text_area = label.Label(terminalio.FONT, text=batch_value_text, color=self.palette[9])
+        self.batch_value_group.append(self.batch_value_text_area)
+        self.group.append(self.batch_value_group)
+        # pause and record
+        pause_record_select_x = 2*offset+gps_select_width+batch_select_width+2
+        pause_record_x = pause_record_select_x + select_width
+        pause_record_select_width = select_height
+        self.pause_record_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=pause_record_select_width, height=select_height, x=pause_record_select_x, y=select_y)
+        self.group.append( self.pause_record_select )
+        pause_record_control_width = pause_record_select_width - 2 * select_width
+        pause_record_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=pause_record_control_width, height=control_height, x=pause_record_x, y=control_y)
+        self.group.append( pause_record_color )
+        pause_record_offset_x = 6
+        pause_record_y = 14
+        pause_base = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=26, height=26, x=pause_record_x+pause_record_offset_x, y=pause_record_y)
+        self.group.append( pause_base )
+        pause_split = vectorio.Rectangle(pixel_shader=self.palette, color_index=9, width=8, height=26, x=pause_record_x+9+pause_record_offset_x, y=pause_record_y)
+        self.group.append( pause_split )
+        self.record_circle = vectorio.Circle( pixel_shader=self.palette, color_index=2, radius=18, x=pause_record_x+12+pause_record_offset_x, y=pause_record_y+13 )
+        self.group.append( self.record_circle )
+        #self.record_circle.hidden = True
+        self.pause_record_select.hidden = True
+        # burst
+        burst_select_x = pause_record_select_width + pause_record_x # - offset
+        burst_color_x = burst_select_x + select_width
+        burst_select_width = 44
+        self.burst_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=burst_select_width, height=select_height, x=burst_select_x, y=select_y)
+        self.group.append( self.burst_select )
+        self.burst_select.hidden = True
+        burst_control_width = burst_select_width - 2 * select_width
+        self.burst_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=16, width=burst_control_width, height=control_height, x=burst_color_x, y=control_y)
+        self.group.append( self.burst_color )
+        burst_text_x = burst_color_x + 6
+        burst_group = displayio.Group(scale=1, x=burst_text_x-2, y=text_y1)
+        burst_text = "burst"
+        burst_text_area = label.Label(terminalio.FONT, text=burst_text, color=self.palette[9])
+        burst_group.append(burst_text_area)
+        self.group.append(burst_group)
+        burst_value_group = displayio.Group(scale=2, x=burst_text_x+1, y=text_y2)
+        burst_value_text = "00"
+        self.burst_value_text_area = label.Label(terminalio.FONT, text=burst_value_text, color=self.palette[9])
+        burst_value_group.append(self.burst_value_text_area)
+        self.group.append(burst_value_group)
+        # interval
+        interval_select_x = burst_select_width + burst_color_x - 2
+        interval_color_x = interval_select_x + select_width
+        interval_select_width = 58
+        self.interval_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=interval_select_width, height=select_height, x=interval_select_x, y=select_y)
+        self.group.append( self.interval_select )
+        self.interval_select.hidden = True
+        interval_control_width = interval_select_width - 2 * select_width
+        interval_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=7, width=interval_control_width, height=control_height, x=interval_color_x, y=control_y)
+        self.group.append( interval_color )
+        interval_text_x = interval_color_x + 5
+        interval_group = displayio.Group(scale=1, x=interval_text_x-3, y=text_y1)
+        interval_text = "settings"
+        interval_text_area = label.Label(terminalio.FONT, text=interval_text, color=self.palette[9])
+        interval_group.append(interval_text_area)
+        self.group.append(interval_group)
+        interval_value_group = displayio.Group(scale=2, x=interval_text_x+3, y=text_y2)
+        interval_value_text = " >>"
+        self.interval_value_text_area = label.Label(terminalio.FONT, text=interval_value_text, color=self.palette[9])
+        interval_value_group.append(self.interval_value_text_area)
+        self.group.append(interval_value_group)
+        # battery
+        battery_select_x = interval_select_width + interval_color_x - 2
+        battery_color_x = battery_select_x + select_width
+        battery_select_width = 56
+        self.battery_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=battery_select_width, height=select_height, x=battery_select_x, y=select_y)
+        self.group.append( self.battery_select )
+        self.battery_select.hidden = True
+        battery_control_width = battery_select_width - 2 * select_width
+        battery_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=15, width=battery_control_width, height=control_height, x=battery_color_x, y=control_y)
+        self.group.append( battery_color )
+        battery_text_x = battery_color_x + 6
+        battery_group = displayio.Group(scale=1, x=battery_text_x-2, y=text_y1)
+        battery_text = "battery"
+        battery_text_area = label.Label(terminalio.FONT, text=battery_text, color=self.palette[9])
+        battery_group.append(battery_text_area)
+        self.group.append(battery_group)
+        battery_value_group = displayio.Group(scale=2, x=battery_text_x+1, y=text_y2)
+        battery_value_text = "00%"
+        self.battery_value_text_area = label.Label(terminalio.FONT, text=battery_value_text, color=self.palette[9])
+        battery_value_group.append(self.battery_value_text_area)
+        self.group.append(battery_value_group)
+        return self.group
+    def update_burst_countdown( self, value ):
+        if value < 10:
+            self.burst_value_text_area.text = " {}".format(value)
+        else:
+            self.burst_value_text_area.text = "{}".format(value)
+    def update_values( self, instrument ):
+        if self.gps.fix():
+            self.gps_value_text_area.text = " FIX"
+            self.gps_color.color_index = 18
+        else:
+            self.gps_value_text_area.text = "nofix"
+            self.gps_color.color_index = 8
+        self.battery_value_text_area.text = "{}%".format( int(self.battery_monitor.percentage))
+        if instrument.burst_count < 10:
+            self.burst_value_text_area.text = " {}".format(instrument.burst_count)
+        else:
+            self.burst_value_text_area.text = "{}".format(instrument.burst_count)
+        if instrument.record:
+            self.record_circle.hidden = False
+        else:
+            self.record_circle.hidden = True
+        self.batch_value_text_area.text = "{}".format(instrument.batch_number)
+        if instrument.batch_number < 10:
+            self.batch_value_group.x = self.batch_text_x+7
+        elif instrument.batch_number < 100:
+            self.batch_value_group.x = self.batch_text_x+5
+        else:
+            self.batch_value_group.x = self.batch_text_x-3
+
+        ## processing inputs
+
+
+        if instrument.active_page_number == 2: # main menu
+            if instrument.main_menu_select == 0:
+                self.gps_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 7
+                    instrument.button_pressed = False
+            else:
+                self.gps_select.hidden = True
+            if instrument.main_menu_select == 1:
+                self.batch_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.update_batch()
+                    instrument.button_pressed = False
+            else:
+                self.batch_select.hidden = True
+            if instrument.main_menu_select == 2:
+                self.pause_record_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.record = not instrument.record
+                    instrument.button_pressed = False
+            else:
+                self.pause_record_select.hidden = True
+            if instrument.main_menu_select == 3:
+                self.burst_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.take_burst = True
+                    instrument.record = False
+                    self.burst_color.color_index = 6
+                    instrument.button_pressed = False
+            else:
+                self.burst_select.hidden = True
+            if instrument.main_menu_select == 4:
+                self.interval_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 4
+                    instrument.button_pressed = False
+            else:
+                self.interval_select.hidden = True
+            if instrument.main_menu_select == 5:
+                self.battery_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 3
+                    instrument.button_pressed = False
+            else:
+                self.battery_select.hidden = True
+
+        if instrument.active_page_number == 9: # remote sensing
+            if instrument.remote_sensing_select == 0:
+                self.gps_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 7
+                    instrument.button_pressed = False
+            else:
+                self.gps_select.hidden = True
+            if instrument.remote_sensing_select == 1:
+                self.batch_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.update_batch()
+                    instrument.button_pressed = False
+            else:
+                self.batch_select.hidden = True
+            if instrument.remote_sensing_select == 2:
+                self.pause_record_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.record = not instrument.record
+                    instrument.button_pressed = False
+            else:
+                self.pause_record_select.hidden = True
+            if instrument.remote_sensing_select == 3:
+                self.burst_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.take_burst = True
+                    instrument.record = False
+                    self.burst_color.color_index = 6
+                    instrument.button_pressed = False
+            else:
+                self.burst_select.hidden = True
+            if instrument.remote_sensing_select == 4:
+                self.interval_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 4
+                    instrument.button_pressed = False
+            else:
+                self.interval_select.hidden = True
+            if instrument.remote_sensing_select == 5:
+                self.battery_select.hidden = False
+                if instrument.button_pressed:
+                    instrument.active_page_number = 3
+                    instrument.button_pressed = False
+            else:
+                self.battery_select.hidden = True
+
+def make_controls_page( instrument, gps, battery_monitor ):
+    instrument.welcome_page.announce( "make_controls_page" )
+    page = Controls_Page( instrument.palette, gps, battery_monitor )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 1, page, pinned = True )
+    return page
+
+class Settings_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        title_group = displayio.Group(scale=2, x=10, y=18)
+        title_text = "Settings"
+        title_text_area = label.Label(terminalio.FONT, text=title_text, color=self.palette[0])
+        title_group.append(title_text_area)
+        self.group.append(title_group)
+        spacing_y = 25
+
+        value_x = 220
+        select_x = 212
+        select_height = 30
+        select_width = 100
+        select_start_y = spacing_y + 4
+        border_width = 2
+
+        interval_group = displayio.Group(scale=2, x=10, y= 18 + spacing_y)
+        interval_text = "Sample Interval:"
+        interval_text_area = label.Label(terminalio.FONT, text=interval_text, color=self.palette[0])
+        interval_group.append(interval_text_area)
+        self.group.append(interval_group)
+
+        self.interval_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width,
+                                                            height=select_height, x=select_x, y=select_start_y )
+        self.group.append( self.interval_value_select )
+        self.interval_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                            width=select_width - 2* border_width, height=select_height-2*border_width,
+                                                            x=select_x+border_width, y=select_start_y+border_width )
+        self.group.append( self.interval_value_highlight )
+        self.interval_value_select.hidden = True
+
+        interval_value_group = displayio.Group(scale=2, x=value_x, y= 18 + spacing_y)
+        interval_value_text = "000s"
+        self.interval_value_text_area = label.Label(terminalio.FONT, text=interval_value_text, color=self.palette[0])
+        interval_value_group.append(self.interval_value_text_area)
+        self.group.append(interval_value_group)
+
+        burst_group = displayio.Group(scale=2, x=10, y= 18 +2* spacing_y)
+        burst_text = "Burst Count:"
+        burst_text_area = label.Label(terminalio.FONT, text=burst_text, color=self.palette[0])
+        burst_group.append(burst_text_area)
+        self.group.append(burst_group)
+
+        self.burst_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width,
+                                                        height=select_height, x=select_x, y=select_start_y + spacing_y)
+        self.group.append( self.burst_value_select )
+        self.burst_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                        width=select_width - 2* border_width, height=select_height-2*border_width,
+                                                        x=select_x+border_width, y=select_start_y+border_width + spacing_y)
+        self.group.append( self.burst_value_highlight )
+        self.burst_value_select.hidden = True
+
+        burst_value_group = displayio.Group(scale=2, x=value_x, y= 18 + 2*spacing_y)
+        burst_value_text = "000"
+        self.burst_value_text_area = label.Label(terminalio.FONT, text=burst_value_text, color=self.palette[0])
+        burst_value_group.append(self.burst_value_text_area)
+        self.group.append(burst_value_group)
+
+        serial_out_group = displayio.Group(scale=2, x=10, y= 18 +3* spacing_y)
+        serial_out_text = "USB serial data output:"
+        serial_out_text_area = label.Label(terminalio.FONT, text=serial_out_text, color=self.palette[0])
+        serial_out_group.append(serial_out_text_area)
+        self.group.append(serial_out_group)
+
+        serial_out_x_adjust = 72
+        self.serial_out_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width - serial_out_x_adjust,
+                                                        height=select_height, x=select_x+serial_out_x_adjust, y=select_start_y + 2* spacing_y)
+        self.group.append( self.serial_out_value_select )
+        self.serial_out_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                        width=select_width - 2* border_width-serial_out_x_adjust, height=select_height-2*border_width,
+                                                        x=select_x+border_width+serial_out_x_adjust, y=select_start_y+border_width + 2* spacing_y)
+        self.group.append( self.serial_out_value_highlight )
+        self.serial_out_value_select.hidden = True
+
+        serial_out_value_group = displayio.Group(scale=2, x=value_x+70, y= 18 + 3*spacing_y)
+        serial_out_value_text = "N"
+        self.serial_out_value_text_area = label.Label(terminalio.FONT, text=serial_out_value_text, color=self.palette[0])
+        serial_out_value_group.append(self.serial_out_value_text_area)
+        self.group.append(serial_out_value_group)
+
+        text_group = displayio.Group(scale=2, x=10, y= 18 +4* spacing_y)
+        text = "TBD allow user to set vals"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        if False:
+            spectral_sensor_group = displayio.Group(scale=2, x=10, y=int(18+4.5*spacing_y))
+            spectral_sensor_text = "Spectral Sensor:"
+            spectral_sensor_text_area = label.Label(terminalio.FONT, text=spectral_sensor_text, color=self.palette[0])
+            spectral_sensor_group.append(spectral_sensor_text_area)
+            self.group.append(spectral_sensor_group)
+
+            self.sensor_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width,
+                                                            height=select_height, x=select_x, y=int( select_start_y + 3.5* spacing_y) )
+            self.group.append( self.sensor_value_select )
+            self.sensor_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                            width=select_width - 2* border_width, height=select_height-2*border_width,
+                                                            x=select_x+border_width, y=int( select_start_y+border_width + 3.5* spacing_y) )
+            self.group.append( self.sensor_value_highlight )
+            self.sensor_value_select.hidden = True
+
+            spectral_sensor_value_group = displayio.Group(scale=2, x=value_x, y=int(18+4.5*spacing_y))
+            spectral_sensor_value_text = "as7265x"
+            self.spectral_sensor_value_text_area = label.Label(terminalio.FONT, text=spectral_sensor_value_text, color=self.palette[0])
+            spectral_sensor_value_group.append(self.spectral_sensor_value_text_area)
+            self.group.append(spectral_sensor_value_group)
+
+            gain_group = displayio.Group(scale=2, x=10, y=int(18 + 5.5* spacing_y))
+            gain_text = "Gain:"
+            gain_text_area = label.Label(terminalio.FONT, text=gain_text, color=self.palette[0])
+            gain_group.append(gain_text_area)
+            self.group.append(gain_group)
+
+            self.gain_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width,
+                                                            height=select_height, x=select_x, y=int( select_start_y + 4.5* spacing_y) )
+            self.group.append( self.gain_value_select )
+            self.gain_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                            width=select_width - 2* border_width, height=select_height-2*border_width,
+                                                            x=select_x+border_width, y=int( select_start_y+border_width + 4.5* spacing_y) )
+            self.group.append( self.gain_value_highlight )
+            self.gain_value_select.hidden = True
+
+            gain_value_group = displayio.Group(scale=2, x=value_x, y=int(18 + 5.5* spacing_y))
+            gain_value_text = "1X"
+            self.gain_value_text_area = label.Label(terminalio.FONT, text=gain_value_text, color=self.palette[0])
+            gain_value_group.append(self.gain_value_text_area)
+            self.group.append(gain_value_group)
+
+            integration_time_group = displayio.Group(scale=2, x=10, y=int(18+6.5*spacing_y))
+            integration_time_text = "Integration Time:"
+            integration_time_text_area = label.Label(terminalio.FONT, text=integration_time_text, color=self.palette[0])
+            integration_time_group.append(integration_time_text_area)
+            self.group.append(integration_time_group)
+
+            self.integration_time_value_select = vectorio.Rectangle( pixel_shader=self.palette, color_index = 0, width=select_width,
+                                                            height=select_height, x=select_x, y=int( select_start_y + 5.5* spacing_y) )
+            self.group.append( self.integration_time_value_select )
+            self.integration_time_value_highlight = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9,
+                                                            width=select_width - 2* border_width, height=select_height-2*border_width,
+                                                            x=select_x+border_width, y=int( select_start_y+border_width + 5.5* spacing_y) )
+            self.group.append( self.integration_time_value_highlight )
+            self.integration_time_value_select.hidden = True
+
+            integration_time_value_group = displayio.Group(scale=2, x=value_x, y=int(18+6.5*spacing_y))
+            integration_time_value_text = "166ms"
+            self.integration_time_value_text_area = label.Label(terminalio.FONT, text=integration_time_value_text, color=self.palette[0])
+            integration_time_value_group.append(self.integration_time_value_text_area)
+            self.group.append(integration_time_value_group)
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 14
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+        intervals = instrument.sample_interval_s
+        #print( intervals )
+        intervalm = intervals / 60
+        intervalh = intervalm / 60
+        intervald = intervalh / 24
+        #print( intervals, intervalm, intervalh, intervald )
+        if intervals < 10:
+            interval_text = " {}s".format(int(intervals))
+        elif intervals < 60:
+            interval_text = "{}s".format(int(intervals))
+        elif intervalm < 10:
+            interval_text = " {}m".format(int(intervalm))
+        elif intervals < 60:
+            interval_text = "{}m".format(int(intervalm))
+        elif intervalh < 10:
+            interval_text = " {}h".format(int(intervalh))
+        elif intervalh < 60:
+            interval_text = "{}h".format(int(intervalh))
+        elif intervald < 10:
+            interval_text = " {}d".format(int(intervald))
+        else:
+            interval_text = "{}d".format(int(intervald))
+        self.interval_value_text_area.text = interval_text
+        if instrument.burst_count < 10:
+            burst_text = " {}".format(instrument.burst_count)
+        else:
+            burst_text = "{}".format(instrument.burst_count)
+        #if instrument.usb_serial_out:
+        #    self.serial_out_value_text_area.text = "Y"
+        #else:
+        #    self.serial_out_value_text_area.text = "N"
+
+
+        self.burst_value_text_area.text = burst_text
+
+def make_settings_page( instrument ):
+    instrument.welcome_page.announce( "make_settings_page" )
+    page = Settings_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 4, page )
+    return page
+
+class Status_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+        self.storage_manager = instrument.storage_manager
+        self.shown_storage_sequence = None
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Instrument Status: TBD"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "main battery status"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "clock battery status"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        # sd card free space, bytes logged per hour and the time left at that rate
+        self.storage_text_areas = []
+        for line in range( 0, 3 ):
+            text_group = displayio.Group(scale=2, x=10, y=18+(3+line)*text_spacing_y)
+            text_area = label.Label(terminalio.FONT, text="", color=self.palette[0])
+            text_group.append(text_area)
+            self.group.append(text_group)
+            self.storage_text_areas.append( text_area )
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        #if instrument.active_page_number == 3:
+        if self.storage_manager and self.storage_manager.sequence != self.shown_storage_sequence:
+            self.shown_storage_sequence = self.storage_manager.sequence
+            for text_area, text in zip( self.storage_text_areas, self.storage_manager.status_text() ):
+                text_area.text = text
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_status_page( instrument ):
+    instrument.welcome_page.announce( "make_status_page" )
+    page = Status_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 3, page )
+    return page
+
+class Sensor_List_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Sensor List: TBD"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "list active sensors"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "list supported inactive"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        if False:
+            text_group = displayio.Group(scale=2, x=10, y=18+3*text_spacing_y)
+            text = "sd card storage remaining"
+            text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+            text_group.append(text_area)
+            self.group.append(text_group)
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_sensor_list_page( instrument ):
+    instrument.welcome_page.announce( "make_sensor_list_page" )
+    page = Sensor_List_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 5, page )
+    return page
+
+class Generic_Sensor_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Sensor Data: TBD"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "sensor mfr, name, pn"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "live sensor data"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        if False:
+            text_group = displayio.Group(scale=2, x=10, y=18+3*text_spacing_y)
+            text = "sd card storage remaining"
+            text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+            text_group.append(text_area)
+            self.group.append(text_group)
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_generic_sensor_page( instrument ):
+    instrument.welcome_page.announce( "make_generic_sensor_page" )
+    page = Generic_Sensor_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 6, page )
+    return page
+
+class Time_Place_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Time / Place: TBD"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "clock time, settable"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "gps time if available"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+3*text_spacing_y)
+        text = "> sync clock to gps"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+4*text_spacing_y)
+        text = "gps position, alt"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+5*text_spacing_y)
+        text = "gps satellites visible"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_time_place_page( instrument ):
+    instrument.welcome_page.announce( "make_time_place_page" )
+    page = Time_Place_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 7, page )
+    return page
+
+class Air_Analyzer_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Air Analyzer: TBD"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "co2, ch4"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "pressure, temp, humid"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+3*text_spacing_y)
+        text = "particulates"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+        if False:
+            text_group = displayio.Group(scale=2, x=10, y=18+4*text_spacing_y)
+            text = " "
+            text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+            text_group.append(text_area)
+            self.group.append(text_group)
+
+            text_group = displayio.Group(scale=2, x=10, y=18+5*text_spacing_y)
+            text = " "
+            text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+            text_group.append(text_area)
+            self.group.append(text_group)
+
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_air_analyzer_page( instrument ):
+    instrument.welcome_page.announce( "make_air_analyzer_page" )
+    page = Air_Analyzer_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 8, page )
+    return page
+
+class Remote_Sensing_Missing_Page( Page ):
+    def __init__( self, instrument ):
+        super().__init__()
+        self.palette = instrument.palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        status_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( status_background )
+        text_spacing_y = 28
+        status_title_group = displayio.Group(scale=2, x=10, y=18)
+        status_title_text = "Remote Sensing Missing:"
+        status_title_text_area = label.Label(terminalio.FONT, text=status_title_text, color=self.palette[0])
+        status_title_group.append(status_title_text_area)
+        self.group.append(status_title_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+text_spacing_y)
+        text = "connect either "
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+2*text_spacing_y)
+        text = "Remote Sensing plugin"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+3*text_spacing_y)
+        text = "or as7265x_Spectrometer"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+        text_group = displayio.Group(scale=2, x=10, y=18+4*text_spacing_y)
+        text = "to view spectral graph"
+        text_area = label.Label(terminalio.FONT, text=text, color=self.palette[0])
+        text_group.append(text_area)
+        self.group.append(text_group)
+
+
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, instrument ):
+        if instrument.button_pressed:
+            instrument.active_page_number = 2
+            instrument.button_pressed = False
+
+def make_remote_sensing_missing_page( instrument ):
+    instrument.welcome_page.announce( "make_remote_sensing_missing_page" )
+    page = Remote_Sensing_Missing_Page( instrument )
+    group = page.make_group()
+    page.hide()
+    instrument.page_cache.place( 9, page )
+    return page
+
+class GPS_Page( Page ):
+    def __init__( self, palette):
+        super().__init__()
+        self.palette = palette
+    def make_group( self ):
+        self.group = displayio.Group()
+        gps_background = vectorio.Rectangle( pixel_shader=self.palette, color_index = 9, width=320, height=240, x=0, y=0 )
+        self.group.append( gps_background )
+        gps_group = displayio.Group(scale=2, x=10, y=18)
+        gps_text = "GPS status: "
+        gps_text_area = label.Label(terminalio.FONT, text=gps_text, color=self.palette[0])
+        gps_group.append(gps_text_area)
+        self.group.append(gps_group)
+        gps_value_group = displayio.Group(scale=2, x=146, y=18)
+        gps_value_text = "no fix"
+        self.gps_value_text_area = label.Label(terminalio.FONT, text=gps_value_text, color=self.palette[0])
+        gps_value_group.append(self.gps_value_text_area)
+        self.group.append(gps_value_group)
+        # RETURN
+        select_width = 4
+        return_height = 28
+        return_select_y = 240 - 4 - 2 - return_height - select_width
+        return_select_height = return_height + 2*select_width
+        return_y = return_select_y + select_width
+        return_text_y = return_y + 12
+        return_select_width = 100
+        return_select_x = 320 - 4 - return_select_width
+        return_x = return_select_x + select_width
+        self.return_select = vectorio.Rectangle(pixel_shader=self.palette, color_index=0, width=return_select_width, height=return_select_height, x=return_select_x, y=return_select_y)
+        self.group.append( self.return_select )
+        #self.return_select.hidden = True
+        return_control_width = return_select_width - 2 * select_width
+        self.return_color = vectorio.Rectangle(pixel_shader=self.palette, color_index=19, width=return_control_width, height=return_height, x=return_x, y=return_y)
+        self.group.append( self.return_color )
+        return_text_x = return_x + 10
+        return_group = displayio.Group(scale=2, x=return_text_x, y=return_text_y)
+        return_text = "RETURN"
+        self.return_text_area = label.Label(terminalio.FONT, text=return_text, color=self.palette[0])
+        return_group.append(self.return_text_area)
+        self.group.append(return_group)
+
+        return self.group
+    def update_values( self, gps ):
+        gps.read()
+        if gps.fix():
+            self.gps_value_text_area.text = "FIX"
+        else:
+            self.gps_value_text_area.text = "no fix"
+
+def make_gps_page( main_display_group, palette):
+    page = GPS_Page(palette)
+    group = page.make_group()
+    main_display_group.append( group )
+    page.hide()
+    return page
+
+class Welcome_Page( Page ):
+    def __init__( self ):
+        super().__init__()
+    def make_group( self ):
+        self.group = displayio.Group()
+        try:
+            bitmap = displayio.OnDiskBitmap("/lib/stella_logo.bmp")
+            #print( "Bitmap image file found" )
+            # Create a TileGrid to hold the bitmap
+            tile_grid = displayio.TileGrid(bitmap, pixel_shader=bitmap.pixel_shader)
+            self.group.append(tile_grid)
+
+            version_group = displayio.Group( scale=2, x=40, y=185 )
+            text = "STELLA-1.2 ver {}".format( SOFTWARE_VERSION_NUMBER )
+            version_area = label.Label( terminalio.FONT, text=text, color=0x000000 )
+            version_group.append( version_area )
+            self.group.append( version_group )
+
+            message_group = displayio.Group( scale=2, x=4, y=220 )
+            text = ""
+            self.message_area = label.Label( terminalio.FONT, text=text, color=0x000000 )
+            message_group.append( self.message_area )
+            self.group.append( message_group )
+
+            #battery_group = displayio.Group( scale=2, x=90, y=215 )
+            #text = "battery {}%".format( battery_level )
+            #battery_area = label.Label( terminalio.FONT, text=text, color=0x000000 )
+            #battery_group.append( battery_area )
+            #welcome_group.append( battery_group )
+            #print( "showing welcome screen with logo")
+        except (MemoryError, OSError):
+            print( "bitmap image file not found or memory not available" )
+            border_color = 0xFF0022 # red
+            front_color = 0x0000FF # blue
+            if (display == False):
+                print("No display")
+                return
+            border = displayio.Palette(1)
+            border[0] = border_color
+            front = displayio.Palette(1)
+            front[0] = front_color
+            outer_rectangle = vectorio.Rectangle(pixel_shader=border, width=320, height=240, x=0, y=0)
+            self.group.append( outer_rectangle )
+            front_rectangle = vectorio.Rectangle(pixel_shader=front, width=280, height=200, x=20, y=20)
+            self.group.append( front_rectangle )
+            text_group = displayio.Group( scale=4, x=45, y=110 )
+            text = "STELLA-1.2"
+            text_area = label.Label( terminalio.FONT, text=text, color=0xFFFFFF )
+            text_group.append( text_area )
+            self.group.append( text_group )
+
+            version_group = displayio.Group( scale=2, x=27, y=200 )
+            text = "software version {}".format( SOFTWARE_VERSION_NUMBER )
+            version_area = label.Label( terminalio.FONT, text=text, color=0xFFFFFF )
+            version_group.append( version_area )
+            self.group.append( version_group )
+
+            message_group = displayio.Group( scale=2, x=4, y=220 )
+            text = "message here"
+            self.message_area = label.Label( terminalio.FONT, text=text, color=0xFFFFFF )
+            message_group.append( self.message_area )
+            self.group.append( message_group )
+
+        return self.group
+    def announce( self, text ):
+        self.message_area.text = text
+        print( text )
+    def update_values( self ):
+        pass
+
+def make_welcome_page( instrument ):
+    welcome_page = Welcome_Page()
+    group = welcome_page.make_group()
+    welcome_page.hide()
+    instrument.page_cache.place( 0, welcome_page, pinned = True )
+    return welcome_page
+
+def hide_all_pages( pages_list ):
+    for page in pages_list:
+        if page is not None:
+            page.hide()
+
+def make_palette():
+    # TBD make a color name dictionary
+    palette = displayio.Palette(40)
+    palette[0] = 0x000000 # black
+    palette[1] = 0xA0522D # brown
+    palette[2] = 0xFF0000 # red
+    palette[3] = 0xFF8C00 # orange
+    palette[4] = 0xFFFF00 # yellow
+    palette[5] = 0x00FF00 # green
+    palette[6] = 0x0000FF # blue
+    palette[7] = 0x9400D3 # violet
+    palette[8] = 0x808080 # grey
+    palette[9] = 0xFFFFFF # white
+    palette[10] = 0xFF99FF # light
+    palette[11] = 0xFF751A # heat
+    palette[12] = 0x66CCFF # light blue, air analyzer
+    palette[13] = 0x6FDC6F # plants
+    palette[14] = 0xCE954B # here
+    palette[15] = 0x8C8C8C # dark grey
+    palette[16] = 0x00998F # burst
+    palette[17] = 0x0066FF # border
+    palette[18] = 0x009900 # GPS flag
+    palette[19] = 0xCCCCCC # light grey
+    palette[20] = 0x00CC00 # remote sens green
+    palette[21] = 0x00CCBE # sensors
+    palette[22] = 0xA6A6A6 # medium grey, return
+    palette[23] = 0xFF6666 # medium red, not used yet
+    palette[24] = 0x000000 # placeholder
+    palette[25] = 0x7E00DB # blueviolet, 410nm
+    palette[26] = 0x2300FF # blue, 435nm
+    palette[27] = 0x007BFF # royalblue, 460nm
+    palette[28] = 0x00EAFF # darkturquoise,485nm
+    palette[29] = 0x00FF00 # lime, 510nm
+    palette[30] = 0x70FF00 # chartreuse, 535nm
+    palette[31] = 0xC3FF00 # greenyellow, 560nm
+    palette[32] = 0xFFEF00 # yellow, 585nm
+    palette[33] = 0xFF9B00 # orange, 610nm
+    palette[34] = 0xFE0000 # red1, 645nm
+    palette[35] = 0xDF0000 # red2, 680nm
+    palette[36] = 0xC90000 # red3, 705nm
+    palette[37] = 0xB10000 # firebrick, 730nm
+    palette[38] = 0x940000 # darkred, 760nm
+
+    return palette
@@ -0,0 +1,242 @@
+# STELLA-1.2 usb data channel: samples streamed to a computer and the SD card's files served to it, as CRC checked frames
+# on usb_cdc.data, which boot.py turns on
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella.common import *
+import usb_cdc
+
+# frame: sync 0xa5 0x5a, one byte tag, two byte sequence number, two byte payload length, payload, then the crc32 of
+# everything from the tag to the end of the payload, all little endian. The tags and payloads are the blocks of a .bin
+# data file: H the json description, S the session tag, R a sample record, U a burst statistic.
+# STELLA-1.2-host-tools/stream_receiver.py turns them back into the data file's csv rows. The file server's answers
+# are frames too, see Usb_File_Server.
+FRAME_SYNC = b"\xa5\x5a"
+
+def pack_frame( tag, sequence, payload ):
+    frame = tag + struct.pack( "<HH", sequence, len( payload )) + payload
+    return FRAME_SYNC + frame + struct.pack( "<I", binascii.crc32( frame ) & 0xffffffff )
+
+def create_usb_data_stream( instrument, vfs ):
+    usb_data_stream = Null_Usb_Data_Stream()
+    if instrument.usb_serial_out_enabled or preset_usb_file_server:
+        if usb_cdc.data is None:
+            print( "usb data channel: usb_cdc data is off, boot.py turns it on at the next reset" )
+        else:
+            usb_data_stream = Usb_Data_Stream( usb_cdc.data, instrument.usb_serial_out_enabled )
+            if preset_usb_file_server and vfs:
+                usb_data_stream.file_server = Usb_File_Server( usb_data_stream )
+    instrument.usb_data_stream = usb_data_stream
+    return usb_data_stream
+
+class Usb_Data_Stream:
+    # frames are only made while a computer has the port open. Writes never wait: what the computer has not taken yet
+    # is held, up to preset_usb_stream_buffer_bytes, and a frame that doesn't fit is dropped whole and counted
+    def __init__( self, serial, streaming ):
+        self.serial = serial
+        self.serial.write_timeout = 0
+        self.enabled = True
+        self.streaming = streaming      # samples are sent, otherwise the channel only serves files
+        self.file_server = None
+        self.connected = False
+        self.frames = []
+        self.buffered_bytes = 0
+        self.write_offset = 0       # bytes of the first frame already written
+        self.sequence = 0
+        self.description = None
+        self.session_tag = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+    def queue_frame( self, tag, payload, droppable = True ):
+        # the file server's answers are never dropped, it waits for room before reading the next chunk; neither are the
+        # header and session frames, they are sent once and the rows after them can't be read without them
+        frame = pack_frame( tag, self.sequence, payload )
+        self.sequence = ( self.sequence + 1 ) & 0xffff
+        if droppable and self.buffered_bytes + len( frame ) > preset_usb_stream_buffer_bytes:
+            self.frames_dropped += 1
+            return
+        self.frames.append( frame )
+        self.buffered_bytes += len( frame )
+    def check_header( self, instrument ):
+        # a new connection, a new sensor layout or a new session starts with the frames the rows need
+        if self.description is not instrument.binary_description:
+            self.description = instrument.binary_description
+            self.session_tag = None
+            self.queue_frame( b"H", self.description, droppable = False )
+        if self.session_tag != instrument.session_tag:
+            self.session_tag = instrument.session_tag
+            self.queue_frame( b"S", self.session_tag.encode(), droppable = False )
+    def queue_blocks( self, record ):
+        # the blocks of a packed .bin record, each as a frame; session tags are sent by check_header
+        offset = 0
+        while offset < len( record ):
+            length, = struct.unpack_from( "<H", record, offset + 1 )
+            tag = record[ offset:offset + 1 ]
+            if tag != b"S":
+                self.queue_frame( tag, record[ offset + 3:offset + 3 + length ])
+            offset += 3 + length
+    def send_sample( self, instrument, binary_record = None ):
+        # binary_record: the sample already packed for a .bin data file, otherwise its values are packed here
+        if not ( self.streaming and self.connected ):
+            return
+        self.check_header( instrument )
+        if binary_record is None:
+            self.queue_frame( b"R", instrument.pack_binary_payload() )
+        else:
+            self.queue_blocks( binary_record )
+    def send_statistics( self, instrument, binary_record ):
+        if not ( self.streaming and self.connected ):
+            return
+        self.check_header( instrument )
+        self.queue_blocks( binary_record )
+    def busy( self ):
+        return self.file_server is not None and self.file_server.transfer_file is not None
+    def update( self ):
+        # called from the usb task: notices the port opening or closing, writes what the usb buffer will take,
+        # then lets the file server answer commands and read the next chunk of a transfer
+        connected = self.serial.connected
+        if connected != self.connected:
+            self.connected = connected
+            self.frames = []
+            self.buffered_bytes = 0
+            self.write_offset = 0
+            self.description = None
+            self.session_tag = None
+            if self.file_server:
+                self.file_server.reset()
+        self.write_frames()
+        if self.connected and self.file_server:
+            self.file_server.update()
+            self.write_frames()
+    def write_frames( self ):
+        while self.frames:
+            frame = self.frames[0]
+            written = self.serial.write( memoryview( frame )[ self.write_offset: ])
+            if not written:
+                return
+            self.write_offset += written
+            if self.write_offset < len( frame ):
+                return
+            self.frames.pop( 0 )
+            self.buffered_bytes -= len( frame )
+            self.write_offset = 0
+            self.frames_sent += 1
+
+class Usb_File_Server:
+    # answers a computer's commands on the data channel, one text line each, so the card can be copied without taking it out:
+    #   list                              an F frame per file on /sd ( size, name ), then E "list <files>"
+    #   get <name> <offset>               G ( offset, size, name ), D frames ( offset, bytes ) up to the size when asked, then E "get <bytes>"
+    #   crc <name> <offset> <length>      C ( offset, length, crc32 ) of those bytes, to check a copy before adding to it
+    #   stop                              ends a transfer, E "stop"
+    # A command that fails answers E "error <message>". Sizes and offsets are four byte little endian.
+    # STELLA-1.2-host-tools/mirror_card.py fetches only the bytes added to each file since its last copy.
+    def __init__( self, usb_data_stream ):
+        self.usb_data_stream = usb_data_stream
+        self.serial = usb_data_stream.serial
+        self.command = b""
+        self.chunk = bytearray( preset_usb_file_chunk_bytes )
+        self.transfer_file = None
+        self.transfer_offset = 0
+        self.transfer_end = 0
+        self.transfer_start = 0
+    def reply( self, tag, payload ):
+        self.usb_data_stream.queue_frame( tag, payload, droppable = False )
+    def sd_path( self, name ):
+        # only the files at the top of the card
+        if "/" in name or name.startswith( "." ):
+            raise ValueError( "bad file name {}".format( name ))
+        return "/sd/" + name
+    def reset( self ):
+        self.command = b""
+        if self.transfer_file is not None:
+            self.transfer_file.close()
+            self.transfer_file = None
+    def update( self ):
+        waiting = self.serial.in_waiting
+        if waiting:
+            self.command += self.serial.read( waiting )
+            while b"\n" in self.command:
+                line, self.command = self.command.split( b"\n", 1 )
+                self.run_command( line )
+            if len( self.command ) > 256:
+                self.command = b""
+        if self.transfer_file is not None and self.usb_data_stream.buffered_bytes < len( self.chunk ):
+            self.send_chunk()
+    def run_command( self, line ):
+        try:
+            words = line.decode().split()
+            if not words:
+                return
+            if words[0] == "list":
+                self.list_files()
+            elif words[0] == "get":
+                self.start_transfer( words[1], int( words[2] ))
+            elif words[0] == "crc":
+                self.send_crc( words[1], int( words[2] ), int( words[3] ))
+            elif words[0] == "stop":
+                self.reset()
+                self.reply( b"E", b"stop" )
+            else:
+                raise ValueError( "unknown command {}".format( words[0] ))
+        except Exception as err:
+            self.reply( b"E", "error {}".format( err ).encode() )
+    def list_files( self ):
+        count = 0
+        for name in sorted( os.listdir( "/sd" )):
+            status = os.stat( "/sd/" + name )
+            if status[0] & 0x4000:
+                continue
+            self.reply( b"F", struct.pack( "<I", status[6] ) + name.encode() )
+            count += 1
+        self.reply( b"E", "list {}".format( count ).encode() )
+    def send_crc( self, name, offset, length ):
+        crc = 0
+        done = 0
+        with open( self.sd_path( name ), "rb" ) as sd_file:
+            sd_file.seek( offset )
+            view = memoryview( self.chunk )
+            while done < length:
+                count = sd_file.readinto( view[ :min( len( self.chunk ), length - done )])
+                if not count:
+                    break
+                crc = binascii.crc32( view[:count], crc )
+                done += count
+        self.reply( b"C", struct.pack( "<III", offset, done, crc & 0xffffffff ))
+    def start_transfer( self, name, offset ):
+        self.reset()
+        path = self.sd_path( name )
+        size = os.stat( path )[6]
+        if offset > size:
+            raise ValueError( "offset {} past the end of {}, {} bytes".format( offset, name, size ))
+        self.transfer_file = open( path, "rb" )
+        self.transfer_file.seek( offset )
+        self.transfer_start = offset
+        self.transfer_offset = offset
+        self.transfer_end = size
+        self.reply( b"G", struct.pack( "<II", offset, size ) + name.encode() )
+    def send_chunk( self ):
+        view = memoryview( self.chunk )[ :min( len( self.chunk ), self.transfer_end - self.transfer_offset )]
+        count = 0
+        if len( view ):
+            count = self.transfer_file.readinto( view )
+        if not count:
+            self.reply( b"E", "get {}".format( self.transfer_offset - self.transfer_start ).encode() )
+            self.reset()
+            return
+        self.reply( b"D", struct.pack( "<I", self.transfer_offset ) + view[:count] )
+        self.transfer_offset += count
+
+class Null_Usb_Data_Stream:
+    def __init__( self ):
+        self.enabled = False
+        self.connected = False
+        self.frames_sent = 0
+        self.frames_dropped = 0
+    def send_sample( self, instrument, binary_record = None ):
+        pass
+    def send_statistics( self, instrument, binary_record ):
+        pass
+    def busy( self ):
+        return False
+    def update( self ):
+        pass
@@ -0,0 +1,77 @@
+# STELLA-1.2 presets: edit these to set up the instrument, code.py and the modules in lib/stella read them at startup
+# NASA open source software license
+# Paul Mirel 2025
+
+SOFTWARE_VERSION_NUMBER = "0.6.0.1"
+DEVICE_TYPE = "STELLA-1.2"
+
+# set the data_source period = reciprocal of the data_source cadence
+#               seconds + ( minutes ) + ( hours )   + ( days )
+preset_sample_interval_s = 10.0 + ( 0 * 60 ) + ( 0 * 3600 ) + ( 0 * 3600 * 24 )
+preset_burst_count = 1
+preset_burst_statistics = True #False #    # after a burst of more than one sample, log mean, std, min, max and n rows of every value
+preset_burst_summary_only = False #True #  # log only those rows, not each sample of the burst
+usb_serial_out_enabled = False #True #   # stream each sample to a computer on the usb_cdc data channel, which boot.py turns on
+# usb data stream: frames wait in memory while the computer is slow or busy, sampling never waits for it.
+# STELLA-1.2-host-tools/stream_receiver.py reads the second serial port the instrument shows and writes the csv rows.
+preset_usb_stream_buffer_bytes = 8192   # frames held for the computer, past this new frames are dropped and counted
+preset_usb_stream_interval_s = 0.05     # how often the usb task hands frames to the usb buffer and checks for commands
+# usb file server: a computer on the data channel can list the files on /sd and copy them, resuming where a copy stopped.
+# STELLA-1.2-host-tools/mirror_card.py keeps a copy of the card up to date without taking the card out.
+preset_usb_file_server = True #False #
+preset_usb_file_chunk_bytes = 8192      # bytes read from the card and sent per frame during a copy
+record_on_startup = True #False #
+# main loop benchmark: per stage timing to serial and /sd/bench_*.csv
+benchmark_enabled = False #True #
+benchmark_report_interval_s = 60
+benchmark_ring_size = 64
+# data logger: rows are held in memory and written to the SD card in whole sectors
+preset_log_flush_bytes = 4096           # write out once this much is buffered, rounded down to whole 512 byte sectors
+preset_log_flush_interval_s = 60        # sync the card at least this often
+preset_log_low_battery_percent = 15     # below this, sync after every row
+preset_log_binary = False #True #        # packed binary records in a .bin file, expand to csv on a computer with expand_binary_log.py
+# data files: a new part is started past either limit, as well as at each new calendar day. /sd/data_index.csv lists every
+# data file with its time range and row count, so a restart or a computer finds the file it wants without reading them all.
+preset_file_max_bytes = 50000000           # 0 = no size limit
+preset_file_max_hours = 0                  # 0 = one file per calendar day
+preset_file_index_interval_s = 60          # rewrite the logged file's index record at least this often while rows are being logged
+# storage: the bytes logged per sample interval are measured and projected against the free space on the card, shown on
+# the Status page. When the hours left drop below a threshold the logger moves to a denser layout, 0 turns a step off.
+preset_storage_check_interval_s = 600      # read the card's free space this often, between reads the bytes logged are subtracted
+preset_storage_summary_only_below_h = 168  # bursts of more than one sample with statistics: log only the summary rows
+preset_storage_binary_below_h = 48         # log packed binary records, in a new .bin file
+preset_clock_resync_interval_s = 600    # read the hardware clock this often, between reads the time is counted from time.monotonic_ns()
+# pages are built when first shown and kept until one of these limits drops the least recently shown
+preset_page_cache_size = 4              # built pages kept, not counting the welcome page and the controls bar
+preset_page_cache_min_free_kB = 200     # free memory kept for sensor buffers and data rows
+# fast boot: log the first sample as soon as the clock, SD card and sensors are ready, then build the screen
+# and finish the gps setup. Skips the startup lamp and LED blinks. For field units that can brown out and reboot.
+preset_fast_boot = False #True #
+# task scheduler: the main loop runs as cooperative asyncio tasks, these set how often each one runs
+preset_input_poll_interval_s = 0.02     # collect the button, encoder and touch events captured since the last check
+preset_display_interval_s = 0.05        # redraw the active page and the controls bar
+preset_housekeeping_interval_s = 1.0    # calendar day, data file flush, benchmark report
+preset_sample_queue_length = 4          # finished samples waiting for the SD card before sampling waits
+preset_spectrum_preview_interval_s = 2.0 # not recording: how often the live spectral graph gets a spectrum of its own, 0 = never
+# inputs: keypad debounces the encoder button and rotaryio counts the encoder in the background, so collecting them reads no bus.
+# The touch screen shares the i2c bus with the sensors: with its INT line wired a countio edge counter says when it has a touch
+# to read, without it the controller is polled at the slower interval below.
+preset_touch_interrupt_pin = None #"D6" #     # board pin wired to the FocalTouch INT line, None when not wired
+preset_touch_poll_interval_s = 0.1            # INT line not wired: how often the touch controller is read
+preset_input_event_queue_length = 8           # inputs waiting for the display task, later ones are dropped
+# autoexposure: step gain and integration time so the brightest channel of each spectral sensor lands in a window of its full scale
+preset_autoexposure_on_startup = False #True #
+preset_autoexposure_window = ( 0.25, 0.80 )   # accepted fraction of full scale counts for the brightest channel
+preset_autoexposure_target = 0.50             # fraction of full scale aimed for when a step is needed
+preset_autoexposure_max_steps = 3             # extra conversions allowed per sample while converging
+preset_autoexposure_max_integration_ms = 500  # longest integration time autoexposure will choose
+# as7265x spectrometer: a one shot conversion is started before the other sensors are read and collected when it is ready
+preset_as7265x_one_shot = True #False #        # False: free running conversions, a read takes the last one finished
+preset_as7265x_poll_interval_s = 0.02          # data ready checks, once the conversion is due
+preset_as7265x_temperature_interval_s = 60     # the chip temperatures change slowly, read them this often
+# reference spectra: "set" on the remote sensing page averages spectra into a reference (white panel in view) or,
+# with the data source on "sample", a dark spectrum (optics covered). One of each is kept per sensor, gain and
+# integration time, in memory and in /sd/reference_spectra.json. s/ref is (sample - dark) / (reference - dark) per band.
+preset_reference_average_count = 5             # spectra averaged per reference or dark capture
+preset_log_reflectance = False #True #         # log the s/ref reflectance after each spectral sensor's columns in the band rows
+
@@ -0,0 +1,107 @@
+# compare STELLA-1.2 firmware builds on boot time and free heap, measured under the simulator
+# usage: python boot_report.py [--firmware DIR ...] [--scenario remote_sensing]
+# Pass --firmware more than once to compare builds, for example the single file code.py of an older revision:
+#     git worktree add /tmp/stella-old <revision>
+#     python boot_report.py --firmware ../STELLA-1.2-code-and-libraries --firmware /tmp/stella-old/STELLA-1.2/STELLA-1.2-code-and-libraries
+# A build with lib/stella modules is reported twice: compiled from source at boot, and loaded as .mpy files from build_mpy.py.
+# Boot time runs from power up to the first sample taken, heap free is read when the startup report prints after that sample.
+# The compile and .mpy load costs are estimates in stella_simulator/cost_model.py, good for ranking builds, not for the second.
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ )))
+
+from stella_simulator import Simulator, run_firmware
+from stella_simulator.scenarios import scenarios
+
+class Startup_Watch:
+    # stands in for stdout, notes the virtual time and heap when the firmware prints its startup report total
+    def __init__( self, simulator ):
+        self.simulator = simulator
+        self.boot_s = None
+        self.mem_free = None
+        self.lowest_mem_free = None
+        self.startup_lines = []
+    def write( self, text ):
+        for line in text.splitlines():
+            if line.startswith( "startup: " ):
+                self.startup_lines.append( line )
+            if line.startswith( "startup: " ) and " s in all, " in line and self.boot_s is None:
+                self.boot_s = self.simulator.clock.now()
+                self.mem_free = int( line.split( " s in all, " )[1].split( " kB" )[0] ) * 1000
+                self.lowest_mem_free = self.simulator.lowest_mem_free
+    def flush(self):
+        pass
+
+def measure_boot( firmware_directory, scenario_name, duration_s, compiled_modules ):
+    simulator = Simulator( scenarios[ scenario_name ], duration_s = duration_s, sd_directory = tempfile.mkdtemp( prefix = "stella_boot_" ),
+                           firmware_directory = firmware_directory, compiled_modules = compiled_modules )
+    watch = Startup_Watch( simulator )
+    stdout = sys.stdout
+    sys.stdout = watch
+    try:
+        run_firmware( simulator )
+    finally:
+        sys.stdout = stdout
+    compiled_sources = [ source_bytes for name, source_bytes, compiled, seconds in simulator.module_loads if not compiled ]
+    return { "source_kB": sum( compiled_sources ) / 1000, "largest_kB": max( compiled_sources, default = 0 ) / 1000,
+             "load_s": sum( seconds for name, source_bytes, compiled, seconds in simulator.module_loads ),
+             "boot_s": watch.boot_s, "mem_free_kB": None if watch.mem_free is None else watch.mem_free / 1000,
+             "lowest_kB": None if watch.lowest_mem_free is None else watch.lowest_mem_free / 1000,
+             "startup_lines": watch.startup_lines }
+
+def measure_boot_cold( firmware_directory, scenario_name, duration_s, compiled_modules ):
+    # each build boots in a fresh interpreter, so one run's leftovers don't show in the next one's heap
+    command = [ sys.executable, os.path.abspath( __file__ ), "--measure", "--firmware", firmware_directory,
+                "--scenario", scenario_name, "--duration", str( duration_s )]
+    if compiled_modules:
+        command.append( "--mpy" )
+    output = subprocess.run( command, capture_output = True, text = True, check = True ).stdout
+    return json.loads( output.splitlines()[-1] )
+
+def has_modules( firmware_directory ):
+    return os.path.isdir( os.path.join( firmware_directory, "lib", "stella" ))
+
+def format_optional( value, width, decimals ):
+    # the first sample may not come within the run
+    if value is None:
+        return "{:>{}}".format( "-", width )
+    return "{:>{}.{}f}".format( value, width, decimals )
+
+def main():
+    parser = argparse.ArgumentParser( description = "compare boot time and free heap of STELLA-1.2 firmware builds" )
+    parser.add_argument( "--firmware", action = "append", default = None, help = "directory holding code.py and lib/, repeat to compare" )
+    parser.add_argument( "--scenario", default = "remote_sensing", choices = sorted( scenarios ))
+    parser.add_argument( "--duration", type = float, default = 30.0, help = "virtual seconds to run, enough to reach the first sample" )
+    parser.add_argument( "--phases", action = "store_true", help = "also print each build's startup phases" )
+    parser.add_argument( "--measure", action = "store_true", help = argparse.SUPPRESS )
+    parser.add_argument( "--mpy", action = "store_true", help = argparse.SUPPRESS )
+    args = parser.parse_args()
+    if args.measure:
+        print( json.dumps( measure_boot( args.firmware[0], args.scenario, args.duration, args.mpy )))
+        return
+    firmware_directories = args.firmware or [ os.path.join( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ))), "STELLA-1.2-code-and-libraries" )]
+    print( "{:<40} {:>6} {:>10} {:>10} {:>9} {:>8} {:>12} {:>12}".format( "firmware", "load", "source kB", "largest kB", "load s",
+                                                                       "boot s", "free kB", "lowest kB" ))
+    for firmware_directory in firmware_directories:
+        builds = [ False, True ] if has_modules( firmware_directory ) else [ False ]
+        for compiled_modules in builds:
+            result = measure_boot_cold( firmware_directory, args.scenario, args.duration, compiled_modules )
+            print( "{:<40} {:>6} {:>10.1f} {:>10.1f} {:>9.2f} {} {} {}".format( firmware_directory[-40:], "mpy" if compiled_modules else "py",
+                                                                           result["source_kB"], result["largest_kB"], result["load_s"],
+                                                                           format_optional( result["boot_s"], 8, 2 ),
+                                                                           format_optional( result["mem_free_kB"], 12, 1 ),
+                                                                           format_optional( result["lowest_kB"], 12, 1 )))
+            if args.phases:
+                for line in result["startup_lines"]:
+                    print( "    " + line )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# build a copy of the STELLA-1.2 firmware with the lib/stella modules compiled to .mpy, ready to copy to CIRCUITPY
+# usage: python build_mpy.py --output build/CIRCUITPY [--mpy-cross PATH] [--firmware DIR]
+# mpy-cross must come from the same CircuitPython major version as the instrument (9.x), the MicroPython mpy-cross
+# on PyPI makes files CircuitPython refuses. Download it for your computer from
+#     https://adafruit-circuit-python.s3.amazonaws.com/index.html?prefix=bin/mpy-cross/
+# code.py and presets.py stay source: CircuitPython only runs code.py from source, and presets.py is meant to be edited.
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+DEFAULT_FIRMWARE_DIRECTORY = os.path.join( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ))), "STELLA-1.2-code-and-libraries" )
+MODULE_DIRECTORY = os.path.join( "lib", "stella" )
+
+def compile_module( mpy_cross, source_path, output_path ):
+    result = subprocess.run([ mpy_cross, "-o", output_path, source_path ], capture_output = True, text = True )
+    if result.returncode != 0:
+        raise RuntimeError( "mpy-cross failed on {}:\n{}".format( source_path, result.stderr ))
+
+def build( firmware_directory, output_directory, mpy_cross ):
+    # copies everything but the stella sources, then writes a .mpy for each of them
+    module_directory = os.path.join( firmware_directory, MODULE_DIRECTORY )
+    shutil.copytree( firmware_directory, output_directory,
+                     ignore = lambda directory, names: [ name for name in names
+                                                         if name == "__pycache__"
+                                                         or ( os.path.samefile( directory, module_directory ) and name.endswith( ".py" )) ])
+    built = []
+    for name in sorted( os.listdir( module_directory )):
+        if name.endswith( ".py" ):
+            output_path = os.path.join( output_directory, MODULE_DIRECTORY, name[:-3] + ".mpy" )
+            compile_module( mpy_cross, os.path.join( module_directory, name ), output_path )
+            built.append(( name, os.path.getsize( os.path.join( module_directory, name )), os.path.getsize( output_path )))
+    return built
+
+def main():
+    parser = argparse.ArgumentParser( description = "compile the STELLA-1.2 firmware modules to .mpy" )
+    parser.add_argument( "--output", required = True, help = "directory to create, laid out like the CIRCUITPY drive" )
+    parser.add_argument( "--mpy-cross", default = "mpy-cross", help = "the CircuitPython mpy-cross executable" )
+    parser.add_argument( "--firmware", default = DEFAULT_FIRMWARE_DIRECTORY, help = "directory holding code.py and lib/" )
+    args = parser.parse_args()
+    if shutil.which( args.mpy_cross ) is None:
+        print( "mpy-cross not found: {}".format( args.mpy_cross ))
+        print( "download the CircuitPython 9.x mpy-cross from https://adafruit-circuit-python.s3.amazonaws.com/index.html?prefix=bin/mpy-cross/" )
+        print( "and give its path with --mpy-cross" )
+        sys.exit( 1 )
+    if not os.path.isdir( os.path.join( args.firmware, MODULE_DIRECTORY )):
+        print( "{} has no {} to compile".format( args.firmware, MODULE_DIRECTORY ))
+        sys.exit( 1 )
+    if os.path.exists( args.output ):
+        print( "{} already exists, give a new directory".format( args.output ))
+        sys.exit( 1 )
+    built = build( args.firmware, args.output, args.mpy_cross )
+    print( "{:<20} {:>10} {:>10}".format( "module", "source kB", "mpy kB" ))
+    for name, source_bytes, mpy_bytes in built:
+        print( "{:<20} {:>10.1f} {:>10.1f}".format( name, source_bytes / 1000, mpy_bytes / 1000 ))
+    print( "copy the contents of {} to the CIRCUITPY drive, removing any lib/stella/*.py left there from a source install".format( args.output ))
+    if not os.path.isdir( os.path.join( args.output, "lib", "asyncio" )):
+        print( "{}/lib has no asyncio: copy the asyncio folder from the CircuitPython library bundle into it first".format( args.output ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# expand a STELLA-1.2 binary data file (.bin, written with preset_log_binary = True) into the csv layout
+# the instrument writes when logging text
+# usage: python expand_binary_log.py STELLA-1.2_data_20250621-0.bin [more.bin ...] [--output-dir DIR]
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import json
+import os
+import struct
+
+MAGIC = b"STELLA1B"
+RECORD_PREFIX = struct.Struct( "<IHHHBBBBBH" )
+# a U block holds one burst statistic, its number is in the burst counter field
+STATISTIC_NAMES = ( "mean", "std", "min", "max", "n" )
+
+def format_float( value ):
+    # CircuitPython prints single precision floats with up to 7 significant digits and keeps a trailing .0
+    text = "{:.7g}".format( value )
+    if "." not in text and "e" not in text and "n" not in text:
+        text += ".0"
+    return text
+
+def format_value( value, layout_code ):
+    if layout_code == "r":
+        if value == int( value ):
+            return "{}".format( int( value ))
+        return format_float( value )
+    if layout_code in "fd":
+        return format_float( value )
+    return "{}".format( value )
+
+def read_blocks( data ):
+    if not data.startswith( MAGIC ):
+        raise ValueError( "not a STELLA binary data file" )
+    offset = len( MAGIC )
+    while offset + 3 <= len( data ):
+        tag = data[offset:offset + 1]
+        length, = struct.unpack_from( "<H", data, offset + 1 )
+        payload = data[offset + 3:offset + 3 + length]
+        if len( payload ) < length:
+            # the instrument lost power part way through a block
+            break
+        yield tag, payload
+        offset += 3 + length
+
+class Expander:
+    def __init__( self, description ):
+        self.description = description
+        self.bands = description["bands"]
+        self.values_format = "<" + "".join( row["layout"].replace( "r", "f" ) for band in self.bands for row in band )
+        self.layout_codes = "".join( row["layout"] for band in self.bands for row in band )
+        self.session_tag = ""
+    def system_log( self, counter, batch_number, burst_counter, year, month, day, hour, minute, second ):
+        iso_time = "{:04}{:02}{:02}T{:02}{:02}{:02}Z".format( year, month, day, hour, minute, second )
+        decimal_time = hour + minute / 60.0 + second / 3600.0
+        return "{}, {}{}, {}, {}, {}, {}".format( self.description["uid"], self.session_tag, counter, iso_time,
+                                                  batch_number, burst_counter, decimal_time )
+    def expand_record( self, payload ):
+        prefix = RECORD_PREFIX.unpack_from( payload, 0 )
+        sensor_text_length = prefix[-1]
+        offset = RECORD_PREFIX.size
+        sensor_text = payload[offset:offset + sensor_text_length].decode()
+        offset += sensor_text_length
+        values = struct.unpack_from( self.values_format, payload, offset )
+        system_log = self.system_log( *prefix[:-1] )
+        lines = []
+        line = system_log
+        if self.description["spectrometry"]:
+            line += ", - " * self.description["spectral_placeholder_count"]
+        lines.append( line + sensor_text )
+        index = 0
+        for band in self.bands:
+            line = system_log
+            for row in band:
+                count = len( row["layout"] )
+                formatted = [ format_value( value, code ) for value, code in zip( values[index:index + count], row["layout"] ) ]
+                line += ", " + row["template"].format( *formatted )
+                index += count
+            lines.append( line )
+        return lines
+    def expand_statistic( self, payload ):
+        # the same rows as a record, every band value stored as a float
+        prefix = list( RECORD_PREFIX.unpack_from( payload, 0 ))
+        sensor_text_length = prefix[-1]
+        statistic = STATISTIC_NAMES[ prefix[2] ]
+        prefix[2] = statistic
+        offset = RECORD_PREFIX.size
+        sensor_text = payload[offset:offset + sensor_text_length].decode()
+        offset += sensor_text_length
+        values = struct.unpack_from( "<{}f".format( len( self.layout_codes )), payload, offset )
+        system_log = self.system_log( *prefix[:-1] )
+        line = system_log
+        if self.description["spectrometry"]:
+            line += ", - " * self.description["spectral_placeholder_count"]
+        lines = [ line + sensor_text ]
+        index = 0
+        for band in self.bands:
+            line = system_log
+            for row in band:
+                count = len( row["layout"] )
+                formatted = []
+                for value, code in zip( values[index:index + count], row["layout"] ):
+                    if statistic == "n":
+                        formatted.append( "{}".format( int( value )))
+                    elif statistic in ( "min", "max" ):
+                        formatted.append( format_value( int( value ) if code in "HBI" and value == value else value, code ))
+                    else:
+                        formatted.append( format_float( value ))
+                line += ", " + row["template"].format( *formatted )
+                index += count
+            lines.append( line )
+        return lines
+
+def expand_file( path, output_path ):
+    with open( path, "rb" ) as binary_file:
+        data = binary_file.read()
+    expander = None
+    records = 0
+    with open( output_path, "w", newline = "" ) as csv_file:
+        for tag, payload in read_blocks( data ):
+            if tag == b"H":
+                expander = Expander( json.loads( payload.decode() ))
+                csv_file.write( expander.description["csv_header"] )
+            elif tag == b"S":
+                expander.session_tag = payload.decode()
+            elif tag == b"R":
+                for line in expander.expand_record( payload ):
+                    csv_file.write( line )
+                    csv_file.write( "\n" )
+                records += 1
+            elif tag == b"U":
+                for line in expander.expand_statistic( payload ):
+                    csv_file.write( line )
+                    csv_file.write( "\n" )
+    return records
+
+def main():
+    parser = argparse.ArgumentParser( description = "expand STELLA-1.2 binary data files into csv" )
+    parser.add_argument( "files", nargs = "+" )
+    parser.add_argument( "--output-dir", default = None, help = "write the csv files here instead of next to the .bin files" )
+    args = parser.parse_args()
+    if args.output_dir:
+        os.makedirs( args.output_dir, exist_ok = True )
+    for path in args.files:
+        output_path = os.path.splitext( path )[0] + ".csv"
+        if args.output_dir:
+            output_path = os.path.join( args.output_dir, os.path.basename( output_path ))
+        records = expand_file( path, output_path )
+        print( "{}: {} records -> {}".format( path, records, output_path ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# list the data files on a STELLA-1.2 SD card that hold rows in a time range, from the card's data_index.csv
+# usage: python find_data_files.py /Volumes/STELLA [--from 20250621T160000Z] [--to 20250622T000000Z]
+# Finished files are in data_index.csv, the file being logged in data_index_current.csv. The instrument rewrites that
+# record every preset_file_index_interval_s, so its end time and row count can be that far behind after a power loss.
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import os
+
+INDEX_FILENAME = "data_index.csv"
+CURRENT_FILENAME = "data_index_current.csv"
+
+def read_index( card_directory ):
+    entries = []
+    for filename in ( INDEX_FILENAME, CURRENT_FILENAME ):
+        path = os.path.join( card_directory, filename )
+        if not os.path.isfile( path ):
+            continue
+        with open( path, "r" ) as index_file:
+            for line in index_file:
+                fields = line.strip().split( ", " )
+                if len( fields ) == 6 and fields[3].isdigit():
+                    entries.append({ "filename": fields[0], "first": fields[1], "last": fields[2],
+                                     "rows": int( fields[3] ), "bytes": int( fields[4] ), "header_hash": fields[5] })
+    return entries
+
+def overlaps( entry, start, end ):
+    # iso8601 basic format timestamps sort as text, a file with no rows yet has "-" for both
+    if entry["first"] == "-":
+        return False
+    if start and entry["last"] < start:
+        return False
+    if end and entry["first"] > end:
+        return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser( description = "find STELLA-1.2 data files by time range" )
+    parser.add_argument( "card", help = "directory holding the card's files" )
+    parser.add_argument( "--from", dest = "start", default = None, help = "iso8601 utc, e.g. 20250621T160000Z" )
+    parser.add_argument( "--to", dest = "end", default = None, help = "iso8601 utc, e.g. 20250622T000000Z" )
+    args = parser.parse_args()
+    print( "{:<40} {:>16} {:>16} {:>8} {:>10}  {}".format( "filename", "first", "last", "rows", "bytes", "header" ))
+    for entry in read_index( args.card ):
+        if overlaps( entry, args.start, args.end ):
+            print( "{:<40} {:>16} {:>16} {:>8} {:>10}  {}".format( entry["filename"], entry["first"], entry["last"],
+                                                                  entry["rows"], entry["bytes"], entry["header_hash"] ))
+
+if __name__ == "__main__":
+    main()
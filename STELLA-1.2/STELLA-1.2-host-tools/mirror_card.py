@@ -0,0 +1,186 @@
+# copy the files on a STELLA-1.2 SD card to a computer over the usb data channel, without taking the card out
+# usage: python mirror_card.py --port /dev/ttyACM1 --output ~/stella_card
+#        python mirror_card.py --simulate remote_sensing --after 120 --output /tmp/stella_card   # against the simulator
+# Each run fetches only what was added to a file since the last copy: the last bytes of the local copy are checked
+# against the card by crc first, a copy that doesn't match or is longer than the card's file is fetched again from the start.
+# A copy cut short by a disconnect is kept and continued from its end the next time.
+# The instrument serves files with preset_usb_file_server = True in presets.py and the data channel that boot.py turns on.
+# Reading a port needs pyserial: pip install pyserial
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import ast
+import binascii
+import io
+import os
+import struct
+import sys
+import threading
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ )))
+
+from stream_receiver import Frame_Reader, open_port
+
+CHECK_BYTES = 4096      # bytes at the end of a local copy checked against the card before adding to it
+FILE_SERVER_TAGS = ( b"F", b"G", b"D", b"C", b"E" )
+
+class Card_Client:
+    # sends the file server's commands and waits for its answers; sample frames, if the instrument is also streaming, are skipped
+    def __init__( self, port, timeout_s = 10.0 ):
+        self.port = port
+        self.timeout_s = timeout_s
+        self.reader = Frame_Reader()
+        self.pending = []
+    def command( self, text ):
+        self.port.write(( text + "\n" ).encode() )
+    def next_frame(self):
+        deadline_s = time.monotonic() + self.timeout_s
+        while not self.pending:
+            if time.monotonic() > deadline_s:
+                raise TimeoutError( "no answer from the instrument in {} s".format( self.timeout_s ))
+            data = self.port.read( max( 1, self.port.in_waiting ))
+            self.pending = [ frame for frame in self.reader.feed( data ) if frame[0] in FILE_SERVER_TAGS ]
+        return self.pending.pop( 0 )
+    def expect( self, tag ):
+        frame_tag, payload = self.next_frame()
+        if frame_tag == b"E" and payload.startswith( b"error" ):
+            raise IOError( payload.decode() )
+        if frame_tag != tag:
+            raise IOError( "expected a {} frame, got {} {}".format( tag.decode(), frame_tag.decode(), payload[:40] ))
+        return payload
+    def list_files(self):
+        # [( name, size )] of the files at the top of the card
+        self.command( "list" )
+        files = []
+        while True:
+            tag, payload = self.next_frame()
+            if tag == b"E":
+                if payload.startswith( b"error" ):
+                    raise IOError( payload.decode() )
+                return files
+            if tag == b"F":
+                size, = struct.unpack_from( "<I", payload )
+                files.append(( payload[4:].decode(), size ))
+    def crc( self, name, offset, length ):
+        self.command( "crc {} {} {}".format( name, offset, length ))
+        offset, length, crc = struct.unpack( "<III", self.expect( b"C" ))
+        return length, crc
+    def get( self, name, offset, local_file ):
+        # writes the card's bytes from offset on into local_file at the same offsets, returns the bytes fetched and
+        # the file's size when the transfer started, the instrument may have added to it since the list
+        self.command( "get {} {}".format( name, offset ))
+        start, size = struct.unpack_from( "<II", self.expect( b"G" ))
+        expected = start
+        while True:
+            tag, payload = self.next_frame()
+            if tag == b"E":
+                if payload.startswith( b"error" ):
+                    raise IOError( payload.decode() )
+                return expected - start, size
+            if tag != b"D":
+                raise IOError( "expected a D frame, got {}".format( tag.decode() ))
+            chunk_offset, = struct.unpack_from( "<I", payload )
+            if chunk_offset != expected:
+                raise IOError( "{}: chunk at {}, expected {}".format( name, chunk_offset, expected ))
+            local_file.seek( chunk_offset )
+            local_file.write( payload[4:] )
+            expected += len( payload ) - 4
+
+def resume_offset( client, name, size, local_path ):
+    # where to continue a local copy from, 0 when it has to be fetched again
+    if not os.path.isfile( local_path ):
+        return 0
+    local_size = os.path.getsize( local_path )
+    if local_size > size or local_size == 0:
+        return 0
+    check = min( local_size, CHECK_BYTES )
+    with io.open( local_path, "rb" ) as local_file:
+        local_file.seek( local_size - check )
+        tail = local_file.read( check )
+    length, crc = client.crc( name, local_size - check, check )
+    if length != check or crc != binascii.crc32( tail ):
+        return 0
+    return local_size
+
+def mirror( client, output_directory, report = sys.stdout ):
+    # io.open: the simulator stands in for the builtin open while it runs
+    os.makedirs( output_directory, exist_ok = True )
+    start_s = time.monotonic()
+    fetched = 0
+    files = client.list_files()
+    for name, size in files:
+        local_path = os.path.join( output_directory, name )
+        offset = resume_offset( client, name, size, local_path )
+        if offset == size:
+            print( "{:<40} {:>10} bytes, up to date".format( name, size ), file = report )
+            continue
+        with io.open( local_path, "r+b" if offset else "wb" ) as local_file:
+            count, size = client.get( name, offset, local_file )
+            local_file.truncate( offset + count )
+        fetched += count
+        print( "{:<40} {:>10} bytes, fetched {} from {}".format( name, size, count, offset ), file = report )
+        report.flush()
+    elapsed_s = max( time.monotonic() - start_s, 0.001 )
+    print( "{} files, {} bytes fetched in {:.1f} s, {:.1f} kB/s".format( len( files ), fetched, elapsed_s, fetched / elapsed_s / 1000 ), file = report )
+    return fetched
+
+def simulate( args ):
+    # the firmware runs in this thread on virtual time, the mirror in another against a Simulated_Port
+    from stella_simulator import Simulator, Simulated_Port, run_firmware
+    from stella_simulator.scenarios import scenarios
+    presets = { "preset_usb_file_server": True }
+    for preset in args.preset:
+        name, value = preset.split( "=", 1 )
+        presets[ name.strip() ] = ast.literal_eval( value.strip() )
+    simulator = Simulator( scenarios[ args.simulate ], duration_s = args.duration, sd_directory = args.sd_dir, presets = presets )
+    report = sys.stdout
+    result = {}
+    def run_mirror():
+        try:
+            while simulator.clock.now() < args.after:
+                time.sleep( 0.01 )
+            port = Simulated_Port( simulator.usb_host )
+            result["fetched"] = mirror( Card_Client( port ), args.output, report )
+            port.close()
+        except Exception as err:
+            result["error"] = err
+        finally:
+            # the firmware stops at its next clock reading
+            simulator.clock.end_s = simulator.clock.now()
+    mirror_thread = threading.Thread( target = run_mirror, daemon = True )
+    sys.stdout = open( os.devnull, "w" )
+    try:
+        mirror_thread.start()
+        run_firmware( simulator )
+    finally:
+        sys.stdout.close()
+        sys.stdout = report
+    mirror_thread.join( 10 )
+    if "error" in result:
+        print( "mirror failed: {}".format( result["error"] ))
+        sys.exit( 1 )
+
+def main():
+    parser = argparse.ArgumentParser( description = "copy a STELLA-1.2 SD card over the usb data channel" )
+    source = parser.add_mutually_exclusive_group( required = True )
+    source.add_argument( "--port", help = "the instrument's data serial port" )
+    source.add_argument( "--simulate", metavar = "SCENARIO", help = "mirror the card of the simulated instrument running this scenario" )
+    parser.add_argument( "--output", required = True, help = "directory that keeps the copy" )
+    parser.add_argument( "--after", type = float, default = 0.0, help = "simulated: virtual seconds the instrument logs before the mirror starts" )
+    parser.add_argument( "--duration", type = float, default = 3600.0, help = "simulated: longest virtual run" )
+    parser.add_argument( "--sd-dir", default = None, help = "simulated: host directory that stands in for the SD card" )
+    parser.add_argument( "--preset", action = "append", default = [], metavar = "NAME=VALUE", help = "simulated: override a preset" )
+    args = parser.parse_args()
+    if args.simulate:
+        simulate( args )
+        return
+    port = open_port( args.port )
+    try:
+        mirror( Card_Client( port ), args.output )
+    finally:
+        port.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# profile the text formatting of one data file sample (system row plus one row per band) under the simulator
+# usage: python profile_log_rows.py [--firmware DIR ...] [--samples 200]
+# Pass --firmware more than once to compare builds, for example an older revision checked out with
+#     git worktree add /tmp/stella-old <revision>
+#     python profile_log_rows.py --firmware STELLA-1.2/STELLA-1.2-code-and-libraries --firmware /tmp/stella-old/STELLA-1.2/STELLA-1.2-code-and-libraries
+# Reports host time per sample and the number of objects the formatting creates per sample. Every string, tuple,
+# list or bytes object created is a separate heap allocation on CircuitPython, so the object count is the number
+# to drive down; host time only ranks the alternatives.
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import dis
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ )))
+
+from stella_simulator import Simulator, load_firmware
+from stella_simulator.scenarios import scenarios
+
+SENSOR_INITIALIZERS = [ "initialize_as7265x_spectrometer", "initialize_as7331_spectrometer", "initialize_as7341_spectrometer",
+                        "initialize_hdc3022_air_sensor", "initialize_mlx90614_surface_thermometer",
+                        "initialize_battery_monitor", "initialize_gps" ]
+
+# opcodes that leave a new object on the stack when they run on strings, tuples and lists
+CREATING_OPCODES = { dis.opmap[name] for name in ( "BINARY_OP", "BUILD_TUPLE", "BUILD_LIST", "BUILD_MAP", "BUILD_STRING",
+                                                    "FORMAT_VALUE", "LIST_EXTEND", "CALL_FUNCTION_EX", "BINARY_SUBSCR" ) if name in dis.opmap }
+CREATING_C_CALLS = { "format", "encode", "join", "split", "replace", "strip", "rstrip", "extend", "append" }
+
+class Collecting_Sink:
+    # stands in for the data logger, keeps the bytes so the output can be checked
+    def __init__( self ):
+        self.chunks = []
+    def write( self, text ):
+        self.chunks.append( text )
+    def write_bytes( self, data ):
+        self.chunks.append( data )
+
+def legacy_sample_rows( instrument, sink, system_log ):
+    # the main loop's row writing before the row templates existed
+    sink.write( system_log )
+    if instrument.spectrometry:
+        for index in range( 0, instrument.spectral_header_count ):
+            sink.write( ", - " )
+    for sensor in instrument.sensors_present:
+        sink.write( ", " )
+        sink.write( sensor.log() )
+    sink.write( "\n" )
+    for band in instrument.wavelength_bands_list_sorted:
+        sink.write( system_log )
+        for spectral_sensor in instrument.spectral_sensors_present:
+            logline = spectral_sensor.log( band )
+            if logline is not None:
+                sink.write( ", " )
+                sink.write( spectral_sensor.log( band ))
+        sink.write( "\n" )
+
+def build_instrument( namespace ):
+    board = sys.modules["board"]
+    spi_bus = board.SPI()
+    vfs = namespace["initialize_sd_card"]( spi_bus, board.A5 )
+    i2c_bus = namespace["initialize_i2c_bus"]()
+    uart_bus = namespace["initialize_uart"]( board.TX, board.RX )
+    if "initialize_sensors" in namespace:
+        # builds with the sensor registry scan the bus in main
+        i2c_addresses = namespace["scan_i2c_bus"]( i2c_bus )
+        buzzer = namespace["initialize_qwiic_buzzer"]( i2c_bus, i2c_addresses )
+    else:
+        buzzer = namespace["initialize_qwiic_buzzer"]( i2c_bus )
+    instrument = namespace["create_instrument"]( i2c_bus, spi_bus, uart_bus, namespace["get_uid"](), buzzer )
+    if "initialize_sensors" in namespace:
+        namespace["initialize_sensors"]( instrument, i2c_addresses )
+    if "create_data_file_manager" in namespace:
+        namespace["create_data_file_manager"]( instrument, vfs )
+    for initializer in SENSOR_INITIALIZERS:
+        if initializer in namespace:
+            namespace[initializer]( instrument )
+    instrument.make_band_list()
+    instrument.make_header()
+    instrument.burst_counter = 0
+    for sensor in instrument.sensors_present + instrument.spectral_sensors_present:
+        sensor.read()
+    for spectral_sensor in instrument.spectral_sensors_present:
+        spectral_sensor.check_gain_ratio()
+    # the clock read is i2c traffic, not formatting: read it once and hold it
+    instrument.update_time()
+    instrument.update_time = lambda: None
+    return instrument
+
+def format_sample( instrument, sink ):
+    system_log = instrument.get_system_log()
+    if hasattr( instrument, "format_sample_rows" ):
+        for row in instrument.format_sample_rows( system_log ):
+            sink.write( row )
+    elif hasattr( instrument, "write_sample_rows" ):
+        instrument.write_sample_rows( sink, system_log )
+    else:
+        legacy_sample_rows( instrument, sink, system_log )
+
+def is_firmware_file( filename, firmware_path ):
+    # code.py, or one of the stella modules in its lib/ directory
+    stella_directory = os.path.join( os.path.dirname( firmware_path ), "lib", "stella" ) + os.sep
+    return filename == firmware_path or filename.startswith( stella_directory )
+
+def count_created_objects( function, firmware_path ):
+    counts = { "opcodes": 0, "c_calls": 0 }
+    def trace( frame, event, argument ):
+        if not is_firmware_file( frame.f_code.co_filename, firmware_path ):
+            return None
+        frame.f_trace_opcodes = True
+        if event == "opcode" and frame.f_code.co_code[ frame.f_lasti ] in CREATING_OPCODES:
+            counts["opcodes"] += 1
+        return trace
+    def profile( frame, event, argument ):
+        if event == "c_call" and is_firmware_file( frame.f_code.co_filename, firmware_path ) and getattr( argument, "__name__", "" ) in CREATING_C_CALLS:
+            counts["c_calls"] += 1
+    sys.settrace( trace )
+    sys.setprofile( profile )
+    try:
+        function()
+    finally:
+        sys.settrace( None )
+        sys.setprofile( None )
+    return counts["opcodes"] + counts["c_calls"]
+
+def profile_firmware( firmware_directory, scenario_name, samples ):
+    simulator = Simulator( scenarios[ scenario_name ], duration_s = None, sd_directory = tempfile.mkdtemp( prefix = "stella_profile_" ),
+                           firmware_directory = firmware_directory )
+    stdout = sys.stdout
+    with simulator:
+        sys.stdout = open( os.devnull, "w" )
+        try:
+            namespace = load_firmware( simulator )
+            instrument = build_instrument( namespace )
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        firmware_path = namespace["__file__"]
+        sink = Collecting_Sink()
+        format_sample( instrument, sink )
+        sample_bytes = sum( len( chunk ) for chunk in sink.chunks )
+        rows = 1 + len( instrument.wavelength_bands_list_sorted )
+        objects = count_created_objects( lambda: format_sample( instrument, Collecting_Sink() ), firmware_path )
+        durations = []
+        for index in range( 0, samples ):
+            sink = Collecting_Sink()
+            start = time.perf_counter()
+            format_sample( instrument, sink )
+            durations.append( time.perf_counter() - start )
+    return { "rows": rows, "bytes": sample_bytes, "objects": objects, "writes": len( sink.chunks ),
+             "median_us": statistics.median( durations ) * 1e6, "p95_us": sorted( durations )[ int( 0.95 * len( durations )) ] * 1e6 }
+
+def main():
+    parser = argparse.ArgumentParser( description = "profile data row formatting for one or more firmware builds" )
+    parser.add_argument( "--firmware", action = "append", default = None, help = "directory holding code.py and lib/, repeat to compare" )
+    parser.add_argument( "--scenario", default = "remote_sensing", choices = sorted( scenarios ))
+    parser.add_argument( "--samples", type = int, default = 200 )
+    args = parser.parse_args()
+    firmware_directories = args.firmware or [ None ]
+    print( "{:<48} {:>5} {:>7} {:>8} {:>7} {:>11} {:>9}".format( "firmware", "rows", "bytes", "objects", "writes", "median us", "p95 us" ))
+    for firmware_directory in firmware_directories:
+        result = profile_firmware( firmware_directory, args.scenario, args.samples )
+        name = firmware_directory or "(this tree)"
+        print( "{:<48} {:>5} {:>7} {:>8} {:>7} {:>11.1f} {:>9.1f}".format( name[-48:], result["rows"], result["bytes"], result["objects"],
+                                                                          result["writes"], result["median_us"], result["p95_us"] ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# run the STELLA-1.2 firmware on the host against virtual devices and report where the time went
+# usage: python simulate.py --scenario remote_sensing --duration 120
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import ast
+import os
+import sys
+
+sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ )))
+
+from stella_simulator import Simulator, run_firmware
+from stella_simulator.scenarios import scenarios
+
+def main():
+    parser = argparse.ArgumentParser( description = "run STELLA-1.2 code.py under a simulated instrument" )
+    parser.add_argument( "--scenario", default = "remote_sensing", choices = sorted( scenarios ))
+    parser.add_argument( "--duration", type = float, default = 60.0, help = "virtual seconds to run" )
+    parser.add_argument( "--sd-dir", default = None, help = "host directory that stands in for the SD card" )
+    parser.add_argument( "--cpu-scale", type = float, default = 0.0, help = "also charge host CPU time multiplied by this factor" )
+    parser.add_argument( "--firmware", default = None, help = "directory holding code.py and lib/" )
+    parser.add_argument( "--seed", type = int, default = 1 )
+    parser.add_argument( "--quiet", action = "store_true", help = "suppress the firmware's own printing" )
+    parser.add_argument( "--preset", action = "append", default = [], metavar = "NAME=VALUE",
+                         help = "override a module level preset in presets.py or code.py, e.g. --preset benchmark_enabled=True" )
+    parser.add_argument( "--usb-capture", default = None, metavar = "FILE",
+                         help = "save the bytes the virtual computer read from the usb data channel, for stream_receiver.py --file" )
+    parser.add_argument( "--mpy", action = "store_true", help = "charge loading the lib/stella modules as .mpy files instead of compiling them" )
+    args = parser.parse_args()
+
+    presets = {}
+    for preset in args.preset:
+        name, value = preset.split( "=", 1 )
+        presets[ name.strip() ] = ast.literal_eval( value.strip() )
+
+    simulator = Simulator( scenarios[ args.scenario ], duration_s = args.duration, sd_directory = args.sd_dir,
+                           cpu_scale = args.cpu_scale, firmware_directory = args.firmware, seed = args.seed, presets = presets,
+                           compiled_modules = args.mpy )
+    stdout = sys.stdout
+    if args.quiet:
+        sys.stdout = open( os.devnull, "w" )
+    try:
+        run_firmware( simulator )
+    finally:
+        if args.quiet:
+            sys.stdout.close()
+            sys.stdout = stdout
+    if args.usb_capture:
+        with open( args.usb_capture, "wb" ) as capture_file:
+            capture_file.write( simulator.usb_host.received )
+    print( "" )
+    print( "scenario {}".format( args.scenario ))
+    simulator.report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# STELLA-1.2 host-side simulator
+# runs the instrument firmware under CPython with stand-in CircuitPython modules and scripted virtual devices
+# NASA open source software license
+# Paul Mirel 2025
+
+from stella_simulator.virtual_clock import Virtual_Clock, Simulation_Complete
+from stella_simulator.environment import Simulator, run_firmware, load_firmware
+from stella_simulator.simulated_port import Simulated_Port
+
+# the one simulator active in this process, the stand-in modules in fakes/ reach it through here
+active = None
+
+def get_active():
+    if active is None:
+        raise RuntimeError( "no simulator is active, start one with stella_simulator.Simulator" )
+    return active
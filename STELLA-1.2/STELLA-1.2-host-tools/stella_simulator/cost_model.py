@@ -0,0 +1,60 @@
+# virtual time charged for each kind of hardware operation, in seconds
+# These are estimates from datasheets and bench observations of a STELLA-1.2 on the default 100 kHz I2C bus.
+# They are meant to rank where the time goes, not to predict a field unit to the millisecond.
+
+# i2c bus at 100 kHz
+I2C_BYTE_S = 0.00009
+I2C_TRANSACTION_S = 0.00025
+
+# sd card on sdcardio through the FAT filesystem
+SD_OPEN_S = 0.006               # directory search and file object setup
+SD_WRITE_CALL_S = 0.00008       # copy into the filesystem's sector cache
+SD_SECTOR_WRITE_S = 0.0012      # each full 512 byte sector pushed to the card
+SD_SYNC_S = 0.011               # flush partial sector, update FAT and directory entry (close, flush, os.sync)
+SD_READ_SECTOR_S = 0.0009
+SD_SECTOR_BYTES = 512
+
+# display, redraw of changed regions by displayio
+DISPLAY_SHAPE_CHANGE_S = 0.00004
+DISPLAY_PIXEL_S = 0.00000005
+DISPLAY_LABEL_TEXT_S = 0.0018
+
+# as7265x: the virtual register protocol polls status before and after every byte
+AS7265X_VIRTUAL_REGISTER_S = 0.0035
+AS7265X_CONVERSION_CYCLES = 2   # 6 channel mode needs two integration periods per conversion
+
+# as7331
+AS7331_READ_S = 0.0012
+
+# as7341: all_channels switches the SMUX and integrates twice
+AS7341_READOUT_S = 0.004
+
+# other sensors, per property read
+HDC302X_READ_S = 0.0125         # trigger on demand conversion
+MLX90614_READ_S = 0.0011
+MAX17048_READ_S = 0.0006
+PCF8523_READ_S = 0.0011
+FOCALTOUCH_TOUCHED_S = 0.0006
+FOCALTOUCH_TOUCHES_S = 0.0028
+BUZZER_COMMAND_S = 0.0006
+
+# gps on the uart at 9600 baud
+GPS_UPDATE_S = 0.0045
+GPS_BYTE_S = 0.00104
+
+# usb_cdc data channel, copying into the TinyUSB transmit buffer; the computer empties it at its own pace
+USB_WRITE_CALL_S = 0.00003
+USB_BYTE_S = 0.0000002
+USB_WAIT_S = 0.001              # a blocking write waiting for room in the transmit buffer
+
+# gpio and analog
+ANALOG_READ_S = 0.00002
+DIGITAL_READ_S = 0.000005
+NEOPIXEL_WRITE_S = 0.00005
+
+# loading firmware modules at boot, per byte of .py source
+# CircuitPython compiles a .py file into bytecode in RAM, holding the module's parse tree while it does.
+# A .mpy file is already bytecode: it is read from flash and linked, with no parse tree.
+SOURCE_COMPILE_S_PER_BYTE = 0.000015
+SOURCE_COMPILE_HEAP_PER_BYTE = 0.6    # parse tree held during the compile, freed after
+MPY_LOAD_S_PER_BYTE = 0.000002
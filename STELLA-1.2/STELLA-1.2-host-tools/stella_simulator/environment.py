@@ -0,0 +1,482 @@
+# simulator environment: installs the stand-in modules, the virtual clock and the sandboxed SD card,
+# then runs the firmware's code.py under CPython.
+# NASA open source software license
+# Paul Mirel 2025
+
+import ast
+import builtins
+import calendar
+import importlib.util
+import gc as host_gc
+import os as host_os
+import random
+import sys
+import time as host_time
+import tracemalloc
+import types
+
+import stella_simulator
+from stella_simulator import cost_model
+from stella_simulator.virtual_clock import Virtual_Clock, Simulation_Complete
+from stella_simulator.virtual_devices import Virtual_Light_Field, Virtual_USB_Host, virtual_device_classes
+
+HOST_TOOLS_DIRECTORY = host_os.path.dirname( host_os.path.dirname( host_os.path.abspath( __file__ )))
+FAKES_DIRECTORY = host_os.path.join( host_os.path.dirname( host_os.path.abspath( __file__ )), "fakes" )
+FAKE_MODULES = { host_os.path.splitext( name )[0] for name in host_os.listdir( FAKES_DIRECTORY ) if not name.startswith( "_" )}
+DEFAULT_FIRMWARE_DIRECTORY = host_os.path.join( host_os.path.dirname( HOST_TOOLS_DIRECTORY ), "STELLA-1.2-code-and-libraries" )
+
+# the Feather ESP32-S3 4MB flash / 2MB PSRAM heap as CircuitPython reports it at boot
+DEFAULT_HEAP_BYTES = 2000000
+# CPython objects are roughly twice the size of the same MicroPython objects
+DEFAULT_HEAP_SCALE = 0.5
+
+class Input_Script:
+    # scripted user inputs: touches on the screen, encoder button presses, encoder turns
+    # each event is a dict with "at_s" and one of "touch": (x, y), "press": pin name, "turn": steps
+    # touch and press events last "hold_s" seconds, 0.25 s by default
+    def __init__( self, events ):
+        self.events = sorted( events, key = lambda event: event["at_s"] )
+    def active( self, kind, time_s ):
+        for event in self.events:
+            if kind in event and event["at_s"] <= time_s < event["at_s"] + event.get( "hold_s", 0.25 ):
+                return event
+        return None
+    def touch_at( self, time_s ):
+        event = self.active( "touch", time_s )
+        if event is None:
+            return None
+        return event["touch"]
+    def pin_value( self, pin_name, time_s, pull ):
+        # buttons pull up and short to ground when pressed
+        for event in self.events:
+            if event.get( "press" ) == pin_name and event["at_s"] <= time_s < event["at_s"] + event.get( "hold_s", 0.25 ):
+                return False
+        return True
+    def pin_transitions( self, pin_name, after_s, until_s ):
+        # ( time_s, pressed ) for each edge of a button pin in ( after_s, until_s ], in time order
+        transitions = []
+        for event in self.events:
+            if event.get( "press" ) == pin_name:
+                for edge_s, pressed in (( event["at_s"], True ), ( event["at_s"] + event.get( "hold_s", 0.25 ), False )):
+                    if after_s < edge_s <= until_s:
+                        transitions.append(( edge_s, pressed ))
+        transitions.sort( key = lambda transition: transition[0] )
+        return transitions
+    def touch_reports( self, time_s, report_interval_s ):
+        # touch controller reports so far: one when a touch starts, then one per report interval while it is held
+        reports = 0
+        for event in self.events:
+            if "touch" in event and event["at_s"] <= time_s:
+                held_s = min( time_s, event["at_s"] + event.get( "hold_s", 0.25 )) - event["at_s"]
+                reports += 1 + int( held_s / report_interval_s )
+        return reports
+    def encoder_position( self, time_s ):
+        position = 0
+        for event in self.events:
+            if "turn" in event and event["at_s"] <= time_s:
+                position += event["turn"]
+        return position
+
+class Simulated_SD_File:
+    # wraps a host file in the sandbox and charges the virtual clock the way sdcardio and FAT would
+    def __init__( self, simulator, host_file, writing ):
+        self.simulator = simulator
+        self.host_file = host_file
+        self.writing = writing
+        self.unsynced_bytes = 0
+        self.sector_fill = 0
+        self.closed = False
+        simulator.charge_sd( cost_model.SD_OPEN_S, "opens" )
+    def write( self, data ):
+        count = len( data )
+        stats = self.simulator.sd_stats
+        stats["write_calls"] += 1
+        stats["bytes_written"] += count
+        self.simulator.clock.advance( cost_model.SD_WRITE_CALL_S, "sd write" )
+        full_sectors = ( self.sector_fill + count ) // cost_model.SD_SECTOR_BYTES
+        self.sector_fill = ( self.sector_fill + count ) % cost_model.SD_SECTOR_BYTES
+        if full_sectors:
+            stats["sectors_written"] += full_sectors
+            self.simulator.clock.advance( full_sectors * cost_model.SD_SECTOR_WRITE_S, "sd write" )
+        self.unsynced_bytes += count
+        return self.host_file.write( data )
+    def sync(self):
+        if self.unsynced_bytes:
+            self.simulator.charge_sd( cost_model.SD_SYNC_S, "syncs" )
+            self.unsynced_bytes = 0
+    def flush(self):
+        self.host_file.flush()
+        self.sync()
+    def charge_read( self, data ):
+        if data:
+            sectors = 1 + len( data ) // cost_model.SD_SECTOR_BYTES
+            self.simulator.sd_stats["bytes_read"] += len( data )
+            self.simulator.clock.advance( sectors * cost_model.SD_READ_SECTOR_S, "sd read" )
+        return data
+    def read( self, *args ):
+        return self.charge_read( self.host_file.read( *args ))
+    def readline( self, *args ):
+        return self.charge_read( self.host_file.readline( *args ))
+    def readlines(self):
+        return [ self.charge_read( line ) for line in self.host_file.readlines() ]
+    def readinto( self, buffer ):
+        count = self.host_file.readinto( buffer )
+        self.charge_read( bytes( count ))
+        return count
+    def __iter__(self):
+        return self
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+    def seek( self, *args ):
+        return self.host_file.seek( *args )
+    def tell(self):
+        return self.host_file.tell()
+    def close(self):
+        if not self.closed:
+            self.host_file.flush()
+            self.sync()
+            self.host_file.close()
+            self.closed = True
+            self.simulator.sd_stats["closes"] += 1
+    def __enter__(self):
+        return self
+    def __exit__( self, *args ):
+        self.close()
+
+class Simulator:
+    def __init__( self, scenario, duration_s = 60.0, sd_directory = None, cpu_scale = 0, firmware_directory = None, seed = 1, presets = None,
+                  compiled_modules = False ):
+        self.scenario = scenario
+        # values substituted for the module level presets in presets.py or code.py, e.g. { "benchmark_enabled": True }
+        self.presets = dict( scenario.get( "presets", {} ))
+        self.presets.update( presets or {} )
+        self.clock = Virtual_Clock( end_s = duration_s, cpu_scale = cpu_scale )
+        self.random = random.Random( seed )
+        light = scenario.get( "light", {} )
+        self.light = Virtual_Light_Field( seed = seed, **light )
+        self.start_epoch_s = calendar.timegm( tuple( scenario.get( "start_datetime", ( 2025, 6, 21, 16, 0, 0 ))) + ( 0, 0, 0 ))
+        # the system clock starts at the CircuitPython default until the firmware syncs it from the hardware clock
+        self.system_epoch_at_zero_s = calendar.timegm(( 2000, 1, 1, 0, 0, 0, 0, 0, 0 ))
+        self.inputs = Input_Script( scenario.get( "inputs", [] ))
+        self.firmware_directory = host_os.path.abspath( firmware_directory or DEFAULT_FIRMWARE_DIRECTORY )
+        if sd_directory is None:
+            sd_directory = host_os.path.join( HOST_TOOLS_DIRECTORY, "simulated_sd" )
+        self.sd_directory = host_os.path.abspath( sd_directory )
+        host_os.makedirs( self.sd_directory, exist_ok = True )
+        self.sd_mounted = False
+        self.sd_stats = { "opens": 0, "closes": 0, "write_calls": 0, "bytes_written": 0, "sectors_written": 0, "syncs": 0, "bytes_read": 0 }
+        self.display_changes = 0
+        self.heap_bytes = scenario.get( "heap_bytes", DEFAULT_HEAP_BYTES )
+        self.heap_scale = scenario.get( "heap_scale", DEFAULT_HEAP_SCALE )
+        self.lowest_mem_free = self.heap_bytes
+        # the stella modules in lib/ are charged as .mpy files when compiled_modules is set, as .py source otherwise
+        self.compiled_modules = compiled_modules
+        self.module_loads = []
+        self.firmware_importer = Firmware_Importer( self )
+        self.i2c_devices = {}
+        self.uart_device = None
+        for device_name in scenario.get( "devices", [] ):
+            device = virtual_device_classes[ device_name ]( self )
+            if device.address is None:
+                self.uart_device = device
+            else:
+                self.i2c_devices[ device.address ] = device
+        self.usb_host = Virtual_USB_Host( self )
+        self.host_open = builtins.open
+        self.installed = False
+
+    def heap_allocated(self):
+        current, peak = tracemalloc.get_traced_memory()
+        return int( current * self.heap_scale )
+
+    def charge_module_load( self, name, path, compiled ):
+        # the time and transient heap the instrument spends turning one firmware file into bytecode
+        source_bytes = host_os.path.getsize( path )
+        if compiled:
+            seconds = source_bytes * cost_model.MPY_LOAD_S_PER_BYTE
+            self.clock.advance( seconds, "module load (mpy)" )
+        else:
+            seconds = source_bytes * cost_model.SOURCE_COMPILE_S_PER_BYTE
+            self.clock.advance( seconds, "module compile" )
+            parse_tree_bytes = int( source_bytes * cost_model.SOURCE_COMPILE_HEAP_PER_BYTE )
+            free = max( 0, self.heap_bytes - self.heap_allocated() - parse_tree_bytes )
+            self.lowest_mem_free = min( self.lowest_mem_free, free )
+        self.module_loads.append(( name, source_bytes, compiled, seconds ))
+
+    def charge_sd( self, seconds, counter ):
+        self.sd_stats[ counter ] += 1
+        self.clock.advance( seconds, "sd " + counter.rstrip( "s" ))
+
+    ## path mapping, /sd goes to the sandbox directory, other absolute paths to the firmware's CIRCUITPY drive
+    def host_path( self, path ):
+        if not isinstance( path, str ) or not path.startswith( "/" ):
+            return None
+        if path == "/sd" or path.startswith( "/sd/" ):
+            if not self.sd_mounted:
+                raise OSError( 2, "No such file/directory", path )
+            return host_os.path.join( self.sd_directory, path[4:] )
+        first_component = path[1:].split( "/" )[0]
+        if first_component and host_os.path.exists( host_os.path.join( self.firmware_directory, first_component )):
+            return host_os.path.join( self.firmware_directory, path[1:] )
+        return None
+
+    def open( self, file, mode = "r", *args, **kwargs ):
+        host_path = self.host_path( file )
+        if host_path is None:
+            return self.host_open( file, mode, *args, **kwargs )
+        host_file = self.host_open( host_path, mode, *args, **kwargs )
+        if host_path.startswith( self.sd_directory ):
+            writing = any( flag in mode for flag in "wax+" )
+            return Simulated_SD_File( self, host_file, writing )
+        return host_file
+
+    ## shim modules for time, gc and os
+    def make_time_module(self):
+        module = types.ModuleType( "time" )
+        module.__dict__.update( host_time.__dict__ )
+        simulator = self
+        module.monotonic = self.clock.monotonic
+        module.monotonic_ns = self.clock.monotonic_ns
+        module.sleep = self.clock.sleep
+        def system_time():
+            return int( simulator.system_epoch_at_zero_s + simulator.clock.now() )
+        def localtime( seconds = None ):
+            if seconds is None:
+                seconds = system_time()
+            return host_time.gmtime( seconds )
+        def mktime( struct ):
+            return calendar.timegm( tuple( struct )[:6] + ( 0, 0, 0 ))
+        module.time = system_time
+        module.localtime = localtime
+        module.mktime = mktime
+        return module
+
+    def make_gc_module(self):
+        module = types.ModuleType( "gc" )
+        module.__dict__.update( host_gc.__dict__ )
+        simulator = self
+        def mem_alloc():
+            return simulator.heap_allocated()
+        def mem_free():
+            free = max( 0, simulator.heap_bytes - mem_alloc() )
+            simulator.lowest_mem_free = min( simulator.lowest_mem_free, free )
+            return free
+        def collect():
+            host_gc.collect()
+            return 0
+        def threshold( amount = None ):
+            return -1
+        module.mem_alloc = mem_alloc
+        module.mem_free = mem_free
+        module.collect = collect
+        module.threshold = threshold
+        return module
+
+    def make_os_module(self):
+        module = types.ModuleType( "os" )
+        module.__dict__.update( host_os.__dict__ )
+        simulator = self
+        def mapped( function ):
+            def wrapper( path = None, *args, **kwargs ):
+                host_path = simulator.host_path( path )
+                if host_path is not None:
+                    path = host_path
+                if path is None:
+                    return function( *args, **kwargs )
+                return function( path, *args, **kwargs )
+            return wrapper
+        for name in ( "listdir", "stat", "remove", "mkdir", "rmdir", "chdir" ):
+            setattr( module, name, mapped( getattr( host_os, name )))
+        def rename( old_path, new_path ):
+            simulator.clock.advance( cost_model.SD_SYNC_S, "sd directory" )
+            return host_os.rename( simulator.host_path( old_path ) or old_path, simulator.host_path( new_path ) or new_path )
+        def statvfs( path ):
+            # a 16 GB card formatted FAT32 with 32 kB clusters unless the scenario sets "sd_card_bytes",
+            # free space shrinks with what the run wrote
+            block_size = 32768
+            blocks = simulator.scenario.get( "sd_card_bytes", 16000000000 ) // block_size
+            used = 0
+            if path.startswith( "/sd" ):
+                for directory, subdirectories, files in host_os.walk( simulator.sd_directory ):
+                    for name in files:
+                        used += 1 + host_os.path.getsize( host_os.path.join( directory, name )) // block_size
+            return ( block_size, block_size, blocks, blocks - used, blocks - used, 0, 0, 0, 0, 255 )
+        def sync():
+            simulator.charge_sd( cost_model.SD_SYNC_S, "syncs" )
+        def getenv( key, default = None ):
+            return simulator.scenario.get( "settings", {} ).get( key, default )
+        def uname():
+            return ( "esp32", "esp32", "9.2.1", "9.2.1 on 2024-11-20", "Adafruit Feather ESP32-S3 4MB Flash 2MB PSRAM with ESP32S3" )
+        module.rename = rename
+        module.statvfs = statvfs
+        module.sync = sync
+        module.getenv = getenv
+        module.uname = uname
+        return module
+
+    ## install and remove the simulated platform
+    def install(self):
+        if stella_simulator.active is not None:
+            raise RuntimeError( "another simulator is already active" )
+        self.saved_modules = dict( sys.modules )
+        self.saved_path = list( sys.path )
+        sys.path.insert( 0, host_os.path.join( self.firmware_directory, "lib" ))
+        sys.path.insert( 0, self.firmware_directory )
+        sys.path.insert( 0, FAKES_DIRECTORY )
+        self.tracing_started_here = not tracemalloc.is_tracing()
+        if self.tracing_started_here:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        # the host may already have imported a module that has a stand-in, such as asyncio
+        for name in list( sys.modules ):
+            if name.split( "." )[0] in FAKE_MODULES:
+                del sys.modules[ name ]
+        sys.meta_path.insert( 0, self.firmware_importer )
+        sys.modules[ "time" ] = self.make_time_module()
+        sys.modules[ "gc" ] = self.make_gc_module()
+        sys.modules[ "os" ] = self.make_os_module()
+        builtins.open = self.open
+        stella_simulator.active = self
+        self.installed = True
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        builtins.open = self.host_open
+        sys.meta_path.remove( self.firmware_importer )
+        # forget the stand-ins and firmware libraries so the next run starts from a cold boot
+        for name in list( sys.modules ):
+            if name not in self.saved_modules:
+                del sys.modules[ name ]
+        sys.modules.update( self.saved_modules )
+        sys.path[:] = self.saved_path
+        if self.tracing_started_here:
+            tracemalloc.stop()
+        stella_simulator.active = None
+        self.installed = False
+
+    def __enter__(self):
+        self.install()
+        return self
+    def __exit__( self, *args ):
+        self.uninstall()
+
+    ## summary
+    def report(self):
+        print( "virtual run time {:.3f} s".format( self.clock.now() ))
+        self.clock.report()
+        print( "sd card:" )
+        for key in self.sd_stats:
+            print( "    {:<28} {:10}".format( key, self.sd_stats[key] ))
+        print( "display changes {}".format( self.display_changes ))
+        if self.usb_host.open_windows:
+            print( "usb data channel: {} writes, {} bytes read by the computer".format( self.usb_host.operations, len( self.usb_host.received )))
+        print( "device operations:" )
+        for device in list( self.i2c_devices.values() ) + [ self.uart_device ]:
+            if device is not None:
+                print( "    {:<28} {:10}".format( device.name, device.operations ))
+        if self.module_loads:
+            print( "firmware modules loaded:" )
+            for name, source_bytes, compiled, seconds in self.module_loads:
+                print( "    {:<28} {:7.1f} kB {:>4} {:8.3f} s".format( name, source_bytes / 1000, "mpy" if compiled else "py", seconds ))
+        print( "lowest simulated heap free {:.1f} kB of {:.1f} kB".format( self.lowest_mem_free / 1000, self.heap_bytes / 1000 ))
+
+class Firmware_Importer:
+    # imports presets.py and the stella package from the firmware directory, with the simulator's presets substituted,
+    # and charges the virtual clock for compiling each module on the instrument, or for loading it as a .mpy file
+    def __init__( self, simulator ):
+        self.simulator = simulator
+    def find_spec( self, fullname, path = None, target = None ):
+        if fullname == "presets":
+            module_path = host_os.path.join( self.simulator.firmware_directory, "presets" )
+        elif fullname.split( "." )[0] == "stella":
+            module_path = host_os.path.join( self.simulator.firmware_directory, "lib", *fullname.split( "." ))
+        else:
+            return None
+        if host_os.path.isfile( host_os.path.join( module_path, "__init__.py" )):
+            return importlib.util.spec_from_file_location( fullname, host_os.path.join( module_path, "__init__.py" ), loader = self,
+                                                           submodule_search_locations = [ module_path ] )
+        if host_os.path.isfile( module_path + ".py" ):
+            return importlib.util.spec_from_file_location( fullname, module_path + ".py", loader = self )
+        return None
+    def create_module( self, spec ):
+        return None
+    def exec_module( self, module ):
+        path = module.__spec__.origin
+        tree, substituted = parse_source( self.simulator, path )
+        code = compile( tree, path, "exec" )
+        del tree
+        # presets.py stays source on the instrument so it can be edited
+        compiled = self.simulator.compiled_modules and module.__name__ != "presets"
+        self.simulator.charge_module_load( module.__name__, path, compiled )
+        exec( code, module.__dict__ )
+
+def firmware_path( simulator ):
+    return host_os.path.join( simulator.firmware_directory, "code.py" )
+
+def parse_source( simulator, path ):
+    # a firmware file as a syntax tree, with the simulator's presets substituted for its module level preset assignments
+    presets = simulator.presets
+    with simulator.host_open( path ) as source_file:
+        tree = ast.parse( source_file.read(), path )
+    substituted = set()
+    for statement in tree.body:
+        if isinstance( statement, ast.Assign ) and len( statement.targets ) == 1 and isinstance( statement.targets[0], ast.Name ):
+            name = statement.targets[0].id
+            if name in presets:
+                statement.value = ast.copy_location( ast.Constant( presets[ name ] ), statement.value )
+                substituted.add( name )
+    return tree, substituted
+
+def parse_firmware( simulator ):
+    # code.py as a syntax tree, with the scenario's presets substituted; presets kept in presets.py are
+    # substituted when the firmware imports it
+    path = firmware_path( simulator )
+    tree, substituted = parse_source( simulator, path )
+    presets_path = host_os.path.join( simulator.firmware_directory, "presets.py" )
+    if host_os.path.isfile( presets_path ):
+        substituted |= parse_source( simulator, presets_path )[1]
+    missing = set( simulator.presets ) - substituted
+    if missing:
+        raise KeyError( "code.py and presets.py have no module level preset named {}".format( ", ".join( sorted( missing ))))
+    return path, tree
+
+def run_firmware( simulator ):
+    # run code.py to the end of the simulated duration, returns the virtual time reached
+    path, tree = parse_firmware( simulator )
+    namespace = { "__name__": "__main__", "__file__": path }
+    with simulator:
+        # the bytecode stays on the simulated heap, as it does on the instrument; code.py is always compiled from source
+        code = compile( tree, path, "exec" )
+        del tree
+        simulator.charge_module_load( "code", path, False )
+        try:
+            exec( code, namespace )
+        except Simulation_Complete:
+            pass
+        return simulator.clock.now()
+
+def load_firmware( simulator ):
+    # execute code.py without its closing main() call and return the module namespace, with the public names of the
+    # stella modules it imported merged in, so a tool can build and exercise the firmware's classes directly.
+    # The simulator must be installed.
+    if not simulator.installed:
+        raise RuntimeError( "install the simulator before loading the firmware" )
+    path, tree = parse_firmware( simulator )
+    while tree.body and isinstance( tree.body[-1], ast.Expr ) and isinstance( tree.body[-1].value, ast.Call ) \
+            and getattr( tree.body[-1].value.func, "id", None ) == "main":
+        tree.body.pop()
+    code = compile( tree, path, "exec" )
+    # the syntax tree is large and the simulated heap is traced, let it go before code.py counts its free memory
+    del tree
+    namespace = { "__name__": "stella_firmware", "__file__": path }
+    exec( code, namespace )
+    for module_name in sorted( sys.modules ):
+        if module_name.split( "." )[0] == "stella" and sys.modules[ module_name ] is not None:
+            for name, value in vars( sys.modules[ module_name ] ).items():
+                if not name.startswith( "_" ):
+                    namespace.setdefault( name, value )
+    return namespace
@@ -0,0 +1,95 @@
+# stand-in for the sparkfun AS7265X driver
+# Every access goes through the chip's virtual register protocol, so each call is charged per virtual register.
+
+import stella_simulator
+
+POLLING_DELAY = 0.005
+
+AS72651_NIR = 0x00
+AS72652_VISIBLE = 0x01
+AS72653_UV = 0x02
+
+AS7265x_LED_WHITE = 0x00
+AS7265x_LED_IR = 0x01
+AS7265x_LED_UV = 0x02
+
+LED_CURRENT_LIMIT_12_5MA = 0b00
+LED_CURRENT_LIMIT_25MA = 0b01
+LED_CURRENT_LIMIT_50MA = 0b10
+LED_CURRENT_LIMIT_100MA = 0b11
+
+GAIN_1X = 0b00
+GAIN_37X = 0b01
+GAIN_16X = 0b10
+GAIN_64X = 0b11
+
+MEASUREMENT_MODE_4CHAN = 0b00
+MEASUREMENT_MODE_4CHAN_2 = 0b01
+MEASUREMENT_MODE_6CHAN_CONTINUOUS = 0b10
+MEASUREMENT_MODE_6CHAN_ONE_SHOT = 0b11
+
+class AS7265X:
+    def __init__( self, i2c, address = 0x49 ):
+        self._i2c = i2c
+        self._device = i2c.device( address )
+        self._device.register_operations( 6 )
+        self._mode = self._device.mode
+        self._gain = self._device.gain
+        self._integration_time = self._device.integration_cycles
+        self._selected_device = 0
+    def virtual_read_register( self, register ):
+        self._device.register_operations( 1 )
+        return self._device.register_byte( self._selected_device, register )
+    def virtual_write_register( self, register, value ):
+        self._device.register_operations( 1 )
+    def select_device( self, device ):
+        self._device.register_operations( 1 )
+        self._selected_device = device
+    def set_measurement_mode( self, mode ):
+        self._mode = mode
+        self._device.set_mode( mode )
+    def data_available(self):
+        return self._device.data_available()
+    def clear_data_available(self):
+        self._device.register_operations( 2 )
+    def take_measurements(self):
+        self.clear_data_available()
+        self.set_measurement_mode( MEASUREMENT_MODE_6CHAN_ONE_SHOT )
+        while not self.data_available():
+            self._device.simulator.clock.sleep( POLLING_DELAY )
+    def set_gain( self, gain ):
+        self._device.register_operations( 2 )
+        self._gain = gain
+        self._device.gain = gain
+    def set_integration_cycles( self, cycles ):
+        self._device.register_operations( 1 )
+        self._integration_time = cycles
+        self._device.integration_cycles = cycles
+    def enable_bulb( self, device ):
+        self._device.register_operations( 3 )
+        self._device.bulbs[device] = True
+    def disable_bulb( self, device ):
+        self._device.register_operations( 3 )
+        self._device.bulbs[device] = False
+    def set_bulb_current( self, current, device ):
+        self._device.register_operations( 3 )
+    def enable_indicator(self):
+        self._device.register_operations( 3 )
+        self._device.indicator = True
+    def disable_indicator(self):
+        self._device.register_operations( 3 )
+        self._device.indicator = False
+    def get_temperature( self, device = 0 ):
+        self._device.register_operations( 2 )
+        return self._device.temperature( device )
+    def get_temperature_average(self):
+        return ( self.get_temperature( 0 ) + self.get_temperature( 1 ) + self.get_temperature( 2 )) / 3
+    def soft_reset(self):
+        self._device.register_operations( 2 )
+    def get_value( self, RorC ):
+        # 18 channels, raw counts are two registers each, calibrated floats four, plus a device select per chip
+        if RorC:
+            self._device.register_operations( 18 * 4 + 18 )
+        else:
+            self._device.register_operations( 18 * 2 + 18 )
+        return self._device.values( RorC )
@@ -0,0 +1,51 @@
+# stand-in for adafruit_as7341
+
+class Gain:
+    GAIN_0_5X = 0
+    GAIN_1X = 1
+    GAIN_2X = 2
+    GAIN_4X = 3
+    GAIN_8X = 4
+    GAIN_16X = 5
+    GAIN_32X = 6
+    GAIN_64X = 7
+    GAIN_128X = 8
+    GAIN_256X = 9
+    GAIN_512X = 10
+
+class AS7341:
+    def __init__( self, i2c_bus, address = 0x39 ):
+        self._device = i2c_bus.device( address )
+    @property
+    def atime(self):
+        return self._device.atime
+    @atime.setter
+    def atime( self, value ):
+        self._device.atime = value
+    @property
+    def astep(self):
+        return self._device.astep
+    @astep.setter
+    def astep( self, value ):
+        self._device.astep = value
+    @property
+    def gain(self):
+        return self._device.gain
+    @gain.setter
+    def gain( self, value ):
+        self._device.gain = value
+    @property
+    def led(self):
+        return self._device.led
+    @led.setter
+    def led( self, value ):
+        self._device.led = value
+    @property
+    def led_current(self):
+        return self._device.led_current
+    @led_current.setter
+    def led_current( self, value ):
+        self._device.led_current = value
+    @property
+    def all_channels(self):
+        return self._device.all_channels()
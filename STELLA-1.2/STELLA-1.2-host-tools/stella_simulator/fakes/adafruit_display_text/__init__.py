@@ -0,0 +1 @@
+# stand-in for adafruit_display_text
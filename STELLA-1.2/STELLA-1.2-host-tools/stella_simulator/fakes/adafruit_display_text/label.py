@@ -0,0 +1,27 @@
+# stand-in for adafruit_display_text.label, a text change re-renders the glyph bitmap
+
+import stella_simulator
+from stella_simulator import cost_model
+
+class Label:
+    def __init__( self, font, text = "", color = 0xFFFFFF, scale = 1, x = 0, y = 0, background_color = None, **kwargs ):
+        self.font = font
+        self._text = text
+        self.color = color
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self.background_color = background_color
+        self.anchor_point = None
+        self.anchored_position = None
+    @property
+    def text(self):
+        return self._text
+    @text.setter
+    def text( self, value ):
+        simulator = stella_simulator.active
+        if simulator is not None:
+            simulator.clock.advance( cost_model.DISPLAY_LABEL_TEXT_S, "display" )
+            simulator.display_changes += 1
+        self._text = value
@@ -0,0 +1,11 @@
+# stand-in for adafruit_focaltouch
+
+class Adafruit_FocalTouch:
+    def __init__( self, i2c, address = 0x38, debug = False, irq_pin = None ):
+        self._device = i2c.device( address )
+    @property
+    def touched(self):
+        return self._device.touched()
+    @property
+    def touches(self):
+        return self._device.touches()
@@ -0,0 +1,35 @@
+# stand-in for adafruit_gps, the receiver sits on the virtual uart
+
+class GPS:
+    def __init__( self, uart, debug = False ):
+        self._uart = uart
+        self._device = uart.gps
+        if self._device is None:
+            raise RuntimeError( "no gps receiver on the uart" )
+    def send_command( self, command, add_checksum = True ):
+        self._uart.write( b"$" + bytes( command ) + b"*00\r\n" )
+    def read( self, num_bytes ):
+        return self._uart.read( num_bytes )
+    def update(self):
+        return self._device.update()
+    @property
+    def has_fix(self):
+        return self._device.has_fix()
+    @property
+    def latitude(self):
+        if self._device.has_fix():
+            return self._device.latitude
+        return None
+    @property
+    def longitude(self):
+        if self._device.has_fix():
+            return self._device.longitude
+        return None
+    @property
+    def altitude_m(self):
+        if self._device.has_fix():
+            return self._device.altitude_m
+        return None
+    @property
+    def timestamp_utc(self):
+        return self._device.timestamp_utc()
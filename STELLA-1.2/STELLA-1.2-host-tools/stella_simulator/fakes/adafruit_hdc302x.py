@@ -0,0 +1,11 @@
+# stand-in for adafruit_hdc302x
+
+class HDC302x:
+    def __init__( self, i2c_bus, address = 0x44 ):
+        self._device = i2c_bus.device( address )
+    @property
+    def temperature(self):
+        return self._device.temperature()
+    @property
+    def relative_humidity(self):
+        return self._device.relative_humidity()
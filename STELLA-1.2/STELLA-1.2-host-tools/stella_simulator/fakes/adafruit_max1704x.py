@@ -0,0 +1,11 @@
+# stand-in for adafruit_max1704x
+
+class MAX17048:
+    def __init__( self, i2c_bus, address = 0x36 ):
+        self._device = i2c_bus.device( address )
+    @property
+    def cell_voltage(self):
+        return self._device.cell_voltage()
+    @property
+    def cell_percent(self):
+        return self._device.cell_percent()
@@ -0,0 +1,11 @@
+# stand-in for adafruit_mlx90614
+
+class MLX90614:
+    def __init__( self, i2c_bus, address = 0x5A ):
+        self._device = i2c_bus.device( address )
+    @property
+    def object_temperature(self):
+        return self._device.object_temperature()
+    @property
+    def ambient_temperature(self):
+        return self._device.ambient_temperature()
@@ -0,0 +1 @@
+# stand-in for adafruit_pcf8523
@@ -0,0 +1,17 @@
+# stand-in for adafruit_pcf8523.pcf8523
+
+class PCF8523:
+    def __init__( self, i2c_bus, address = 0x68 ):
+        self._device = i2c_bus.device( address )
+    @property
+    def datetime(self):
+        return self._device.datetime()
+    @datetime.setter
+    def datetime( self, value ):
+        self._device.set_datetime( value )
+    @property
+    def battery_low(self):
+        return self._device.battery_low
+    @property
+    def lost_power(self):
+        return False
@@ -0,0 +1,16 @@
+# stand-in for analogio, pin voltages come from the scenario
+
+import stella_simulator
+from stella_simulator import cost_model
+
+class AnalogIn:
+    def __init__( self, pin ):
+        self.simulator = stella_simulator.get_active()
+        self.pin = pin
+        self.reference_voltage = 3.3
+    @property
+    def value(self):
+        self.simulator.clock.advance( cost_model.ANALOG_READ_S, "analog" )
+        return int( self.simulator.scenario.get( "analog_values", {} ).get( self.pin.name, 0 ))
+    def deinit(self):
+        pass
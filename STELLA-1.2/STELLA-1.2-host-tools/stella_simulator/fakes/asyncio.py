@@ -0,0 +1,189 @@
+# stand-in for CircuitPython's asyncio: the same small API (run, create_task, sleep, sleep_ms, gather, Event),
+# scheduled on the virtual clock. A sleeping task moves virtual time forward only when no other task is ready,
+# so a run stays repeatable to the microsecond.
+
+import time
+
+import stella_simulator
+
+class CancelledError( BaseException ):
+    pass
+
+class _Wait:
+    # yielded by an awaitable to suspend the task: until a virtual time, or until an Event or Task finishes,
+    # or the first of a list of Tasks
+    def __init__( self, wake_s = None, waitable = None ):
+        self.wake_s = wake_s
+        self.waitable = waitable
+    def __await__(self):
+        yield self
+
+class Task:
+    def __init__( self, coroutine ):
+        self.coroutine = coroutine
+        self.done = False
+        self.result = None
+        self.exception = None
+        self.waiters = []
+        self.cancel_requested = False
+    def cancel(self):
+        if not self.done:
+            self.cancel_requested = True
+            _loop.make_ready( self )
+            return True
+        return False
+    def __await__(self):
+        while not self.done:
+            yield _Wait( waitable = self )
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+class Event:
+    def __init__(self):
+        self.state = False
+        self.waiters = []
+    def is_set(self):
+        return self.state
+    def set(self):
+        self.state = True
+        for task in self.waiters:
+            _loop.make_ready( task )
+        self.waiters = []
+    def clear(self):
+        self.state = False
+    async def wait(self):
+        while not self.state:
+            await _Wait( waitable = self )
+        return True
+
+class Loop:
+    def __init__(self):
+        self.ready = []
+        self.sleeping = []
+        self.sequence = 0
+        self.current = None
+        self.main_task = None
+    def make_ready( self, task ):
+        self.sleeping = [ entry for entry in self.sleeping if entry[2] is not task ]
+        if task not in self.ready:
+            self.ready.append( task )
+    def create_task( self, coroutine ):
+        task = Task( coroutine )
+        self.ready.append( task )
+        return task
+    def step( self, task ):
+        if task.done:
+            return
+        self.current = task
+        try:
+            if task.cancel_requested:
+                task.cancel_requested = False
+                wait = task.coroutine.throw( CancelledError() )
+            else:
+                wait = task.coroutine.send( None )
+        except StopIteration as stop:
+            self.finish( task, result = stop.value )
+            return
+        except ( CancelledError, Exception ) as error:
+            self.finish( task, exception = error )
+            return
+        finally:
+            self.current = None
+        if isinstance( wait.waitable, list ):
+            for waitable in wait.waitable:
+                waitable.waiters.append( task )
+        elif wait.waitable is not None:
+            wait.waitable.waiters.append( task )
+        elif wait.wake_s is None:
+            self.ready.append( task )
+        else:
+            self.sequence += 1
+            self.sleeping.append(( wait.wake_s, self.sequence, task ))
+    def finish( self, task, result = None, exception = None ):
+        task.done = True
+        task.result = result
+        task.exception = exception
+        for waiter in task.waiters:
+            self.make_ready( waiter )
+        if exception is not None and not task.waiters and task is not self.main_task and not isinstance( exception, CancelledError ):
+            # CircuitPython prints an exception nobody awaits and keeps the other tasks running
+            print( "Task exception wasn't retrieved" )
+            print( "{}: {}".format( type( exception ).__name__, exception ))
+    def run_until_complete( self, main_task ):
+        clock = stella_simulator.get_active().clock
+        # run raises the main task's exception
+        self.main_task = main_task
+        while not main_task.done:
+            if not self.ready:
+                if not self.sleeping:
+                    raise RuntimeError( "every task is waiting, nothing can wake them" )
+                self.sleeping.sort( key = lambda entry: ( entry[0], entry[1] ))
+                wake_s = self.sleeping[0][0]
+                clock.advance( wake_s - clock.now(), "idle" )
+                # the simulator ends the run from here once the virtual duration is reached
+                now_s = time.monotonic()
+                while self.sleeping and self.sleeping[0][0] <= now_s:
+                    self.ready.append( self.sleeping.pop( 0 )[2] )
+            task = self.ready.pop( 0 )
+            self.step( task )
+        if main_task.exception is not None:
+            raise main_task.exception
+        return main_task.result
+
+_loop = Loop()
+
+def get_event_loop():
+    return _loop
+
+def new_event_loop():
+    global _loop
+    _loop = Loop()
+    return _loop
+
+def current_task():
+    return _loop.current
+
+def create_task( coroutine ):
+    return _loop.create_task( coroutine )
+
+def run( coroutine ):
+    return _loop.run_until_complete( _loop.create_task( coroutine ))
+
+async def sleep( seconds ):
+    if seconds <= 0:
+        await _Wait()
+    else:
+        await _Wait( wake_s = stella_simulator.get_active().clock.now() + seconds )
+
+async def sleep_ms( milliseconds ):
+    await sleep( milliseconds / 1000 )
+
+async def gather( *awaitables, return_exceptions = False ):
+    tasks = []
+    for awaitable in awaitables:
+        if not isinstance( awaitable, Task ):
+            awaitable = create_task( awaitable )
+        tasks.append( awaitable )
+    # as in CircuitPython, the first task to raise ends the gather with its exception, the others are left running
+    while True:
+        pending = []
+        for task in tasks:
+            if not task.done:
+                pending.append( task )
+            elif task.exception is not None and not return_exceptions:
+                raise task.exception
+        if not pending:
+            break
+        await _Wait( waitable = pending )
+        waiter = current_task()
+        for task in pending:
+            if waiter in task.waiters:
+                task.waiters.remove( waiter )
+    results = []
+    for task in tasks:
+        if task.exception is not None:
+            results.append( task.exception )
+        else:
+            results.append( task.result )
+    return results
@@ -0,0 +1,48 @@
+# stand-in for the CircuitPython board module, Adafruit Feather ESP32-S3 pin names
+
+import busio
+
+class Pin:
+    def __init__( self, name ):
+        self.name = name
+    def __repr__(self):
+        return "board.{}".format( self.name )
+
+A0 = Pin( "A0" )
+A1 = Pin( "A1" )
+A2 = Pin( "A2" )
+A3 = Pin( "A3" )
+A4 = Pin( "A4" )
+A5 = Pin( "A5" )
+D5 = Pin( "D5" )
+D6 = Pin( "D6" )
+D9 = Pin( "D9" )
+D10 = Pin( "D10" )
+D11 = Pin( "D11" )
+D12 = Pin( "D12" )
+D13 = Pin( "D13" )
+TX = Pin( "TX" )
+RX = Pin( "RX" )
+SCL = Pin( "SCL" )
+SDA = Pin( "SDA" )
+SCK = Pin( "SCK" )
+MOSI = Pin( "MOSI" )
+MISO = Pin( "MISO" )
+NEOPIXEL = Pin( "NEOPIXEL" )
+LED = Pin( "LED" )
+
+_i2c = None
+_spi = None
+
+def I2C():
+    # the board bus is a singleton, a second call returns the same object
+    global _i2c
+    if _i2c is None or _i2c.deinitialized:
+        _i2c = busio.I2C( SCL, SDA )
+    return _i2c
+
+def SPI():
+    global _spi
+    if _spi is None:
+        _spi = busio.SPI( SCK, MOSI, MISO )
+    return _spi
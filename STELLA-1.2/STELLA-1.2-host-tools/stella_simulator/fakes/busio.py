@@ -0,0 +1,78 @@
+# stand-in for busio: the i2c bus answers for the virtual devices the scenario attached
+
+import stella_simulator
+from stella_simulator import cost_model
+
+class I2C:
+    def __init__( self, scl, sda, frequency = 100000, timeout = 255 ):
+        self.simulator = stella_simulator.get_active()
+        self.locked = False
+        self.deinitialized = False
+        self.frequency = frequency
+    def try_lock(self):
+        if self.locked:
+            return False
+        self.locked = True
+        return True
+    def unlock(self):
+        self.locked = False
+    def scan(self):
+        addresses = []
+        for address in range( 0x08, 0x78 ):
+            self.simulator.clock.advance( cost_model.I2C_TRANSACTION_S, "i2c scan" )
+            device = self.simulator.i2c_devices.get( address )
+            if device is not None and device.answers_scan:
+                addresses.append( address )
+        return addresses
+    def deinit(self):
+        self.deinitialized = True
+    def device( self, address ):
+        # used by the stand-in drivers, same failure as adafruit_bus_device when nothing answers
+        self.simulator.clock.advance( cost_model.I2C_TRANSACTION_S, "i2c probe" )
+        device = self.simulator.i2c_devices.get( address )
+        if device is None:
+            raise ValueError( "No I2C device at address: 0x{:x}".format( address ))
+        return device
+    def __enter__(self):
+        return self
+    def __exit__( self, *args ):
+        self.deinit()
+
+class SPI:
+    def __init__( self, clock, MOSI = None, MISO = None ):
+        self.locked = False
+    def try_lock(self):
+        self.locked = True
+        return True
+    def unlock(self):
+        self.locked = False
+    def configure( self, baudrate = 100000, polarity = 0, phase = 0, bits = 8 ):
+        pass
+    def deinit(self):
+        pass
+
+class UART:
+    class Parity:
+        ODD = 1
+        EVEN = 2
+    def __init__( self, tx = None, rx = None, baudrate = 9600, bits = 8, parity = None, stop = 1, timeout = 1, receiver_buffer_size = 64 ):
+        self.simulator = stella_simulator.get_active()
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.gps = self.simulator.uart_device
+    @property
+    def in_waiting(self):
+        return 0
+    def read( self, nbytes = None ):
+        if self.gps is None:
+            return None
+        return self.gps.read_bytes( nbytes or 32 )
+    def readline(self):
+        return self.read( 80 )
+    def write( self, buffer ):
+        self.simulator.clock.advance( len( buffer ) * cost_model.GPS_BYTE_S, "uart" )
+        return len( buffer )
+    def reset_input_buffer(self):
+        pass
+    def deinit(self):
+        pass
@@ -0,0 +1,28 @@
+# stand-in for countio, a counter on the touch controller's INT pin counts the scenario's touch reports.
+# The FocalTouch pulses INT low once per report while a finger is on the panel.
+
+import stella_simulator
+
+TOUCH_REPORT_INTERVAL_S = 0.01
+
+class Edge:
+    FALL = "fall"
+    RISE = "rise"
+    RISE_AND_FALL = "rise_and_fall"
+
+class Counter:
+    def __init__( self, pin, *, edge = Edge.FALL, pull = None ):
+        self.simulator = stella_simulator.get_active()
+        self.pin = pin
+        self.edge = edge
+        self.offset = 0
+    @property
+    def count(self):
+        return self.simulator.inputs.touch_reports( self.simulator.clock.now(), TOUCH_REPORT_INTERVAL_S ) - self.offset
+    @count.setter
+    def count( self, value ):
+        self.offset = self.simulator.inputs.touch_reports( self.simulator.clock.now(), TOUCH_REPORT_INTERVAL_S ) - value
+    def reset(self):
+        self.count = 0
+    def deinit(self):
+        pass
@@ -0,0 +1,41 @@
+# stand-in for digitalio, the encoder button pin follows the scenario's input script
+
+import stella_simulator
+from stella_simulator import cost_model
+
+class Direction:
+    INPUT = "input"
+    OUTPUT = "output"
+
+class Pull:
+    UP = "up"
+    DOWN = "down"
+
+class DriveMode:
+    PUSH_PULL = "push_pull"
+    OPEN_DRAIN = "open_drain"
+
+class DigitalInOut:
+    def __init__( self, pin ):
+        self.simulator = stella_simulator.get_active()
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self._value = False
+    def switch_to_output( self, value = False, drive_mode = DriveMode.PUSH_PULL ):
+        self.direction = Direction.OUTPUT
+        self._value = value
+    def switch_to_input( self, pull = None ):
+        self.direction = Direction.INPUT
+        self.pull = pull
+    @property
+    def value(self):
+        self.simulator.clock.advance( cost_model.DIGITAL_READ_S, "gpio" )
+        if self.direction == Direction.INPUT:
+            return self.simulator.inputs.pin_value( self.pin.name, self.simulator.clock.now(), self.pull )
+        return self._value
+    @value.setter
+    def value( self, value ):
+        self._value = value
+    def deinit(self):
+        pass
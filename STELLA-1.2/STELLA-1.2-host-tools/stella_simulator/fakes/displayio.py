@@ -0,0 +1,105 @@
+# stand-in for displayio, keeps the object tree and charges for changes that would redraw a region
+
+import stella_simulator
+from stella_simulator import cost_model
+
+def charge_redraw( pixels ):
+    simulator = stella_simulator.active
+    if simulator is not None:
+        simulator.clock.advance( cost_model.DISPLAY_SHAPE_CHANGE_S + pixels * cost_model.DISPLAY_PIXEL_S, "display" )
+        simulator.display_changes += 1
+
+class Group:
+    def __init__( self, scale = 1, x = 0, y = 0 ):
+        self.scale = scale
+        self.x = x
+        self.y = y
+        self._hidden = False
+        self.items = []
+    @property
+    def hidden(self):
+        return self._hidden
+    @hidden.setter
+    def hidden( self, value ):
+        if value != self._hidden:
+            self._hidden = value
+            charge_redraw( 320 * 240 // 4 )
+    def append( self, item ):
+        self.items.append( item )
+    def insert( self, index, item ):
+        self.items.insert( index, item )
+    def remove( self, item ):
+        self.items.remove( item )
+    def pop( self, index = -1 ):
+        return self.items.pop( index )
+    def index( self, item ):
+        return self.items.index( item )
+    def sort( self, key = None, reverse = False ):
+        self.items.sort( key = key, reverse = reverse )
+    def __len__(self):
+        return len( self.items )
+    def __getitem__( self, index ):
+        return self.items[index]
+    def __setitem__( self, index, item ):
+        self.items[index] = item
+    def __delitem__( self, index ):
+        del self.items[index]
+    def __contains__( self, item ):
+        return item in self.items
+    def __iter__(self):
+        return iter( self.items )
+
+class Palette:
+    def __init__( self, color_count, dither = False ):
+        self.colors = [ 0 ] * color_count
+        self.transparent = set()
+    def __setitem__( self, index, color ):
+        self.colors[index] = color
+    def __getitem__( self, index ):
+        return self.colors[index]
+    def __len__(self):
+        return len( self.colors )
+    def make_transparent( self, index ):
+        self.transparent.add( index )
+    def make_opaque( self, index ):
+        self.transparent.discard( index )
+
+class ColorConverter:
+    def __init__( self, **kwargs ):
+        pass
+
+class Bitmap:
+    def __init__( self, width, height, value_count ):
+        self.width = width
+        self.height = height
+        self.data = bytearray( width * height )
+    def __setitem__( self, index, value ):
+        if isinstance( index, tuple ):
+            index = index[1] * self.width + index[0]
+        self.data[index] = value
+    def __getitem__( self, index ):
+        if isinstance( index, tuple ):
+            index = index[1] * self.width + index[0]
+        return self.data[index]
+    def fill( self, value ):
+        for index in range( 0, len( self.data )):
+            self.data[index] = value
+
+class OnDiskBitmap:
+    def __init__( self, file ):
+        # the logo is only ever drawn, nothing reads pixels back
+        self.file = file
+        self.width = 320
+        self.height = 240
+        self.pixel_shader = ColorConverter()
+
+class TileGrid:
+    def __init__( self, bitmap, pixel_shader = None, width = 1, height = 1, tile_width = None, tile_height = None, default_tile = 0, x = 0, y = 0 ):
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.x = x
+        self.y = y
+        self.hidden = False
+
+def release_displays():
+    pass
@@ -0,0 +1,67 @@
+# stand-in for the iorodeo AS7331 driver
+
+GAIN_2048X = 0
+GAIN_1024X = 1
+GAIN_512X = 2
+GAIN_256X = 3
+GAIN_128X = 4
+GAIN_64X = 5
+GAIN_32X = 6
+GAIN_16X = 7
+GAIN_8X = 8
+GAIN_4X = 9
+GAIN_2X = 10
+GAIN_1X = 11
+
+INTEGRATION_TIME_1MS = 0
+INTEGRATION_TIME_2MS = 1
+INTEGRATION_TIME_4MS = 2
+INTEGRATION_TIME_8MS = 3
+INTEGRATION_TIME_16MS = 4
+INTEGRATION_TIME_32MS = 5
+INTEGRATION_TIME_64MS = 6
+INTEGRATION_TIME_128MS = 7
+INTEGRATION_TIME_256MS = 8
+INTEGRATION_TIME_512MS = 9
+INTEGRATION_TIME_1024MS = 10
+INTEGRATION_TIME_2048MS = 11
+INTEGRATION_TIME_4096MS = 12
+INTEGRATION_TIME_8192MS = 13
+INTEGRATION_TIME_16384MS = 14
+
+MEASUREMENT_MODE_CONTINUOUS = 0
+MEASUREMENT_MODE_COMMAND = 1
+MEASUREMENT_MODE_SYNC_START = 2
+
+class AS7331Overflow( Exception ):
+    pass
+
+class AS7331:
+    def __init__( self, i2c, address = 0x74 ):
+        self._device = i2c.device( address )
+    @property
+    def gain(self):
+        return self._device.gain_code
+    @gain.setter
+    def gain( self, value ):
+        self._device.gain_code = value
+    @property
+    def integration_time(self):
+        return self._device.integration_code
+    @integration_time.setter
+    def integration_time( self, value ):
+        self._device.integration_code = value
+    @property
+    def measurement_mode(self):
+        return self._device.measurement_mode
+    @measurement_mode.setter
+    def measurement_mode( self, value ):
+        self._device.measurement_mode = value
+    @property
+    def raw_values(self):
+        return self._device.raw_values()
+    @property
+    def values(self):
+        return self._device.values()
+    def start_measurement(self):
+        pass
@@ -0,0 +1,72 @@
+# stand-in for keypad, key events are the edges of the scenario's button presses on the key pins.
+# CircuitPython scans the keys in the background, here the edges up to now are queued whenever the queue is looked at.
+
+import stella_simulator
+
+class Event:
+    def __init__( self, key_number = 0, pressed = True ):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.timestamp = 0
+    @property
+    def released(self):
+        return not self.pressed
+
+class EventQueue:
+    def __init__( self, keys, max_events ):
+        self.keys = keys
+        self.max_events = max_events
+        self.events = []
+        self.overflowed = False
+    def get(self):
+        self.keys.scan()
+        if not self.events:
+            return None
+        return self.events.pop( 0 )
+    def get_into( self, event ):
+        self.keys.scan()
+        if not self.events:
+            return False
+        queued = self.events.pop( 0 )
+        event.key_number = queued.key_number
+        event.pressed = queued.pressed
+        event.timestamp = queued.timestamp
+        return True
+    def clear(self):
+        self.keys.scan()
+        self.events = []
+        self.overflowed = False
+    def __len__(self):
+        self.keys.scan()
+        return len( self.events )
+    def __bool__(self):
+        return len( self ) > 0
+
+class Keys:
+    def __init__( self, pins, *, value_when_pressed, pull = True, interval = 0.02, max_events = 64, debounce_threshold = 1 ):
+        self.simulator = stella_simulator.get_active()
+        self.pins = pins
+        self.last_scan_s = self.simulator.clock.now()
+        self.events = EventQueue( self, max_events )
+    @property
+    def key_count(self):
+        return len( self.pins )
+    def scan(self):
+        now_s = self.simulator.clock.now()
+        transitions = []
+        for key_number, pin in enumerate( self.pins ):
+            for edge_s, pressed in self.simulator.inputs.pin_transitions( pin.name, self.last_scan_s, now_s ):
+                transitions.append(( edge_s, key_number, pressed ))
+        transitions.sort( key = lambda transition: transition[0] )
+        for edge_s, key_number, pressed in transitions:
+            if len( self.events.events ) >= self.events.max_events:
+                self.events.overflowed = True
+                break
+            event = Event( key_number, pressed )
+            event.timestamp = int( edge_s * 1000 )
+            self.events.events.append( event )
+        self.last_scan_s = now_s
+    def reset(self):
+        self.events.clear()
+    def deinit(self):
+        pass
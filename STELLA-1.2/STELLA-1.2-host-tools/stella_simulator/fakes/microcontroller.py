@@ -0,0 +1,20 @@
+# stand-in for microcontroller
+
+import stella_simulator
+
+class Processor:
+    @property
+    def uid(self):
+        return stella_simulator.get_active().scenario.get( "uid", b"\x7c\xdf\xa1\x0b\x3e\x52" )
+    @property
+    def temperature(self):
+        return 38.0
+    frequency = 240000000
+
+cpu = Processor()
+
+class Pin:
+    pass
+
+def reset():
+    raise SystemExit( "microcontroller.reset()" )
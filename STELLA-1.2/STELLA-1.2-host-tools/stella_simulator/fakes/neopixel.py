@@ -0,0 +1,28 @@
+# stand-in for neopixel, remembers the last color for the run summary
+
+import stella_simulator
+from stella_simulator import cost_model
+
+RGB = "RGB"
+GRB = "GRB"
+RGBW = "RGBW"
+GRBW = "GRBW"
+
+class NeoPixel:
+    def __init__( self, pin, n, brightness = 1.0, auto_write = True, pixel_order = GRB ):
+        self.simulator = stella_simulator.get_active()
+        self.pixels = [ ( 0, 0, 0 ) ] * n
+        self.brightness = brightness
+    def fill( self, color ):
+        self.simulator.clock.advance( cost_model.NEOPIXEL_WRITE_S, "neopixel" )
+        self.pixels = [ color ] * len( self.pixels )
+    def __setitem__( self, index, color ):
+        self.pixels[index] = color
+    def __getitem__( self, index ):
+        return self.pixels[index]
+    def __len__(self):
+        return len( self.pixels )
+    def show(self):
+        pass
+    def deinit(self):
+        pass
@@ -0,0 +1,21 @@
+# stand-in for the sparkfun qwiic buzzer driver
+
+class QwiicBuzzer:
+    VOLUME_MIN = 1
+    VOLUME_LOW = 2
+    VOLUME_MID = 3
+    VOLUME_MAX = 4
+    def __init__( self, address = None, i2c_driver = None ):
+        self._device = i2c_driver.device( address or 0x34 )
+    def begin(self):
+        return True
+    def configure( self, *args ):
+        self._device.command()
+        return True
+    def on(self):
+        self._device.command()
+        self._device.beeps += 1
+        return True
+    def off(self):
+        self._device.command()
+        return True
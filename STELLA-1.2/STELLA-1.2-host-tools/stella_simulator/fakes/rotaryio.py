@@ -0,0 +1,13 @@
+# stand-in for rotaryio, the position is the running sum of the scenario's encoder steps
+
+import stella_simulator
+
+class IncrementalEncoder:
+    def __init__( self, pin_a, pin_b, divisor = 4 ):
+        self.simulator = stella_simulator.get_active()
+        self.divisor = divisor
+    @property
+    def position(self):
+        return self.simulator.inputs.encoder_position( self.simulator.clock.now() )
+    def deinit(self):
+        pass
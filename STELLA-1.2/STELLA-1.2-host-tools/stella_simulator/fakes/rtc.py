@@ -0,0 +1,19 @@
+# stand-in for rtc, the system clock is an offset from the virtual clock
+
+import calendar
+import time as host_time
+
+import stella_simulator
+
+class RTC:
+    @property
+    def datetime(self):
+        simulator = stella_simulator.get_active()
+        return host_time.gmtime( int( simulator.system_epoch_at_zero_s + simulator.clock.now() ))
+    @datetime.setter
+    def datetime( self, value ):
+        simulator = stella_simulator.get_active()
+        simulator.system_epoch_at_zero_s = calendar.timegm( tuple( value )[:6] + ( 0, 0, 0 )) - simulator.clock.now()
+
+def set_time_source( source ):
+    pass
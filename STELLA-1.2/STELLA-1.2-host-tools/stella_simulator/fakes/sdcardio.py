@@ -0,0 +1,12 @@
+# stand-in for sdcardio, fails like a missing card when the scenario has none
+
+import stella_simulator
+
+class SDCard:
+    def __init__( self, spi, cs, baudrate = 8000000 ):
+        simulator = stella_simulator.get_active()
+        if not simulator.scenario.get( "sd_card", True ):
+            raise OSError( "no SD card" )
+        self.simulator = simulator
+    def deinit(self):
+        pass
@@ -0,0 +1,19 @@
+# stand-in for storage, mounting at /sd turns on the sandbox directory behind open() and os
+
+import stella_simulator
+
+class VfsFat:
+    def __init__( self, block_device ):
+        self.block_device = block_device
+        self.label = "STELLA"
+
+def mount( filesystem, mount_path, readonly = False ):
+    if mount_path == "/sd":
+        stella_simulator.get_active().sd_mounted = True
+
+def umount( mount ):
+    if mount in ( "/sd", ):
+        stella_simulator.get_active().sd_mounted = False
+
+def remount( mount_path, readonly = False, disable_concurrent_write_protection = False ):
+    pass
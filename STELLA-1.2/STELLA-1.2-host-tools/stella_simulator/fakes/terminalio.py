@@ -0,0 +1,7 @@
+# stand-in for terminalio
+
+class Font:
+    def get_bounding_box(self):
+        return ( 6, 14 )
+
+FONT = Font()
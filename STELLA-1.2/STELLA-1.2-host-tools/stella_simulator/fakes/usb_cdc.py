@@ -0,0 +1,43 @@
+# stand-in for usb_cdc, the data channel goes to the scenario's virtual computer. The console is the simulator's stdout.
+
+import stella_simulator
+
+class Serial:
+    def __init__( self, host ):
+        self.host = host
+        self.timeout = 1
+        self.write_timeout = None
+    @property
+    def connected(self):
+        return self.host.is_open()
+    @property
+    def out_waiting(self):
+        self.host.drain()
+        return int( self.host.tx_waiting )
+    @property
+    def in_waiting(self):
+        return self.host.in_waiting()
+    def write( self, data ):
+        # write_timeout None waits until everything is taken, 0 takes what fits now
+        data = memoryview( data )
+        written = self.host.write( data )
+        while self.write_timeout is None and written < len( data ) and self.host.is_open():
+            self.host.wait_for_room()
+            written += self.host.write( data[written:] )
+        return written
+    def read( self, size = 1 ):
+        # never waits, as with timeout 0
+        return self.host.read( size )
+    def reset_input_buffer(self):
+        self.host.read( self.host.in_waiting() )
+    def reset_output_buffer(self):
+        self.host.tx_waiting = 0.0
+
+def enable( console = True, data = False ):
+    pass
+
+def disable():
+    pass
+
+console = None
+data = Serial( stella_simulator.get_active().usb_host )
@@ -0,0 +1,102 @@
+# stand-in for vectorio, a property write that changes a shape charges for redrawing its area
+
+from displayio import charge_redraw
+
+class Shape:
+    def __init__( self, pixel_shader, x, y, color_index ):
+        self._pixel_shader = pixel_shader
+        self._x = x
+        self._y = y
+        self._color_index = color_index
+        self._hidden = False
+    def area(self):
+        return 0
+    def changed( self, old, new ):
+        if old != new:
+            charge_redraw( self.area() )
+            return True
+        return False
+    @property
+    def pixel_shader(self):
+        return self._pixel_shader
+    @pixel_shader.setter
+    def pixel_shader( self, value ):
+        self._pixel_shader = value
+        charge_redraw( self.area() )
+    @property
+    def x(self):
+        return self._x
+    @x.setter
+    def x( self, value ):
+        if self.changed( self._x, value ):
+            self._x = value
+    @property
+    def y(self):
+        return self._y
+    @y.setter
+    def y( self, value ):
+        if self.changed( self._y, value ):
+            self._y = value
+    @property
+    def location(self):
+        return ( self._x, self._y )
+    @location.setter
+    def location( self, value ):
+        self.x, self.y = value
+    @property
+    def color_index(self):
+        return self._color_index
+    @color_index.setter
+    def color_index( self, value ):
+        if self.changed( self._color_index, value ):
+            self._color_index = value
+    @property
+    def hidden(self):
+        return self._hidden
+    @hidden.setter
+    def hidden( self, value ):
+        if self.changed( self._hidden, value ):
+            self._hidden = value
+
+class Rectangle( Shape ):
+    def __init__( self, pixel_shader = None, width = 1, height = 1, x = 0, y = 0, color_index = 0 ):
+        super().__init__( pixel_shader, x, y, color_index )
+        self._width = width
+        self._height = height
+    def area(self):
+        return self._width * self._height
+    @property
+    def width(self):
+        return self._width
+    @width.setter
+    def width( self, value ):
+        if self.changed( self._width, value ):
+            self._width = value
+    @property
+    def height(self):
+        return self._height
+    @height.setter
+    def height( self, value ):
+        if self.changed( self._height, value ):
+            self._height = value
+
+class Circle( Shape ):
+    def __init__( self, pixel_shader = None, radius = 1, x = 0, y = 0, color_index = 0 ):
+        super().__init__( pixel_shader, x, y, color_index )
+        self._radius = radius
+    def area(self):
+        return 4 * self._radius * self._radius
+    @property
+    def radius(self):
+        return self._radius
+    @radius.setter
+    def radius( self, value ):
+        if self.changed( self._radius, value ):
+            self._radius = value
+
+class Polygon( Shape ):
+    def __init__( self, pixel_shader = None, points = None, x = 0, y = 0, color_index = 0 ):
+        super().__init__( pixel_shader, x, y, color_index )
+        self.points = points or []
+    def area(self):
+        return 400
@@ -0,0 +1,66 @@
+# named scenarios: which virtual devices are attached, the light, the user inputs, the starting date and time
+# analog values are 16 bit counts: A1 senses the 5 V supply through a divider, A0 is the rangefinder output
+
+ONBOARD_DEVICES = [ "pcf8523", "max17048", "focaltouch", "qwiic_buzzer", "pa1616d" ]
+
+scenarios = {
+    # the standard STELLA-1.2 remote sensing kit, recording from power up
+    "remote_sensing": {
+        "devices": ONBOARD_DEVICES + [ "as7265x", "as7331", "hdc302x", "mlx90614" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 15037, "A1": 49648 },
+        "light": { "peak_irradiance_uW_per_cm2_nm": 180.0, "cloud_depth": 0.6, "cloud_period_s": 90.0 },
+        "inputs": [
+            { "at_s": 40.0, "turn": 1 },
+            { "at_s": 44.0, "turn": -1 },
+        ],
+    },
+    # remote sensing kit under heavy, fast moving cloud, for exposure control work
+    "remote_sensing_clouds": {
+        "devices": ONBOARD_DEVICES + [ "as7265x", "as7331", "hdc302x", "mlx90614" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 15037, "A1": 49648 },
+        "light": { "peak_irradiance_uW_per_cm2_nm": 220.0, "cloud_depth": 0.95, "cloud_period_s": 20.0 },
+        "inputs": [],
+    },
+    # air sensor only, the remote sensing page is replaced by its missing-sensor page
+    "air": {
+        "devices": ONBOARD_DEVICES + [ "hdc302x" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 0, "A1": 49648 },
+        "inputs": [],
+    },
+    # main unit with nothing plugged in
+    "bare": {
+        "devices": ONBOARD_DEVICES,
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 0, "A1": 49648 },
+        "inputs": [],
+    },
+    # remote sensing kit with no SD card in the slot
+    "no_sd_card": {
+        "devices": ONBOARD_DEVICES + [ "as7265x", "as7331", "hdc302x", "mlx90614" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 15037, "A1": 49648 },
+        "sd_card": False,
+        "inputs": [],
+    },
+    # remote sensing kit logging bursts onto a nearly full card, the storage manager moves to summary rows, then binary records
+    "small_sd_card": {
+        "devices": ONBOARD_DEVICES + [ "as7265x", "as7331", "hdc302x", "mlx90614" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 15037, "A1": 49648 },
+        "sd_card_bytes": 8000000,
+        "presets": { "preset_burst_count": 6 },
+        "inputs": [],
+    },
+    # remote sensing kit streaming samples to a computer that opens the port late, closes it for a while, and reads slowly
+    "usb_streaming": {
+        "devices": ONBOARD_DEVICES + [ "as7265x", "as7331", "hdc302x", "mlx90614" ],
+        "start_datetime": ( 2025, 6, 21, 16, 0, 0 ),
+        "analog_values": { "A0": 15037, "A1": 49648 },
+        "presets": { "usb_serial_out_enabled": True },
+        "usb_host": { "open": [( 15.0, 70.0 ), ( 85.0, None )], "read_bytes_per_s": 2000 },
+        "inputs": [],
+    },
+}
@@ -0,0 +1,28 @@
+# a pyserial-like port on the simulated instrument's usb data channel, for host tools run against the simulator
+# The firmware runs on virtual time in the main thread and the host tool in another thread on real time: reads wait
+# in real time for the bytes the virtual computer has taken from the instrument's transmit buffer.
+
+import time as host_time
+
+class Simulated_Port:
+    def __init__( self, usb_host, timeout = 1.0 ):
+        self.usb_host = usb_host
+        self.timeout = timeout
+        self.read_offset = 0
+        self.usb_host.port_open = True
+    @property
+    def in_waiting(self):
+        return self.usb_host.delivered_bytes() - self.read_offset
+    def read( self, size = 1 ):
+        deadline_s = host_time.monotonic() + self.timeout
+        while self.in_waiting <= 0 and host_time.monotonic() < deadline_s:
+            host_time.sleep( 0.001 )
+        end = min( self.read_offset + size, self.usb_host.delivered_bytes() )
+        data = bytes( self.usb_host.received[ self.read_offset:end ])
+        self.read_offset += len( data )
+        return data
+    def write( self, data ):
+        self.usb_host.host_write( bytes( data ))
+        return len( data )
+    def close(self):
+        self.usb_host.port_open = False
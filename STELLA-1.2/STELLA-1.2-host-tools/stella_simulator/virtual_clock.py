@@ -0,0 +1,48 @@
+# virtual time base for the simulator
+# time only moves when the firmware sleeps or when a virtual device charges for a bus transaction,
+# so a run is repeatable to the microsecond. Set cpu_scale > 0 to also charge real host CPU time,
+# multiplied by cpu_scale to approximate the slower microcontroller.
+
+import time as host_time
+
+class Simulation_Complete( BaseException ):
+    # BaseException so the firmware's "except Exception" handlers don't swallow the end of the run
+    pass
+
+class Virtual_Clock:
+    def __init__( self, end_s = None, cpu_scale = 0, tick_s = 0.00001 ):
+        self.io_s = 0.0
+        self.end_s = end_s
+        self.cpu_scale = cpu_scale
+        self.tick_s = tick_s
+        self.cpu_start_s = host_time.process_time()
+        self.charges = {}
+    def now(self):
+        now_s = self.io_s
+        if self.cpu_scale:
+            now_s += ( host_time.process_time() - self.cpu_start_s ) * self.cpu_scale
+        return now_s
+    def advance( self, seconds, account = None ):
+        if seconds > 0:
+            self.io_s += seconds
+            if account is not None:
+                self.charges[ account ] = self.charges.get( account, 0.0 ) + seconds
+    def advance_to( self, when_s ):
+        self.advance( when_s - self.now() )
+    def monotonic(self):
+        # every call costs one tick so a loop that touches no device still moves time forward
+        self.io_s += self.tick_s
+        now_s = self.now()
+        if self.end_s is not None and now_s >= self.end_s:
+            # raise once, so the firmware's finally blocks can still shut down the way they would on ctrl-C
+            self.end_s = None
+            raise Simulation_Complete()
+        return now_s
+    def monotonic_ns(self):
+        return int( self.monotonic() * 1000000000 )
+    def sleep( self, seconds ):
+        self.advance( seconds, "sleep" )
+    def report(self):
+        print( "virtual time charged by account:" )
+        for account in sorted( self.charges, key = lambda name: -self.charges[name] ):
+            print( "    {:<28} {:10.3f} s".format( account, self.charges[account] ))
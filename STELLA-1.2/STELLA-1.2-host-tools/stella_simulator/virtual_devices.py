@@ -0,0 +1,357 @@
+# scripted virtual devices for the simulator
+# Each device keeps its own state and charges the virtual clock for the bus traffic a real read would cost.
+# The stand-in driver modules in fakes/ are thin wrappers that forward to these objects.
+
+import calendar
+import math
+import random
+import struct
+import threading
+import time as host_time
+
+from stella_simulator import cost_model
+
+class Virtual_Light_Field:
+    # sunlight with drifting cloud cover, deterministic for a given seed
+    def __init__( self, peak_irradiance_uW_per_cm2_nm = 180.0, cloud_depth = 0.6, cloud_period_s = 90.0, seed = 1 ):
+        self.peak_irradiance_uW_per_cm2_nm = peak_irradiance_uW_per_cm2_nm
+        self.cloud_depth = cloud_depth
+        self.cloud_period_s = cloud_period_s
+        generator = random.Random( seed )
+        self.cloud_phases = [ generator.uniform( 0, 2 * math.pi ) for index in range( 0, 3 ) ]
+        self.scale = 1.0
+    def sky_factor( self, time_s ):
+        cloud = 0.0
+        for harmonic, phase in enumerate( self.cloud_phases, start = 1 ):
+            cloud += math.sin( 2 * math.pi * harmonic * time_s / self.cloud_period_s + phase ) / harmonic
+        cloud = min( 1.0, max( 0.0, 0.5 + cloud / 3.0 ))
+        return self.scale * ( 1.0 - self.cloud_depth * cloud )
+    def irradiance( self, wavelength_nm, time_s ):
+        # planck curve at the solar surface temperature, normalized to the peak, with ozone cut-off in the uv
+        h_c_over_k_nm_K = 1.4387769e7
+        temperature_K = 5778.0
+        peak_nm = 501.5
+        def planck( wl_nm ):
+            return 1.0 / ( wl_nm**5 * ( math.exp( h_c_over_k_nm_K / ( wl_nm * temperature_K )) - 1.0 ))
+        relative = planck( wavelength_nm ) / planck( peak_nm )
+        if wavelength_nm < 320:
+            relative *= math.exp( -( 320 - wavelength_nm ) / 12.0 )
+        return self.peak_irradiance_uW_per_cm2_nm * relative * self.sky_factor( time_s )
+
+class Virtual_Device:
+    answers_scan = True
+    def __init__( self, simulator, name, address ):
+        self.simulator = simulator
+        self.name = name
+        self.address = address
+        self.operations = 0
+    def charge( self, seconds ):
+        self.operations += 1
+        self.simulator.clock.advance( seconds, self.name )
+    def now(self):
+        return self.simulator.clock.now()
+    def noise( self, spread ):
+        return self.simulator.random.uniform( -spread, spread )
+
+class Virtual_AS7265X( Virtual_Device ):
+    # three chip 18 channel spectrometer, channel order R S T U V W, G H I J K L, A B C D E F
+    bands = 610, 680, 730, 760, 810, 860, 560, 585, 645, 705, 900, 940, 410, 435, 460, 485, 510, 535
+    gain_ratios = 1, 3.7, 16, 64
+    def __init__( self, simulator, name = "as7265x", address = 0x49 ):
+        super().__init__( simulator, name, address )
+        # power-on settings of the driver's begin(): 64x gain, 50 cycles
+        self.gain = 3
+        self.integration_cycles = 49
+        self.mode = 3
+        self.bulbs = [ False, False, False ]
+        self.indicator = True
+        self.conversion_start_s = 0.0
+        self.latched_time_s = None
+        self.latched_registers = None
+        # counts per (uW/cm^2/nm) per unit gain per ms, chosen so full sun at 16x and 166 ms lands near 30000 counts
+        self.responsivity = 30000 / ( 180.0 * 16 * 166 )
+    def register_operations( self, count ):
+        self.charge( count * cost_model.AS7265X_VIRTUAL_REGISTER_S )
+    def integration_time_ms(self):
+        return 2.8 * ( self.integration_cycles + 1 )
+    def conversion_period_s(self):
+        return cost_model.AS7265X_CONVERSION_CYCLES * self.integration_time_ms() / 1000
+    def conversion_end_s(self):
+        return self.conversion_start_s + self.conversion_period_s()
+    def set_mode( self, mode ):
+        self.register_operations( 2 )
+        self.mode = mode
+        self.conversion_start_s = self.now()
+    def data_available(self):
+        self.register_operations( 1 )
+        return self.now() >= self.conversion_end_s()
+    def sample_time_s(self):
+        if self.mode == 2:
+            # continuous: the most recent completed conversion
+            period_s = self.conversion_period_s()
+            return period_s * math.floor( self.now() / period_s )
+        return self.conversion_end_s()
+    def counts( self, index, time_s ):
+        irradiance = self.simulator.light.irradiance( self.bands[index], time_s )
+        if self.bulbs[0] or self.bulbs[1] or self.bulbs[2]:
+            irradiance += 5.0
+        value = irradiance * self.responsivity * self.gain_ratios[self.gain] * self.integration_time_ms()
+        value *= 1 + self.noise( 0.004 )
+        return int( min( 65535, max( 0, value )))
+    def values( self, calibrated ):
+        time_s = self.sample_time_s()
+        values = []
+        for index in range( 0, len( self.bands )):
+            counts = self.counts( index, time_s )
+            if calibrated:
+                values.append( counts / ( self.responsivity * self.gain_ratios[self.gain] * self.integration_time_ms() ))
+            else:
+                values.append( counts )
+        return values
+    def result_registers(self):
+        # per chip, the raw count registers 0x08-0x13 and calibrated float registers 0x14-0x2b of one conversion,
+        # latched so the bytes of a value always come from the same reading
+        time_s = self.sample_time_s()
+        if self.latched_time_s != time_s:
+            self.latched_time_s = time_s
+            scale = self.responsivity * self.gain_ratios[self.gain] * self.integration_time_ms()
+            self.latched_registers = [ bytearray( 0x2c ) for chip in range( 0, 3 ) ]
+            for index in range( 0, len( self.bands )):
+                chip, channel = divmod( index, 6 )
+                counts = self.counts( index, time_s )
+                struct.pack_into( ">H", self.latched_registers[chip], 0x08 + 2 * channel, counts )
+                struct.pack_into( ">f", self.latched_registers[chip], 0x14 + 4 * channel, counts / scale )
+        return self.latched_registers
+    def register_byte( self, chip, register ):
+        if 0 <= chip < 3 and 0x08 <= register < 0x2c:
+            return self.result_registers()[chip][register]
+        return 0
+    def temperature( self, device ):
+        return 27 + device + 0.002 * self.now() + self.noise( 0.25 )
+
+class Virtual_AS7331( Virtual_Device ):
+    bands = 360, 300, 260
+    bandwidths = 80, 40, 40
+    def __init__( self, simulator, name = "as7331", address = 0x74 ):
+        super().__init__( simulator, name, address )
+        self.gain_code = 7              # 16x
+        self.integration_code = 6       # 64 ms
+        self.measurement_mode = 1
+        self.responsivity = 20000 / ( 60.0 * 80 * 16 * 64 )
+    def gain(self):
+        return 2 ** ( 11 - self.gain_code )
+    def integration_time_ms(self):
+        return 2 ** self.integration_code
+    def measure(self):
+        # command mode: start, wait out the integration, read four 16 bit result registers
+        self.charge( self.integration_time_ms() / 1000 + cost_model.AS7331_READ_S )
+        time_s = self.now()
+        counts = []
+        for band, bandwidth in zip( self.bands, self.bandwidths ):
+            value = self.simulator.light.irradiance( band, time_s ) * bandwidth * self.responsivity * self.gain() * self.integration_time_ms()
+            value *= 1 + self.noise( 0.01 )
+            counts.append( int( min( 65535, max( 0, value ))))
+        return counts
+    def raw_values(self):
+        counts = self.measure()
+        return counts[0], counts[1], counts[2], 1400 + int( self.noise( 20 ))
+    def values(self):
+        counts = self.measure()
+        values = []
+        for band_counts in counts:
+            values.append( band_counts / ( self.responsivity * self.gain() * self.integration_time_ms() ))
+        return values[0], values[1], values[2], 28.0 + self.noise( 0.3 )
+
+class Virtual_AS7341( Virtual_Device ):
+    bands = 415, 445, 480, 515, 555, 590, 630, 680
+    def __init__( self, simulator, name = "as7341", address = 0x39 ):
+        super().__init__( simulator, name, address )
+        self.atime = 100
+        self.astep = 999
+        self.gain = 9
+        self.led = False
+        self.led_current = 4
+        self.responsivity = 20000 / ( 180.0 * 256 * 281 )
+    def integration_time_ms(self):
+        return ( self.atime + 1 ) * ( self.astep + 1 ) * 0.00278
+    def gain_ratio(self):
+        return 0.5 * 2 ** self.gain
+    def all_channels(self):
+        self.charge( 2 * self.integration_time_ms() / 1000 + 2 * cost_model.AS7341_READOUT_S )
+        full_scale = min( 65535, ( self.atime + 1 ) * ( self.astep + 1 ))
+        time_s = self.now()
+        counts = []
+        for band in self.bands:
+            value = self.simulator.light.irradiance( band, time_s ) * self.responsivity * self.gain_ratio() * self.integration_time_ms()
+            if self.led:
+                value += 200
+            value *= 1 + self.noise( 0.005 )
+            counts.append( int( min( full_scale, max( 0, value ))))
+        return tuple( counts )
+
+class Virtual_HDC302X( Virtual_Device ):
+    def __init__( self, simulator, name = "hdc302x", address = 0x44 ):
+        super().__init__( simulator, name, address )
+    def temperature(self):
+        self.charge( cost_model.HDC302X_READ_S )
+        return 24.0 + 2.0 * math.sin( self.now() / 600.0 ) + self.noise( 0.05 )
+    def relative_humidity(self):
+        self.charge( cost_model.HDC302X_READ_S )
+        return 41.0 - 3.0 * math.sin( self.now() / 600.0 ) + self.noise( 0.2 )
+
+class Virtual_MLX90614( Virtual_Device ):
+    answers_scan = False    # the real part doesn't answer the bus scan
+    def __init__( self, simulator, name = "mlx90614", address = 0x5a ):
+        super().__init__( simulator, name, address )
+    def object_temperature(self):
+        self.charge( cost_model.MLX90614_READ_S )
+        return 31.0 + 4.0 * self.simulator.light.sky_factor( self.now() ) + self.noise( 0.1 )
+    def ambient_temperature(self):
+        self.charge( cost_model.MLX90614_READ_S )
+        return 25.0 + self.noise( 0.05 )
+
+class Virtual_PCF8523( Virtual_Device ):
+    def __init__( self, simulator, name = "pcf8523", address = 0x68 ):
+        super().__init__( simulator, name, address )
+        self.epoch_at_zero_s = simulator.start_epoch_s
+        self.battery_low = False
+    def datetime(self):
+        self.charge( cost_model.PCF8523_READ_S )
+        return host_time.gmtime( int( self.epoch_at_zero_s + self.now() ))
+    def set_datetime( self, value ):
+        self.charge( cost_model.PCF8523_READ_S )
+        self.epoch_at_zero_s = calendar_timegm( value ) - self.now()
+
+class Virtual_MAX17048( Virtual_Device ):
+    def __init__( self, simulator, name = "max17048", address = 0x36 ):
+        super().__init__( simulator, name, address )
+        self.start_percent = simulator.scenario.get( "battery_percent", 92.0 )
+        self.drain_percent_per_hour = simulator.scenario.get( "battery_drain_percent_per_hour", 2.5 )
+    def cell_percent(self):
+        self.charge( cost_model.MAX17048_READ_S )
+        return max( 0.0, self.start_percent - self.drain_percent_per_hour * self.now() / 3600 )
+    def cell_voltage(self):
+        self.charge( cost_model.MAX17048_READ_S )
+        return 3.3 + 0.009 * max( 0.0, self.start_percent - self.drain_percent_per_hour * self.now() / 3600 )
+
+class Virtual_FocalTouch( Virtual_Device ):
+    def __init__( self, simulator, name = "focaltouch", address = 0x38 ):
+        super().__init__( simulator, name, address )
+    def touched(self):
+        self.charge( cost_model.FOCALTOUCH_TOUCHED_S )
+        return self.simulator.inputs.touch_at( self.now() ) is not None
+    def touches(self):
+        self.charge( cost_model.FOCALTOUCH_TOUCHES_S )
+        touch = self.simulator.inputs.touch_at( self.now() )
+        if touch is None:
+            return []
+        # the panel is mounted rotated, the firmware transforms tx = 320 - y, ty = x
+        return [ { "x": touch[1], "y": 320 - touch[0], "id": 0 } ]
+
+class Virtual_Qwiic_Buzzer( Virtual_Device ):
+    def __init__( self, simulator, name = "qwiic_buzzer", address = 0x34 ):
+        super().__init__( simulator, name, address )
+        self.beeps = 0
+    def command(self):
+        self.charge( cost_model.BUZZER_COMMAND_S )
+
+class Virtual_PA1616D_GPS( Virtual_Device ):
+    answers_scan = False    # lives on the uart
+    def __init__( self, simulator, name = "pa1616d", address = None ):
+        super().__init__( simulator, name, address )
+        self.fix_after_s = simulator.scenario.get( "gps_fix_after_s", 35.0 )
+        self.latitude = simulator.scenario.get( "latitude", 38.9957 )
+        self.longitude = simulator.scenario.get( "longitude", -76.8521 )
+        self.altitude_m = simulator.scenario.get( "altitude_m", 48.0 )
+    def update(self):
+        # one nmea sentence a second at 9600 baud, the parse costs whether or not a sentence is waiting
+        self.charge( cost_model.GPS_UPDATE_S )
+        return True
+    def read_bytes( self, count ):
+        self.charge( count * cost_model.GPS_BYTE_S )
+        return b"$PMTK705,AXN_5.1.7_3333_19020118,0027,PA1616D,1.0*6E\r\n"[:count]
+    def has_fix(self):
+        return self.now() >= self.fix_after_s
+    def timestamp_utc(self):
+        if not self.has_fix():
+            return None
+        return host_time.gmtime( int( self.simulator.start_epoch_s + self.now() ))
+
+class Virtual_USB_Host( Virtual_Device ):
+    # the computer on the usb_cdc data channel: it has the port open during the scenario's usb_host "open" windows
+    # and empties the instrument's usb transmit buffer at read_bytes_per_s, keeping what it reads in received.
+    # A host tool running in another thread can also open the port and talk to the firmware, see Simulated_Port
+    answers_scan = False
+    def __init__( self, simulator, name = "usb_host", address = None ):
+        super().__init__( simulator, name, address )
+        settings = simulator.scenario.get( "usb_host", {} )
+        self.open_windows = settings.get( "open", [] )     # ( from_s, until_s ) pairs, until_s None for the rest of the run
+        self.read_bytes_per_s = settings.get( "read_bytes_per_s", 400000 )
+        self.tx_buffer_bytes = settings.get( "tx_buffer_bytes", 1024 )
+        self.tx_waiting = 0.0
+        self.last_drain_s = 0.0
+        self.received = bytearray()
+        self.incoming = bytearray()     # bytes the computer sent, not read by the firmware yet
+        self.port_open = False
+        self.lock = threading.Lock()
+    def is_open(self):
+        if self.port_open:
+            return True
+        now_s = self.now()
+        for from_s, until_s in self.open_windows:
+            if from_s <= now_s and ( until_s is None or now_s < until_s ):
+                return True
+        return False
+    def drain(self):
+        with self.lock:
+            now_s = self.now()
+            self.tx_waiting = max( 0.0, self.tx_waiting - ( now_s - self.last_drain_s ) * self.read_bytes_per_s )
+            self.last_drain_s = now_s
+    def write( self, data ):
+        # the bytes the transmit buffer takes now, none while the port is closed
+        self.charge( cost_model.USB_WRITE_CALL_S + len( data ) * cost_model.USB_BYTE_S )
+        self.drain()
+        if not self.is_open():
+            self.tx_waiting = 0.0
+            return 0
+        with self.lock:
+            count = min( len( data ), int( self.tx_buffer_bytes - self.tx_waiting ))
+            self.received += bytes( data[:count] )
+            self.tx_waiting += count
+        return count
+    def delivered_bytes(self):
+        # how much of received has left the transmit buffer, what the computer can have read by now
+        self.drain()
+        with self.lock:
+            return len( self.received ) - int( math.ceil( self.tx_waiting ))
+    def host_write( self, data ):
+        with self.lock:
+            self.incoming += data
+    def in_waiting(self):
+        with self.lock:
+            return len( self.incoming )
+    def read( self, size ):
+        # the firmware reading what the computer sent
+        self.charge( cost_model.USB_WRITE_CALL_S + size * cost_model.USB_BYTE_S )
+        with self.lock:
+            data = bytes( self.incoming[:size] )
+            del self.incoming[:size]
+        return data
+    def wait_for_room(self):
+        self.simulator.clock.advance( cost_model.USB_WAIT_S, "usb wait" )
+
+def calendar_timegm( struct ):
+    return calendar.timegm( tuple( struct )[:6] + ( 0, 0, 0 ))
+
+virtual_device_classes = {
+    "as7265x": Virtual_AS7265X,
+    "as7331": Virtual_AS7331,
+    "as7341": Virtual_AS7341,
+    "hdc302x": Virtual_HDC302X,
+    "mlx90614": Virtual_MLX90614,
+    "pcf8523": Virtual_PCF8523,
+    "max17048": Virtual_MAX17048,
+    "focaltouch": Virtual_FocalTouch,
+    "qwiic_buzzer": Virtual_Qwiic_Buzzer,
+    "pa1616d": Virtual_PA1616D_GPS,
+}
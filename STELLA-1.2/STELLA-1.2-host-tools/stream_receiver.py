@@ -0,0 +1,175 @@
+# receive the STELLA-1.2 usb data stream and write the samples as the instrument's csv rows, as they arrive
+# usage: python stream_receiver.py --port /dev/ttyACM1 [--csv stream.csv] [--arrow stream.arrow]
+#        python stream_receiver.py --file usb_capture.bin       # bytes saved by simulate.py --usb-capture
+# The instrument shows two serial ports when boot.py has turned on the data channel, the stream is on the second one
+# (COMn on Windows, /dev/cu.usbmodem...3 on macOS). Set usb_serial_out_enabled = True in presets.py.
+# Reading a port needs pyserial, Arrow output needs pyarrow: pip install pyserial pyarrow
+# NASA open source software license
+# Paul Mirel 2025
+
+import argparse
+import binascii
+import json
+import os
+import struct
+import sys
+
+sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ )))
+
+from expand_binary_log import Expander
+
+FRAME_SYNC = b"\xa5\x5a"
+FRAME_PREFIX = struct.Struct( "<cHH" )     # tag, sequence number, payload length
+FRAME_CRC = struct.Struct( "<I" )
+
+class Frame_Reader:
+    # finds frames in the bytes as they come, a frame with a bad crc is skipped by searching for the next sync
+    def __init__( self ):
+        self.buffer = bytearray()
+        self.last_sequence = None
+        self.crc_errors = 0
+        self.frames_missed = 0
+    def feed( self, data ):
+        self.buffer += data
+        frames = []
+        while True:
+            start = self.buffer.find( FRAME_SYNC )
+            if start < 0:
+                del self.buffer[ :max( 0, len( self.buffer ) - 1 )]
+                return frames
+            del self.buffer[:start]
+            if len( self.buffer ) < len( FRAME_SYNC ) + FRAME_PREFIX.size:
+                return frames
+            tag, sequence, length = FRAME_PREFIX.unpack_from( self.buffer, len( FRAME_SYNC ))
+            end = len( FRAME_SYNC ) + FRAME_PREFIX.size + length
+            if len( self.buffer ) < end + FRAME_CRC.size:
+                return frames
+            crc, = FRAME_CRC.unpack_from( self.buffer, end )
+            if binascii.crc32( self.buffer[ len( FRAME_SYNC ):end ]) != crc:
+                self.crc_errors += 1
+                del self.buffer[ :len( FRAME_SYNC )]
+                continue
+            if self.last_sequence is not None:
+                # the instrument numbers every frame it makes, including the ones it drops when the computer falls behind
+                self.frames_missed += ( sequence - self.last_sequence - 1 ) & 0xffff
+            self.last_sequence = sequence
+            frames.append(( tag, bytes( self.buffer[ len( FRAME_SYNC ) + FRAME_PREFIX.size:end ])))
+            del self.buffer[ :end + FRAME_CRC.size ]
+
+class Arrow_Writer:
+    # an Arrow ipc stream of the csv rows, every column as text the way the csv holds it; a new sensor layout starts a new file
+    def __init__( self, path ):
+        import pyarrow
+        self.pyarrow = pyarrow
+        self.path = path
+        self.part = 0
+        self.writer = None
+        self.columns = None
+    def start( self, csv_header ):
+        columns = [ name.strip() for name in csv_header.strip().split( "," )]
+        if columns == self.columns:
+            # the header is sent again after the port is reopened
+            return
+        self.close()
+        self.columns = columns
+        path = self.path
+        if self.part:
+            root, extension = os.path.splitext( self.path )
+            path = "{}-{}{}".format( root, self.part, extension )
+        self.part += 1
+        schema = self.pyarrow.schema([( name, self.pyarrow.string() ) for name in self.columns ])
+        self.writer = self.pyarrow.ipc.new_stream( path, schema )
+    def write( self, lines ):
+        if self.writer is None:
+            return
+        rows = [[ field.strip() for field in line.split( "," )] for line in lines ]
+        arrays = []
+        for index in range( 0, len( self.columns )):
+            arrays.append( self.pyarrow.array([ row[index] if index < len( row ) else None for row in rows ], type = self.pyarrow.string() ))
+        self.writer.write_batch( self.pyarrow.record_batch( arrays, names = self.columns ))
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+class Stream_Decoder:
+    # turns frames into csv rows: an H frame describes the rows, S sets the session tag, R and U are samples and statistics
+    def __init__( self, csv_file, arrow_writer = None ):
+        self.csv_file = csv_file
+        self.arrow_writer = arrow_writer
+        self.expander = None
+        self.samples = 0
+    def frame( self, tag, payload ):
+        if tag == b"H":
+            self.expander = Expander( json.loads( payload.decode() ))
+            self.csv_file.write( self.expander.description["csv_header"] )
+            if self.arrow_writer:
+                self.arrow_writer.start( self.expander.description["csv_header"] )
+        elif self.expander is None:
+            # joined part way through, the rows can't be read until the next header
+            return
+        elif tag == b"S":
+            self.expander.session_tag = payload.decode()
+        elif tag in ( b"R", b"U" ):
+            if tag == b"R":
+                lines = self.expander.expand_record( payload )
+                self.samples += 1
+            else:
+                lines = self.expander.expand_statistic( payload )
+            for line in lines:
+                self.csv_file.write( line )
+                self.csv_file.write( "\n" )
+            if self.arrow_writer:
+                self.arrow_writer.write( lines )
+        self.csv_file.flush()
+
+def open_port( port_name ):
+    try:
+        import serial
+    except ImportError:
+        print( "reading a serial port needs pyserial: pip install pyserial" )
+        sys.exit( 1 )
+    return serial.Serial( port_name, timeout = 0.5 )
+
+def main():
+    parser = argparse.ArgumentParser( description = "decode the STELLA-1.2 usb data stream into csv rows" )
+    source = parser.add_mutually_exclusive_group( required = True )
+    source.add_argument( "--port", help = "the instrument's data serial port" )
+    source.add_argument( "--file", help = "bytes captured from the data channel" )
+    parser.add_argument( "--csv", default = None, help = "csv file to write, standard output if not given" )
+    parser.add_argument( "--arrow", default = None, help = "also write an Arrow ipc stream file, needs pyarrow" )
+    args = parser.parse_args()
+    csv_file = sys.stdout
+    if args.csv:
+        csv_file = open( args.csv, "w", newline = "" )
+    arrow_writer = None
+    if args.arrow:
+        try:
+            arrow_writer = Arrow_Writer( args.arrow )
+        except ImportError:
+            print( "Arrow output needs pyarrow: pip install pyarrow" )
+            sys.exit( 1 )
+    reader = Frame_Reader()
+    decoder = Stream_Decoder( csv_file, arrow_writer )
+    try:
+        if args.file:
+            with open( args.file, "rb" ) as capture_file:
+                for tag, payload in reader.feed( capture_file.read() ):
+                    decoder.frame( tag, payload )
+        else:
+            port = open_port( args.port )
+            while True:
+                data = port.read( max( 1, port.in_waiting ))
+                for tag, payload in reader.feed( data ):
+                    decoder.frame( tag, payload )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if arrow_writer:
+            arrow_writer.close()
+        if args.csv:
+            csv_file.close()
+        print( "{} samples, {} frames missed, {} crc errors".format( decoder.samples, reader.frames_missed, reader.crc_errors ), file = sys.stderr )
+
+if __name__ == "__main__":
+    main()